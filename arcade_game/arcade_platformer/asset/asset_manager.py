@@ -0,0 +1,169 @@
+from collections import OrderedDict
+from pathlib import Path
+from threading import RLock
+from typing import Dict, Tuple, Union
+
+import arcade
+
+from arcade_game.arcade_platformer.asset.processed_images import resolve_image
+from arcade_game.arcade_platformer.config.config import ASSET_MEMORY_BUDGET
+from log.config_log import logger
+
+Asset = Union[arcade.Texture, arcade.Sound]
+
+
+class AssetEntry:
+    """A loaded asset, with the number of users holding it"""
+    __slots__ = ("asset", "size", "references")
+
+    def __init__(self, asset: Asset, size: int) -> None:
+        self.asset = asset
+        # Approximate number of bytes in memory
+        self.size = size
+        self.references = 0
+
+
+class AssetManager:
+    """
+    Loads the textures and the sounds once, and shares them between the views, the player and the enemies
+
+    Assets are keyed by path and load options. Each load takes a reference on the asset, given back with
+    release() when the user is done with it, usually when a view is hidden. An asset nobody holds stays in
+    memory, so showing a view again doesn't read the disk, until the assets in memory go over the budget:
+    the least recently used unreferenced assets are dropped first. Assets in use are never dropped.
+    """
+    def __init__(self, memory_budget: int = ASSET_MEMORY_BUDGET) -> None:
+        """
+        Arguments:
+            memory_budget -- Bytes of assets kept in memory, beyond what is in use
+        """
+        self.memory_budget = memory_budget
+        # Least recently used first
+        self._entries: "OrderedDict[Tuple, AssetEntry]" = OrderedDict()
+        # Finds the key of an asset to release it
+        self._keys: Dict[int, Tuple] = {}
+        # Textures are loaded by the level prefetcher thread too
+        self._lock = RLock()
+
+        # Some stats to check the manager is doing its job
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resident_bytes = 0
+
+    def load_texture(self, path: Union[str, Path], flipped_horizontally: bool = False,
+                     hit_box_algorithm: str = "Simple") -> arcade.Texture:
+        """Returns the texture of an image, loading it only if it isn't in memory yet.
+        The processed version of the image is loaded when there is one, see image_pipeline.py
+
+        Arguments:
+            path -- The image file, or an arcade resource like ":resources:..."
+            flipped_horizontally -- Mirror the image, for sprites facing the other way
+            hit_box_algorithm -- How arcade computes the hit box of the texture
+        """
+        path = resolve_image(path)
+        key = ("texture", str(path), flipped_horizontally, hit_box_algorithm)
+        with self._lock:
+            entry = self._get(key)
+            if entry is None:
+                texture = arcade.load_texture(path, flipped_horizontally=flipped_horizontally,
+                                              hit_box_algorithm=hit_box_algorithm)
+                entry = self._add(key, texture, texture.width * texture.height * 4)
+            entry.references += 1
+            # Only once referenced, the new asset must not be the one dropped
+            self._evict()
+            return entry.asset
+
+    def load_sound(self, path: Union[str, Path], streaming: bool = False) -> arcade.Sound:
+        """Returns a sound, loading it only if it isn't in memory yet
+
+        Arguments:
+            path -- The sound file
+            streaming -- Read the sound from the disk while it plays, rather than decoding it all at once
+        """
+        key = ("sound", str(path), streaming)
+        with self._lock:
+            entry = self._get(key)
+            if entry is None:
+                sound = arcade.load_sound(path, streaming)
+                # A streamed sound only keeps a small buffer in memory
+                entry = self._add(key, sound, len(getattr(sound.source, "_data", b"")))
+            entry.references += 1
+            # Only once referenced, the new asset must not be the one dropped
+            self._evict()
+            return entry.asset
+
+    def release(self, *assets: Asset) -> None:
+        """Gives back the references taken when loading the assets, they may then be dropped from memory"""
+        with self._lock:
+            for asset in assets:
+                key = self._keys.get(id(asset))
+                if key is None:
+                    # A streamed music, see music.py, is opened without the manager
+                    logger.debug(f"{asset!r} wasn't loaded by the asset manager, nothing to release")
+                    continue
+                entry = self._entries[key]
+                if entry.references > 0:
+                    entry.references -= 1
+            self._evict()
+
+    def _get(self, key: Tuple) -> AssetEntry:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            # Mark the asset as the most recently used
+            self._entries.move_to_end(key)
+        return entry
+
+    def _add(self, key: Tuple, asset: Asset, size: int) -> AssetEntry:
+        entry = AssetEntry(asset, size)
+        self._entries[key] = entry
+        self._keys[id(asset)] = key
+        self.resident_bytes += size
+        return entry
+
+    def _evict(self) -> None:
+        """Drops the least recently used assets nobody holds, until the assets fit in the budget"""
+        if self.resident_bytes <= self.memory_budget:
+            return
+        for key in [key for key, entry in self._entries.items() if entry.references == 0]:
+            if self.resident_bytes <= self.memory_budget:
+                break
+            entry = self._entries.pop(key)
+            del self._keys[id(entry.asset)]
+            self.resident_bytes -= entry.size
+            self.evictions += 1
+            if key[0] == "texture":
+                self._forget_texture(entry.asset, key[1])
+            logger.info(f"Asset memory over the budget, dropping {key[1]}")
+
+    def _forget_texture(self, texture: arcade.Texture, path: str) -> None:
+        """Removes a texture from the arcade cache too, or it stays in memory"""
+        texture_cache = arcade.load_texture.texture_cache
+        texture_cache.pop(texture.name, None)
+        # The image file is cached once for all its textures
+        if not any(key[0] == "texture" and key[1] == path for key in self._entries):
+            texture_cache.pop(path, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "resident_assets": len(self._entries),
+                "referenced_assets": sum(1 for entry in self._entries.values() if entry.references > 0),
+                "resident_bytes": self.resident_bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self.resident_bytes = 0
+
+
+# Shared by every view, so going from the menus to the game and back doesn't read the disk again
+asset_manager = AssetManager()
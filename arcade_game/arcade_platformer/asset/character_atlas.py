@@ -0,0 +1,65 @@
+from pathlib import Path
+from threading import Lock
+from typing import List, NamedTuple, Optional, Sequence
+
+import arcade
+
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
+from arcade_game.arcade_platformer.config.config import CHARACTER_ATLAS_SIZE
+
+
+class CharacterTextures(NamedTuple):
+    """The animation frames of one kind of character, shared by all the characters of that kind"""
+    walk_left: List[arcade.Texture]
+    walk_right: List[arcade.Texture]
+    stand_left: List[arcade.Texture]
+    stand_right: List[arcade.Texture]
+    # Used for going both up and down, empty for the characters that don't climb
+    climb: List[arcade.Texture]
+
+
+class CharacterAtlas:
+    """
+    Packs the animation frames of the player and the enemies into one GPU texture
+
+    Each kind of character loads its frames once, when first needed, and holds them for as long as the game
+    runs. Loading doesn't touch OpenGL, so it can run on the level prefetcher thread: the frames wait until
+    the main thread calls get_atlas(), which sends them all to the atlas at once, rather than one by one
+    when a sprite first shows them during the game.
+    """
+    def __init__(self, size: int = CHARACTER_ATLAS_SIZE) -> None:
+        """
+        Arguments:
+            size -- Width and height of the atlas in pixels, it grows when the frames don't fit
+        """
+        self.size = size
+        self._atlas: Optional[arcade.TextureAtlas] = None
+        # Frames loaded but not in the atlas yet
+        self._pending: List[arcade.Texture] = []
+        self._lock = Lock()
+
+    def load_frames(self, paths: Sequence[Path], flipped_horizontally: bool = False) -> List[arcade.Texture]:
+        """Loads animation frames, and queues them for the atlas
+
+        Arguments:
+            paths -- The images of the frames
+            flipped_horizontally -- Mirror the images, for characters facing the other way
+        """
+        frames = [asset_manager.load_texture(path, flipped_horizontally=flipped_horizontally) for path in paths]
+        with self._lock:
+            self._pending.extend(frames)
+        return frames
+
+    def get_atlas(self) -> arcade.TextureAtlas:
+        """Returns the atlas with all the frames loaded so far, this must run on the main thread"""
+        if self._atlas is None:
+            self._atlas = arcade.TextureAtlas((self.size, self.size))
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for texture in pending:
+            self._atlas.add(texture)
+        return self._atlas
+
+
+# Shared by every character, so they all draw from the same GPU texture
+character_atlas = CharacterAtlas()
@@ -0,0 +1,162 @@
+"""
+Processes the images of the game into smaller files, read instead of the originals by the asset manager
+
+Run it from the root of the repository whenever an image changes:
+    $ python -m arcade_game.arcade_platformer.asset.image_pipeline
+- The full screen images, at the top of the images folder, are shrunk to the size of the screen.
+  Fully opaque images lose their alpha channel.
+- The other images, sprites drawn at their own size, are only compressed better, their pixels don't change.
+Each processed file is named by the hash of its source and of the processing, an image already processed
+the same way is not processed again. A report lists the bytes saved by image.
+"""
+import argparse
+import hashlib
+import io
+import json
+from pathlib import Path
+from timeit import default_timer
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from PIL import Image
+
+from arcade_game.arcade_platformer.asset.processed_images import MANIFEST_NAME, ProcessedImage, get_source_key, \
+    write_manifest
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH, PROCESSED_IMAGES_PATH, SCREEN_HEIGHT, \
+    SCREEN_WIDTH
+
+IMAGES_PATH = ASSETS_PATH / "images"
+# Changed whenever the processing changes, so every image is processed again
+PIPELINE_VERSION = 1
+
+
+class ImageReport(NamedTuple):
+    source: str
+    source_bytes: int
+    processed_bytes: int
+    # Bytes of the texture once decoded, arcade always uses 4 bytes per pixel
+    source_texture_bytes: int
+    processed_texture_bytes: int
+    # Already processed the same way by a previous run
+    cached: bool
+
+
+def get_target_size(path: Path, image: Image.Image) -> Optional[Tuple[int, int]]:
+    """The size an image is shown at, None to keep its size"""
+    if path.parent == IMAGES_PATH and (image.width > SCREEN_WIDTH or image.height > SCREEN_HEIGHT):
+        # Full screen images are stretched over the whole screen
+        return SCREEN_WIDTH, SCREEN_HEIGHT
+    return None
+
+
+def get_cache_name(source: bytes, target_size: Optional[Tuple[int, int]]) -> str:
+    """The processed file name, from the content of the source and the way it is processed"""
+    digest = hashlib.sha256(source)
+    digest.update(json.dumps([PIPELINE_VERSION, target_size]).encode())
+    return digest.hexdigest()[:24] + ".png"
+
+
+def process_image(image: Image.Image, target_size: Optional[Tuple[int, int]]) -> bytes:
+    """Resizes and compresses an image
+
+    Returns:
+        The processed image, as a PNG file
+    """
+    if target_size is not None:
+        image = image.convert("RGBA").resize(target_size, Image.LANCZOS)
+        # An opaque image doesn't need its alpha channel, the file is a quarter smaller
+        if image.getextrema()[3] == (255, 255):
+            image = image.convert("RGB")
+
+    output = io.BytesIO()
+    image.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+def build_image(path: Path, manifest: Dict[str, ProcessedImage]) -> ImageReport:
+    """Processes an image, unless it was already processed the same way, and adds it to the manifest"""
+    source = path.read_bytes()
+    with Image.open(io.BytesIO(source)) as image:
+        image.load()
+        target_size = get_target_size(path, image)
+        cache_path = PROCESSED_IMAGES_PATH / get_cache_name(source, target_size)
+
+        cached = cache_path.exists()
+        if not cached:
+            processed = process_image(image, target_size)
+            # Better compression isn't always possible, the original is kept then
+            cache_path.write_bytes(processed if len(processed) < len(source) or target_size else source)
+        source_texture_bytes = image.width * image.height * 4
+        processed_width, processed_height = target_size or image.size
+
+    stat = path.stat()
+    manifest[get_source_key(path)] = ProcessedImage(cache_path.name, stat.st_size, stat.st_mtime_ns)
+    return ImageReport(get_source_key(path), len(source), cache_path.stat().st_size, source_texture_bytes,
+                       processed_width * processed_height * 4, cached)
+
+
+def remove_unused_files(manifest: Dict[str, ProcessedImage]) -> int:
+    """Removes the processed files of the images which changed or disappeared
+
+    Returns:
+        The number of files removed
+    """
+    used = {image.file for image in manifest.values()} | {MANIFEST_NAME}
+    unused = [path for path in PROCESSED_IMAGES_PATH.iterdir() if path.name not in used]
+    for path in unused:
+        path.unlink()
+    return len(unused)
+
+
+def measure_decode(path: Path) -> float:
+    """Seconds to decode an image"""
+    start = default_timer()
+    with Image.open(path) as image:
+        image.load()
+    return default_timer() - start
+
+
+def print_report(reports: List[ImageReport], decode_times: Dict[str, Tuple[float, float]]) -> None:
+    print(f"{'image':<40} {'file':>10} {'processed':>10} {'saved':>10} {'texture':>10} {'processed':>10}")
+    for report in sorted(reports, key=lambda report: report.source_bytes - report.processed_bytes, reverse=True):
+        print(f"{report.source:<40} {report.source_bytes / 1024:>7.0f} kB {report.processed_bytes / 1024:>7.0f} kB "
+              f"{(report.source_bytes - report.processed_bytes) / 1024:>7.0f} kB "
+              f"{report.source_texture_bytes / 1024:>7.0f} kB {report.processed_texture_bytes / 1024:>7.0f} kB"
+              f"{'' if report.cached else '  (processed)'}")
+
+    source_bytes = sum(report.source_bytes for report in reports)
+    processed_bytes = sum(report.processed_bytes for report in reports)
+    source_texture_bytes = sum(report.source_texture_bytes for report in reports)
+    processed_texture_bytes = sum(report.processed_texture_bytes for report in reports)
+    print(f"{'total':<40} {source_bytes / 1024:>7.0f} kB {processed_bytes / 1024:>7.0f} kB "
+          f"{(source_bytes - processed_bytes) / 1024:>7.0f} kB "
+          f"{source_texture_bytes / 1024:>7.0f} kB {processed_texture_bytes / 1024:>7.0f} kB")
+
+    if decode_times:
+        print(f"\n{'decode time':<40} {'original':>10} {'processed':>10}")
+        for source, (original, processed) in decode_times.items():
+            print(f"{source:<40} {original * 1000:>7.1f} ms {processed * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Processes the images of the game")
+    parser.add_argument("--decode-times", action="store_true",
+                        help="Also measures how long the resized images take to decode, before and after")
+    arguments = parser.parse_args()
+
+    PROCESSED_IMAGES_PATH.mkdir(parents=True, exist_ok=True)
+    # Images which aren't there anymore are dropped from the manifest
+    manifest: Dict[str, ProcessedImage] = {}
+    reports = [build_image(path, manifest) for path in sorted(IMAGES_PATH.rglob("*.png"))]
+    write_manifest(manifest)
+    removed = remove_unused_files(manifest)
+
+    decode_times = {}
+    if arguments.decode_times:
+        for report in reports:
+            if report.processed_texture_bytes < report.source_texture_bytes:
+                processed_path = PROCESSED_IMAGES_PATH / manifest[report.source].file
+                decode_times[report.source] = (measure_decode(ASSETS_PATH / report.source),
+                                               measure_decode(processed_path))
+
+    print_report(reports, decode_times)
+    print(f"\n{len(reports)} images in {PROCESSED_IMAGES_PATH}, {removed} unused files removed")
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import arcade
+from pyglet.media.codecs import get_decoders
+
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
+from arcade_game.arcade_platformer.config.config import COMPRESSED_MUSIC_EXTENSIONS, STREAM_MUSIC
+
+
+def find_music_file(path: Path) -> Path:
+    """Returns a compressed version of the music when there is one and it can be decoded, else the file itself
+
+    Arguments:
+        path -- The uncompressed music file
+    """
+    for extension in COMPRESSED_MUSIC_EXTENSIONS:
+        compressed_path = path.with_suffix(extension)
+        if compressed_path.is_file() and get_decoders(str(compressed_path)):
+            return compressed_path
+    return path
+
+
+def open_music(path: Path) -> arcade.Sound:
+    """Opens a music to play, looped or not, until the view stops it
+
+    A streamed sound holds only a small decode buffer, read from the disk as the music plays. It can only
+    be played once, so each call opens the file again, it isn't kept by the asset manager.
+    The music is released like the other assets, asset_manager.release() ignores a streamed sound.
+
+    Arguments:
+        path -- The uncompressed music file
+    """
+    path = find_music_file(path)
+    if STREAM_MUSIC:
+        return arcade.load_sound(path, streaming=True)
+    return asset_manager.load_sound(path)
@@ -0,0 +1,85 @@
+"""
+Finds the processed version of an image, written by image_pipeline.py
+
+The processed images are in PROCESSED_IMAGES_PATH, named by the hash of their source and of the way they
+were processed. A manifest maps the path of each source image, relative to the assets folder, to its
+processed file. A processed image is only used while its source hasn't changed since it was processed.
+"""
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, NamedTuple, Union
+
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH, PROCESSED_IMAGES_PATH, USE_PROCESSED_IMAGES
+from log.config_log import logger
+
+MANIFEST_NAME = "manifest.json"
+# Changed whenever the manifest format changes, older manifests are ignored
+MANIFEST_VERSION = 1
+
+
+class ProcessedImage(NamedTuple):
+    # Name of the processed file, in PROCESSED_IMAGES_PATH
+    file: str
+    # Size and modification time of the source, to tell when it changes
+    source_size: int
+    source_mtime_ns: int
+
+
+def get_manifest_path() -> Path:
+    return PROCESSED_IMAGES_PATH / MANIFEST_NAME
+
+
+def read_manifest() -> Dict[str, ProcessedImage]:
+    """Reads the processed images by source path, none when there is no valid manifest"""
+    try:
+        manifest = json.loads(get_manifest_path().read_text())
+    except FileNotFoundError:
+        return {}
+    except ValueError as error:
+        logger.warning(f"The processed images manifest can't be read ({error}), using the original images")
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return {source: ProcessedImage(**image) for source, image in manifest["images"].items()}
+
+
+def write_manifest(images: Dict[str, ProcessedImage]) -> None:
+    manifest = {"version": MANIFEST_VERSION, "images": {source: image._asdict() for source, image in images.items()}}
+    get_manifest_path().write_text(json.dumps(manifest, indent=1, sort_keys=True))
+
+
+@lru_cache(maxsize=1)
+def get_processed_images() -> Dict[str, ProcessedImage]:
+    """The manifest is read once, the images are only processed again when the game isn't running"""
+    return read_manifest() if USE_PROCESSED_IMAGES else {}
+
+
+def get_source_key(path: Union[str, Path]) -> str:
+    """The key of an image in the manifest: its path relative to the assets folder"""
+    return Path(os.path.relpath(Path(path).resolve(), ASSETS_PATH)).as_posix()
+
+
+def resolve_image(path: Union[str, Path]) -> Union[str, Path]:
+    """Returns the processed version of an image when it is up-to-date, the image itself otherwise
+
+    Arguments:
+        path -- The image file, or an arcade resource like ":resources:..."
+    """
+    if str(path).startswith(":") or not get_processed_images():
+        return path
+
+    image = get_processed_images().get(get_source_key(path))
+    if image is None:
+        return path
+    processed_path = PROCESSED_IMAGES_PATH / image.file
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return path
+    if (stat.st_size, stat.st_mtime_ns) != (image.source_size, image.source_mtime_ns) \
+            or not processed_path.exists():
+        logger.warning(f"{path} changed since it was processed, using it as is")
+        return path
+    return processed_path
@@ -19,6 +19,23 @@ PLAYER_START_Y = 256
 PLAYER_MOVE_SPEED = 6
 PLAYER_JUMP_SPEED = 25
 
+# Enemy constants
+# Name of the object layer declaring the enemies of a map
+ENEMY_LAYER_NAME = "enemies"
+# Speed of the enemies whose object doesn't set one, in pixels per frame
+ENEMY_SPEED = PLAYER_MOVE_SPEED // 2
+
+# Simulation constants
+# The game logic runs at a fixed number of ticks per second, whatever the frame rate
+TICK_RATE = 60
+# The time bonus of a level is divided by the game time, in seconds, counted as at least this much.
+# Only a headless run can reach a goal in the first second, this keeps its bonus bounded.
+MIN_SCORED_GAME_TIME = 1.0
+# Most ticks simulated for one frame, after a longer hitch the game slows down rather than catching up
+MAX_TICKS_PER_UPDATE = 5
+# Draw the moving sprites between their last two positions, for a smooth display at any frame rate
+INTERPOLATE_RENDERING = True
+
 # Viewport (horizontal/vertical scroll) margins
 # How close do we have to be to scroll the viewport?
 # Note the difference between LEFT_VIEWPORT_MARGIN and RIGHT_VIEWPORT_MARGIN.
@@ -31,5 +48,87 @@ BOTTOM_VIEWPORT_MARGIN = 150
 # Number of lives the player can use to win the game
 TOTAL_LIFE_COUNT = 5
 
+# Number of levels in the game
+LEVEL_COUNT = 5
+
+# Parse the map of the next level in the background while the current level is played
+PREFETCH_NEXT_LEVEL = True
+
+# Number of parsed levels kept in memory, so losing a life does not read the map again
+LEVEL_CACHE_SIZE = 5
+
 # Assets path
 ASSETS_PATH = pathlib.Path(__file__).resolve().parent.parent.parent / "assets"
+
+# Read the levels from the binary files made by level_compiler.py when they are up-to-date
+USE_COMPILED_LEVELS = True
+COMPILED_LEVELS_PATH = ASSETS_PATH / "compiled"
+
+# Record the commands of every game, to play them again with engine/replay.py
+RECORD_REPLAYS = True
+REPLAYS_PATH = ASSETS_PATH.parent.parent / "replays"
+# Number of recorded games kept in REPLAYS_PATH, the oldest ones are deleted when a game is saved
+MAX_RECORDED_REPLAYS = 20
+
+# Time the phases of every frame from the start of a game, to find out where the frame time goes.
+# Profiling costs a little on every frame: it is off unless the game runs with --profile, F3 turns it on in a game.
+PROFILE_FRAMES = False
+# Number of frames kept by the profiler, the last 10 seconds at 60 frames per second
+PROFILER_CAPACITY = 600
+# A frame taking longer than this, in seconds, is logged with the time of each phase
+FRAME_BUDGET = 1 / 30
+# F4 exports the frames kept by the profiler to this folder, as a Chrome trace
+TRACES_PATH = ASSETS_PATH.parent.parent / "traces"
+
+# Duration of the pauses of the game, in seconds, the window keeps drawing during them
+# Between the ready and go sounds
+COUNTDOWN_DURATION = 1.0
+# After losing a life, to let the player understand they fell
+DEATH_DURATION = 1.0
+# After reaching the goal, to avoid jumping too quickly into the next level
+LEVEL_CLEAR_DURATION = 1.0
+
+# Bytes of textures and sounds kept in memory once no view uses them, so the menus and the game don't read
+# the disk again. The assets in use are always kept.
+ASSET_MEMORY_BUDGET = 128 * 1024 * 1024
+
+# Read the looped music from the disk while it plays, rather than decoding it all in memory.
+# The short sound effects are always decoded in memory, they must start without delay.
+STREAM_MUSIC = True
+# Compressed versions of the music, next to the .wav, in order of preference.
+# They are only used when pyglet can decode them, which needs FFmpeg.
+COMPRESSED_MUSIC_EXTENSIONS = (".ogg", ".mp3")
+
+# Most sound effects playing at once, a new sound beyond that cuts the oldest one of the same or a lower priority
+SFX_MAX_VOICES = 8
+
+# Sound effects decoded on a background thread while the welcome screen shows, and kept in memory,
+# so the first sound of the game doesn't lag
+RESIDENT_SOUNDS = ["ready.wav", "go.wav", "coin.wav", "jump.wav", "level_victory.wav", "death.wav"]
+
+# Width and height in pixels of the texture holding the animation frames of the player and the enemies
+CHARACTER_ATLAS_SIZE = 1024
+
+# Read the images from the smaller files made by image_pipeline.py when they are up-to-date
+USE_PROCESSED_IMAGES = True
+PROCESSED_IMAGES_PATH = ASSETS_PATH / "processed"
+
+# Only draw the parts of the level on the screen: the layers are split in columns of this width, in pixels.
+# A frame then draws a sprite list per column instead of one per layer, which only pays off on maps at least
+# CHUNKED_DRAWING_MIN_SCREENS screens wide. The shipped maps, about 6 screens wide, are drawn whole.
+CHUNKED_DRAWING = True
+CHUNKED_DRAWING_MIN_SCREENS = 100
+CHUNK_WIDTH = SCREEN_WIDTH
+
+# Draw the layers of the map that never change once per column in textures when a level is shown,
+# unless the textures would take more than the budget, in bytes. This pays off when the layers have many tiles
+# on the screen, see benchmarks/baked_layers_benchmark.py, the current maps have too few.
+BAKE_STATIC_LAYERS = False
+BAKED_LAYERS_MEMORY_BUDGET = 64 * 2 ** 20
+
+# Seconds between two updates and between two frames of the game
+FRAME_RATE = 1 / 60
+# The menu screens only change when their instructions blink or a key is pressed: they are updated and drawn
+# at these lower rates, in seconds, and drawn again at once when they change
+IDLE_UPDATE_RATE = 1 / 10
+IDLE_DRAW_RATE = 1.0
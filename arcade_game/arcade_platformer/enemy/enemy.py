@@ -1,44 +1,72 @@
+from functools import lru_cache
+
 import arcade
 
-from arcade_game.arcade_platformer.config.config import ASSETS_PATH, PLAYER_MOVE_SPEED
+from arcade_game.arcade_platformer.asset.character_atlas import CharacterTextures, character_atlas
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH, ENEMY_SPEED
+from arcade_game.arcade_platformer.enemy.enemy_spawn import EnemySpawn
+
+
+@lru_cache(maxsize=None)
+def load_enemy_textures(sprite_name: str) -> CharacterTextures:
+    """Loads the textures of a kind of enemy, once. They are held for as long as the game runs.
+    This does not touch OpenGL, so it can run on a worker thread.
+
+    Arguments:
+        sprite_name -- Name of the images in assets/images/enemies, without the extension
+    """
+    # Where are the enemy images stored?
+    texture_path = ASSETS_PATH / "images" / "enemies"
+    sprite_name_full = sprite_name + ".png"
+    sprite_name_move_full = sprite_name + "_move.png"
+    # Set up the appropriate textures
+    walking_texture_path = [
+        texture_path / sprite_name_full,
+        texture_path / sprite_name_move_full,
+    ]
+    standing_texture_path = texture_path / sprite_name_full
+
+    return CharacterTextures(
+        walk_left=character_atlas.load_frames(walking_texture_path),
+        walk_right=character_atlas.load_frames(walking_texture_path, flipped_horizontally=True),
+        stand_left=character_atlas.load_frames([standing_texture_path], flipped_horizontally=True),
+        stand_right=character_atlas.load_frames([standing_texture_path]),
+        climb=[],
+    )
+
 
 class Enemy(arcade.AnimatedWalkingSprite):
     """An enemy sprite with basic walking movement"""
 
-    def __init__(self, pos_x: int, pos_y: int, sprite_name: str) -> None:
-        super().__init__(center_x=pos_x, center_y=pos_y)
-
-        # Where are the player images stored?
-        texture_path = ASSETS_PATH / "images" / "enemies"
-        sprite_name_full = sprite_name + ".png"
-        sprite_name_move_full = sprite_name + "_move.png"
-        # Set up the appropriate textures
-        walking_texture_path = [
-            texture_path / sprite_name_full,
-            texture_path / sprite_name_move_full,
-        ]
-        standing_texture_path = texture_path / sprite_name_full
-
-        # Load them all now
-        self.walk_left_textures = [
-            arcade.load_texture(texture) for texture in walking_texture_path
-        ]
-
-        self.walk_right_textures = [
-            arcade.load_texture(texture, mirrored=True)
-            for texture in walking_texture_path
-        ]
-
-        self.stand_left_textures = [
-            arcade.load_texture(standing_texture_path, mirrored=True)
-        ]
-        self.stand_right_textures = [
-            arcade.load_texture(standing_texture_path)
-        ]
+    def __init__(self, pos_x: float, pos_y: float, sprite_name: str, speed: float = ENEMY_SPEED) -> None:
+        super().__init__()
+
+        self.sprite_name = sprite_name
+
+        # Every enemy of the same kind uses the same texture lists, they are never modified
+        textures = load_enemy_textures(sprite_name)
+        self.walk_left_textures = textures.walk_left
+        self.walk_right_textures = textures.walk_right
+        self.stand_left_textures = textures.stand_left
+        self.stand_right_textures = textures.stand_right
+
+        # Where the enemy turns around is decided by the level, see compute_patrol_bounds()
+        self.spawn(EnemySpawn(sprite_name, pos_x, pos_y, speed, patrol_distance=0))
+
+    def spawn(self, spawn: EnemySpawn) -> None:
+        """Puts the enemy at its starting point, so it can be reused for another spawn of the same kind
 
+        Arguments:
+            spawn -- Where the enemy starts and how it moves
+        """
         # Set the enemy defaults
+        self.center_x = spawn.center_x
+        self.center_y = spawn.center_y
         self.state = arcade.FACE_LEFT
-        self.change_x = -PLAYER_MOVE_SPEED // 2
+        self.change_x = -spawn.speed
+        self.change_y = 0
+        self.cur_texture_index = 0
+        self.last_texture_change_center_x = spawn.center_x
 
         # Set the initial texture
-        self.texture = self.stand_left_textures[0]
\ No newline at end of file
+        self.texture = self.stand_left_textures[0]
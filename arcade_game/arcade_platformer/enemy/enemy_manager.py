@@ -0,0 +1,158 @@
+from typing import List
+
+import arcade
+import numpy as np
+
+
+class EnemyManager:
+    """
+    Moves and animates all the enemies of a level at once, with NumPy arrays
+
+    Positions, velocities, facing and animation frames live in arrays. Where each enemy turns around
+    is computed when the level is loaded, so moving them is a comparison against those bounds.
+    The enemy sprites are only updated for the enemies that will be drawn.
+    """
+    def __init__(self, enemies: arcade.SpriteList, patrol_bounds: np.ndarray) -> None:
+        """
+        Arguments:
+            enemies -- The enemy sprites, they must not be added or removed afterwards
+            patrol_bounds -- The lowest and highest center_x of each enemy, see compute_patrol_bounds()
+        """
+        self.enemies = enemies
+        # Where the enemies turn around
+        self.patrol_min_x = np.array(patrol_bounds[:, 0], dtype=float)
+        self.patrol_max_x = np.array(patrol_bounds[:, 1], dtype=float)
+
+        self.center_x = np.array([enemy.center_x for enemy in enemies], dtype=float)
+        self.center_y = np.array([enemy.center_y for enemy in enemies], dtype=float)
+        # Positions before the last update, to draw the enemies between two updates
+        self.previous_center_x = self.center_x.copy()
+        self.change_x = np.array([enemy.change_x for enemy in enemies], dtype=float)
+        self.facing_right = np.array([enemy.state == arcade.FACE_RIGHT for enemy in enemies], dtype=bool)
+        self.texture_index = np.array([enemy.cur_texture_index for enemy in enemies], dtype=int)
+        self.last_texture_change_x = np.array([enemy.last_texture_change_center_x for enemy in enemies],
+                                              dtype=float)
+        self.texture_change_distance = np.array([enemy.texture_change_distance for enemy in enemies],
+                                                dtype=float)
+        self.frame_count = np.array([max(1, len(enemy.walk_left_textures)) for enemy in enemies], dtype=int)
+
+        # Hit box edges, relative to the center of each enemy
+        hit_boxes = [enemy.get_adjusted_hit_box() for enemy in enemies]
+        self.hit_box_left = np.array([min(x for x, _ in points) - enemy.center_x
+                                      for enemy, points in zip(enemies, hit_boxes)], dtype=float)
+        self.hit_box_right = np.array([max(x for x, _ in points) - enemy.center_x
+                                       for enemy, points in zip(enemies, hit_boxes)], dtype=float)
+        self.hit_box_bottom = np.array([min(y for _, y in points) - enemy.center_y
+                                        for enemy, points in zip(enemies, hit_boxes)], dtype=float)
+        self.hit_box_top = np.array([max(y for _, y in points) - enemy.center_y
+                                     for enemy, points in zip(enemies, hit_boxes)], dtype=float)
+
+        # Enemies whose texture changed since it was last written on their sprite
+        self.texture_changed = np.zeros(len(enemies), dtype=bool)
+        # Enemies whose sprite is up to date, all of them until the first update
+        self.visible = np.ones(len(enemies), dtype=bool)
+
+        self._saved_state: List[np.ndarray] = []
+        self.save_state()
+
+    @property
+    def _state(self) -> List[np.ndarray]:
+        """Every array changing while playing"""
+        return [self.center_x, self.center_y, self.change_x, self.facing_right, self.texture_index,
+                self.last_texture_change_x]
+
+    def save_state(self) -> None:
+        """Records the current state, restore_state() puts it back"""
+        self._saved_state = [array.copy() for array in self._state]
+
+    def restore_state(self) -> None:
+        """Puts back the recorded state in place, and updates every enemy sprite"""
+        for array, saved in zip(self._state, self._saved_state):
+            np.copyto(array, saved)
+        np.copyto(self.previous_center_x, self.center_x)
+        self.texture_changed[:] = True
+        self.write_sprites(np.ones(len(self.enemies), dtype=bool))
+
+    def update(self, view_left: float, view_right: float) -> None:
+        """Moves all the enemies by one step, and turns around the ones going past their patrol bounds
+
+        Arguments:
+            view_left, view_right -- The horizontal bounds of what is displayed
+        """
+        if not len(self.enemies):
+            return
+
+        np.copyto(self.previous_center_x, self.center_x)
+        self.center_x += self.change_x
+
+        turn_around = np.where(self.change_x > 0, self.center_x > self.patrol_max_x,
+                               self.center_x < self.patrol_min_x)
+        self.change_x[turn_around] *= -1
+        self.update_animation()
+        self.write_sprites(
+            (self.center_x + self.hit_box_right >= view_left) & (self.center_x + self.hit_box_left <= view_right)
+        )
+
+    def update_animation(self) -> None:
+        """Same logic as arcade.AnimatedWalkingSprite, for every enemy at once"""
+        facing_right = self.change_x > 0
+        change_direction = facing_right != self.facing_right
+        self.facing_right = facing_right
+
+        distance = np.abs(self.center_x - self.last_texture_change_x)
+        changed = change_direction | (distance >= self.texture_change_distance)
+
+        self.last_texture_change_x[changed] = self.center_x[changed]
+        self.texture_index[changed] = (self.texture_index[changed] + 1) % self.frame_count[changed]
+        self.texture_changed |= changed
+
+    def write_sprites(self, visible: np.ndarray) -> None:
+        """Copies the arrays on the sprites of the given enemies
+
+        Arguments:
+            visible -- Which enemies to update
+        """
+        self.visible = visible
+        for index in np.flatnonzero(visible):
+            enemy = self.enemies[index]
+            enemy.center_x = float(self.center_x[index])
+            enemy.center_y = float(self.center_y[index])
+            enemy.change_x = float(self.change_x[index])
+
+            if self.texture_changed[index]:
+                if self.facing_right[index]:
+                    enemy.state = arcade.FACE_RIGHT
+                    enemy.texture = enemy.walk_right_textures[self.texture_index[index]]
+                else:
+                    enemy.state = arcade.FACE_LEFT
+                    enemy.texture = enemy.walk_left_textures[self.texture_index[index]]
+                self.texture_changed[index] = False
+
+    def interpolate_sprites(self, alpha: float) -> None:
+        """Moves the displayed enemies between their previous and current positions, for drawing.
+        Call it again with an alpha of 1 after drawing, the collisions use the sprite positions.
+
+        Arguments:
+            alpha -- 0 for the previous positions, 1 for the current ones
+        """
+        for index in np.flatnonzero(self.visible):
+            previous_x = self.previous_center_x[index]
+            self.enemies[index].center_x = float(previous_x + (self.center_x[index] - previous_x) * alpha)
+
+    def check_for_collision(self, sprite: arcade.Sprite) -> List[arcade.Sprite]:
+        """Returns the enemies colliding with a sprite, only testing the displayed enemies near it
+
+        Arguments:
+            sprite -- The sprite to check, usually the player
+        """
+        near = (
+            self.visible
+            & (self.center_x + self.hit_box_right >= sprite.left)
+            & (self.center_x + self.hit_box_left <= sprite.right)
+            & (self.center_y + self.hit_box_top >= sprite.bottom)
+            & (self.center_y + self.hit_box_bottom <= sprite.top)
+        )
+        return [
+            self.enemies[index] for index in np.flatnonzero(near)
+            if arcade.check_for_collision(sprite, self.enemies[index])
+        ]
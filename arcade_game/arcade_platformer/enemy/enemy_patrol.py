@@ -0,0 +1,76 @@
+import math
+from typing import List
+
+import numpy as np
+
+from arcade_game.arcade_platformer.enemy.enemy import load_enemy_textures
+from arcade_game.arcade_platformer.enemy.enemy_spawn import EnemySpawn
+from arcade_game.arcade_platformer.level.tile_grid import TileGrid
+from log.config_log import logger
+
+
+def compute_patrol_bounds(spawns: List[EnemySpawn], wall_grid: TileGrid, columns: int, rows: int) -> np.ndarray:
+    """Finds where each enemy turns around, by scanning the walls left and right of its spawn point
+
+    An enemy turns around when its hit box would walk into a wall or the side of the map, when its front
+    goes past the edge of the ground it stands on, or when it goes further than its patrol distance.
+    Enemies which don't stand on the ground (flying ones) ignore the ledges.
+
+    Arguments:
+        spawns -- The enemies of the level
+        wall_grid -- The grid index of the walls
+        columns, rows -- The size of the map, in tiles
+
+    Returns:
+        A (len(spawns), 2) array with the lowest and highest center_x of each enemy
+    """
+    walls = wall_grid.get_occupancy(columns, rows)
+    cell_width = wall_grid.cell_width
+    cell_height = wall_grid.cell_height
+
+    bounds = np.empty((len(spawns), 2), dtype=float)
+    for index, spawn in enumerate(spawns):
+        # The hit box of the enemy as it spawns, relative to its center
+        hit_box = load_enemy_textures(spawn.sprite_name).stand_left[0].hit_box_points
+        left = min(x for x, _ in hit_box)
+        right = max(x for x, _ in hit_box)
+        bottom = spawn.center_y + min(y for _, y in hit_box)
+        top = spawn.center_y + max(y for _, y in hit_box)
+
+        # The rows the hit box overlaps, touching a tile doesn't count
+        first_row = max(0, math.floor(bottom / cell_height))
+        last_row = min(rows, math.ceil(top / cell_height)) - 1
+        # The row under the feet of the enemy
+        ground_row = math.ceil(bottom / cell_height) - 1
+        spawn_column = math.floor(spawn.center_x / cell_width)
+        on_ground = 0 <= ground_row < rows and 0 <= spawn_column < columns and walls[ground_row, spawn_column]
+
+        def stops(column: int) -> bool:
+            """Whether the enemy can't walk over a column"""
+            if column < 0 or column >= columns:
+                return True
+            if walls[first_row:last_row + 1, column].any():
+                return True
+            return on_ground and not walls[ground_row, column]
+
+        left_column = spawn_column - 1
+        while not stops(left_column):
+            left_column -= 1
+        right_column = spawn_column + 1
+        while not stops(right_column):
+            right_column += 1
+
+        # Turn around as soon as the hit box goes into the column stopping the enemy
+        min_x = (left_column + 1) * cell_width - left
+        max_x = right_column * cell_width - right
+        if spawn.patrol_distance:
+            min_x = max(min_x, spawn.center_x - spawn.patrol_distance)
+            max_x = min(max_x, spawn.center_x + spawn.patrol_distance)
+
+        if min_x > max_x:
+            logger.warning(f"The {spawn.sprite_name} enemy at ({spawn.center_x}, {spawn.center_y}) has no room to "
+                           f"walk, it stays where it is")
+            min_x = max_x = spawn.center_x
+        bounds[index] = min_x, max_x
+
+    return bounds
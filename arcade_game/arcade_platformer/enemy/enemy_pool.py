@@ -0,0 +1,65 @@
+from typing import Dict, Iterable, List
+
+import arcade
+
+from arcade_game.arcade_platformer.enemy.enemy import Enemy
+from arcade_game.arcade_platformer.enemy.enemy_spawn import EnemySpawn
+from log.config_log import logger
+
+
+class EnemyPool:
+    """
+    Keeps the enemies no level is using, by kind, to hand them out again
+
+    Once the pool holds enough enemies of each kind, spawning the enemies of a level
+    creates no sprite and loads no texture.
+    """
+    def __init__(self) -> None:
+        # The enemies waiting to be used, by sprite name
+        self._free: Dict[str, List[Enemy]] = {}
+        # Number of enemies created since the start, for the logs
+        self.created = 0
+
+    def acquire(self, spawn: EnemySpawn) -> Enemy:
+        """Returns an enemy placed at its spawn point, reusing a free one when there is one
+
+        Arguments:
+            spawn -- Where the enemy starts and how it moves
+        """
+        free_enemies = self._free.get(spawn.sprite_name)
+        if free_enemies:
+            enemy = free_enemies.pop()
+            enemy.spawn(spawn)
+            return enemy
+
+        self.created += 1
+        return Enemy(spawn.center_x, spawn.center_y, spawn.sprite_name, spawn.speed)
+
+    def release(self, enemy: Enemy) -> None:
+        """Gives an enemy back to the pool, removing it from its sprite lists"""
+        enemy.remove_from_sprite_lists()
+        self._free.setdefault(enemy.sprite_name, []).append(enemy)
+
+    def spawn_enemies(self, spawns: Iterable[EnemySpawn], enemies: arcade.SpriteList) -> None:
+        """Replaces the enemies of a sprite list by the ones of a level
+
+        Arguments:
+            spawns -- The enemies of the level
+            enemies -- The sprite list holding the enemies, emptied first
+        """
+        for enemy in list(enemies):
+            self.release(enemy)
+
+        created = self.created
+        for spawn in spawns:
+            enemies.append(self.acquire(spawn))
+
+        if self.created > created:
+            logger.debug(f"Enemy pool created {self.created - created} enemies ({self.created} in total)")
+
+    def get_free_count(self, sprite_name: str) -> int:
+        return len(self._free.get(sprite_name, ()))
+
+
+# The enemies are plain sprites, they can be reused by every level of the game
+enemy_pool = EnemyPool()
@@ -0,0 +1,54 @@
+from typing import List, NamedTuple
+
+import pytiled_parser
+
+from arcade_game.arcade_platformer.config.config import ENEMY_LAYER_NAME, ENEMY_SPEED, MAP_SCALING
+
+
+class EnemySpawn(NamedTuple):
+    """Where an enemy starts and how it moves, as declared in the enemies layer of a map"""
+    # Name of the images in assets/images/enemies, without the extension
+    sprite_name: str
+    center_x: float
+    center_y: float
+    # Pixels per frame, the enemy starts walking to the left
+    speed: float
+    # How far the enemy may walk from its spawn point on each side, 0 to walk until a wall
+    patrol_distance: float
+
+
+def read_enemy_spawns(tiled_map: pytiled_parser.TiledMap) -> List[EnemySpawn]:
+    """Reads the enemies of a parsed map
+
+    Each enemy is a point object of the enemies layer, placed at the center of the enemy, with properties:
+        sprite -- The enemy images (string, required)
+        speed -- Pixels per frame (float, ENEMY_SPEED when missing)
+        patrol_distance -- Pixels walked on each side of the point (float, 0 or missing for no limit)
+
+    Arguments:
+        tiled_map -- The parsed Tiled map
+
+    Returns:
+        The enemies of the map, an empty list when it has no enemies layer
+    """
+    map_height = tiled_map.map_size.height * tiled_map.tile_size.height
+
+    spawns = []
+    for layer in tiled_map.layers:
+        if not isinstance(layer, pytiled_parser.ObjectLayer) or layer.name != ENEMY_LAYER_NAME:
+            continue
+
+        for tiled_object in layer.tiled_objects:
+            properties = tiled_object.properties or {}
+            if "sprite" not in properties:
+                raise ValueError(f"Enemy object {tiled_object.id} has no sprite property")
+
+            spawns.append(EnemySpawn(
+                sprite_name=str(properties["sprite"]),
+                # Tiled counts y from the top of the map
+                center_x=tiled_object.coordinates.x * MAP_SCALING,
+                center_y=(map_height - tiled_object.coordinates.y) * MAP_SCALING,
+                speed=float(properties.get("speed", ENEMY_SPEED)),
+                patrol_distance=float(properties.get("patrol_distance", 0)),
+            ))
+    return spawns
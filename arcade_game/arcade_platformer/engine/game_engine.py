@@ -0,0 +1,351 @@
+from enum import Enum
+from timeit import default_timer
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import TOTAL_LIFE_COUNT, PLAYER_START_X, PLAYER_START_Y, GRAVITY, \
+    LEVEL_COUNT, PREFETCH_NEXT_LEVEL, SCREEN_WIDTH, TICK_RATE, MIN_SCORED_GAME_TIME
+from arcade_game.arcade_platformer.enemy.enemy_manager import EnemyManager
+from arcade_game.arcade_platformer.enemy.enemy_pool import enemy_pool
+from arcade_game.arcade_platformer.helpers.phase_timer import NoPhaseTimer
+from arcade_game.arcade_platformer.level.level_prefetcher import level_prefetcher
+from arcade_game.arcade_platformer.level.level_snapshot import LevelSnapshot
+from arcade_game.arcade_platformer.player.player import Player
+from log.config_log import logger
+
+# use_spatial_hash : If set to True, this will make moving a sprite in the SpriteList slower,
+# but it will speed up collision detection with items in the SpriteList.
+# Great for doing collision detection with static walls/platforms.
+# The physics engine checks the player against the ground and the ladders on every update.
+LAYER_OPTIONS = {
+    "background": {"use_spatial_hash": False},
+    "ground": {"use_spatial_hash": True},
+    "ladders": {"use_spatial_hash": True},
+    "coins": {"use_spatial_hash": True},
+}
+
+
+class Command(str, Enum):
+    """What the player can ask for, the voice commands use the same names"""
+    LEFT = "left"
+    RIGHT = "right"
+    UP = "up"
+    DOWN = "down"
+    JUMP = "jump"
+    # Stops walking, and climbing when on a ladder
+    STOP = "stop"
+    STOP_WALKING = "stop_walking"
+    STOP_CLIMBING = "stop_climbing"
+
+
+class GameEvent(Enum):
+    """What happened during a tick, the view plays the sounds and changes the screen accordingly"""
+    JUMP = "jump"
+    COIN = "coin"
+    DEATH = "death"
+    LEVEL_COMPLETE = "level_complete"
+    GAME_OVER = "game_over"
+    VICTORY = "victory"
+
+
+class GameState(NamedTuple):
+    """The state of the game after a tick"""
+    tick: int
+    level: int
+    life_count: int
+    level_score: int
+    score: int
+    player_x: float
+    player_y: float
+    events: Tuple[GameEvent, ...]
+    # The game is over, lost or won
+    finished: bool
+
+
+class GameEngine:
+    """
+    Runs the game logic: physics, coins, traps, enemies, goals, lives and score
+
+    It needs no window, no sound and no OpenGL context, so the same logic runs in the game view
+    and headless, as fast as the CPU allows. Each call to step() advances the game by one fixed tick.
+    """
+    def __init__(self, player: Player, level: int = 1, prefetch: bool = PREFETCH_NEXT_LEVEL,
+                 atlas: Optional[arcade.TextureAtlas] = None) -> None:
+        """
+        Arguments:
+            player -- The player, its score is the total score of the game
+            level -- The level to start from
+            prefetch -- Whether to prepare the next level in the background while a level is played
+            atlas -- The texture atlas the enemies are drawn from, the default atlas when None or headless
+        """
+        self.player = player
+        # One sprite for the player, no more is needed
+        self.player_sprite = self.player.sprite
+        self.prefetch = prefetch
+
+        # Which level are we on?
+        self.level = level
+        # The level being played, with its parsed map
+        self.current_level = None
+        # The state of the level right after its setup, restored when a life is lost
+        self.level_snapshot = None
+
+        # The enemies of the current level, the same list is refilled by the enemy pool on each level
+        self.enemies = arcade.SpriteList(atlas=atlas)
+        # Moves all the enemies at once
+        self.enemy_manager = None
+
+        # Grid indexes of the walls, traps and goals
+        self.wall_grid = None
+        self.trap_grid = None
+        self.goal_grid = None
+
+        # We need a physics engine as well
+        self.physics_engine = None
+
+        # Someplace to keep score for level and game
+        self.level_score = 0
+        # Life count init
+        self.life_count = TOTAL_LIFE_COUNT
+
+        # Number of ticks played, the game time is counted in ticks so it doesn't depend on the machine
+        self.tick = 0
+        self.finished = False
+        # The events of the current tick
+        self.events: List[GameEvent] = []
+        # Records the commands of each tick when set, see replay.py
+        self.replay = None
+        # Measures the phases of each tick, replaced by a PhaseTimer or a FrameProfiler when profiling
+        self.timer = NoPhaseTimer()
+
+    def setup(self) -> None:
+        """Sets up the game for the current level. This runs every time we load a new level"""
+
+        with self.timer.measure("level_setup"):
+            self._setup()
+
+    def _setup(self) -> None:
+        # Reset the level score
+        self.level_score = 0
+
+        # Get the current level, the map is only read from disk the first time
+        self.current_level = level_prefetcher.get(self.level, LAYER_OPTIONS)
+        # Put back the coins picked up during a previous life
+        self.current_level.reset()
+
+        # Start preparing the next level while this one is played
+        if self.prefetch:
+            level_prefetcher.prefetch(self.level + 1, LAYER_OPTIONS)
+
+        # Grid indexes of the static layers, to only check the tiles near the player and the enemies
+        self.wall_grid = self.current_level.get_tile_grid("ground")
+        self.trap_grid = self.current_level.get_tile_grid("traps")
+        self.goal_grid = self.current_level.get_tile_grid("goal")
+
+        # Move the player sprite back to the beginning, facing forward
+        self.player_sprite.center_x = PLAYER_START_X
+        self.player_sprite.center_y = PLAYER_START_Y
+        self.player_sprite.change_x = 0
+        self.player_sprite.change_y = 0
+        self.player_sprite.state = arcade.FACE_RIGHT
+
+        # Set up our enemies
+        enemy_pool.spawn_enemies(self.current_level.enemy_spawns, self.enemies)
+        self.enemy_manager = EnemyManager(self.enemies, self.current_level.get_patrol_bounds())
+
+        # Load the physics engine for this map
+        self.physics_engine = arcade.PhysicsEnginePlatformer(
+            player_sprite=self.player_sprite,
+            platforms=self.current_level.walls,
+            gravity_constant=GRAVITY,
+            ladders=self.current_level.ladders,
+        )
+        self.player.set_physics_engine(self.physics_engine)
+
+        # Record the level as it starts, so losing a life doesn't need a new setup
+        self.level_snapshot = LevelSnapshot(self.current_level, self.enemy_manager, self.player_sprite,
+                                            self.physics_engine)
+
+    def respawn(self) -> None:
+        """Sends the player back to the beginning of the level, restoring the level in place"""
+        # Reset the level score
+        self.level_score = 0
+
+        # Coins, enemies and player go back to the recorded state
+        with self.timer.measure("respawn"):
+            self.level_snapshot.restore()
+
+    def get_game_time(self) -> int:
+        """Returns the number of whole seconds played since the game was initialised, as the HUD shows it"""
+        return self.tick // TICK_RATE
+
+    def apply_command(self, command: Command) -> None:
+        """Moves the player as asked
+
+        Arguments:
+            command -- A key press or release, or a voice command
+        """
+        if command == Command.LEFT:
+            self.player.move_left()
+        elif command == Command.RIGHT:
+            self.player.move_right()
+        elif command == Command.UP:
+            self.player.move_up()
+        elif command == Command.DOWN:
+            self.player.move_down()
+        elif command == Command.JUMP:
+            if self.player.jump():
+                self.events.append(GameEvent.JUMP)
+        else:
+            if command in (Command.STOP, Command.STOP_WALKING):
+                self.player.reset_change_x()
+            if command in (Command.STOP, Command.STOP_CLIMBING) and self.physics_engine.is_on_ladder():
+                self.player.reset_change_y()
+
+    def step(self, commands: Iterable[Command] = ()) -> GameState:
+        """Advances the game by one tick
+
+        Arguments:
+            commands -- What the player asked for since the previous tick
+
+        Returns:
+            The state of the game after the tick, with what happened during it
+        """
+        self.events = []
+        if self.finished:
+            return self.get_state()
+        self.tick += 1
+
+        commands = list(commands)
+        if self.replay is not None:
+            self.replay.record(self.tick, commands)
+        for command in commands:
+            self.apply_command(command)
+
+        # Update the player animation
+        with self.timer.measure("animation"):
+            self.player_sprite.update_animation(1 / TICK_RATE)
+
+        # Update player movement based on the physics engine
+        with self.timer.measure("physics"):
+            self.physics_engine.update()
+
+        # Restrict user movement so they can't walk off-screen
+        if self.player_sprite.left < 0:
+            self.player_sprite.left = 0
+
+        with self.timer.measure("collision"):
+            player_hit = self.check_collisions()
+            # Now check if we are at the ending goal
+            with self.timer.measure("goal_collision"):
+                goals_hit = not player_hit and self.goal_grid.check_for_collision(self.player_sprite)
+
+        if player_hit:
+            self.handle_player_death()
+            return self.get_state()
+
+        if goals_hit:
+            self.calculate_score()
+            if self.level == LEVEL_COUNT:  # Game is finished : Victory !
+                self.finished = True
+                self.events.append(GameEvent.VICTORY)
+            else:
+                self.events.append(GameEvent.LEVEL_COMPLETE)
+
+                # Set up the next level and call setup again to load the new map
+                transition_start = default_timer()
+                self.level += 1
+                prefetched = level_prefetcher.is_prefetched(self.level)
+                self.setup()
+                logger.info(
+                    f"Level {self.level} transition took {(default_timer() - transition_start) * 1000:.1f} ms "
+                    f"(prefetched: {prefetched})"
+                )
+
+        # Catch a fall of the platform
+        # -300 rather than 0 is to let the player fall a bit longer, it looks better
+        elif self.player_sprite.bottom < -300:
+            self.handle_player_death()
+
+        # Are there enemies? Update them as well, only the ones that can be on screen get their sprite updated.
+        # The player is always on screen, so the screen is within a screen width of the player.
+        with self.timer.measure("enemy_step"):
+            self.enemy_manager.update(self.player_sprite.center_x - SCREEN_WIDTH,
+                                      self.player_sprite.center_x + SCREEN_WIDTH)
+
+        return self.get_state()
+
+    def check_collisions(self) -> bool:
+        """Picks up the coins the player touches, and checks the traps and the enemies
+
+        Returns:
+            Whether the player ran into a trap or an enemy
+        """
+        # Check if we've picked up a coin
+        with self.timer.measure("coin_collision"):
+            coins_hit = arcade.check_for_collision_with_list(
+                sprite=self.player_sprite, sprite_list=self.current_level.coins
+            )
+
+        for coin in coins_hit:
+            # Add the coin score to our score
+            self.level_score += int(coin.properties["point_value"])
+            self.events.append(GameEvent.COIN)
+
+            # Remove the coin
+            coin.remove_from_sprite_lists()
+
+        # Check for trap collision, only in maps with traps
+        if self.trap_grid is not None:
+            with self.timer.measure("trap_collision"):
+                if self.trap_grid.check_for_collision(self.player_sprite):
+                    return True
+
+        with self.timer.measure("enemy_collision"):
+            return bool(self.enemy_manager.check_for_collision(self.player_sprite))
+
+    def handle_player_death(self) -> None:
+        """
+            The player has fallen off the platform or walked into a trap:
+            - Decrease life counter
+            - Send it back to the beginning of the level, or end the game
+        """
+        self.events.append(GameEvent.DEATH)
+        # Decrease life count
+        self.life_count -= 1
+        # Check if the player has any life left, if not the game is over
+        if self.life_count == 0:
+            self.calculate_score()
+            self.finished = True
+            self.events.append(GameEvent.GAME_OVER)
+        else:
+            # Back to the level's beginning
+            self.respawn()
+
+    def calculate_score(self) -> int:
+        """
+        The final score is the score (gained by collecting coins)
+        plus a time bonus
+        """
+        # To the tick, not in whole seconds: finishing a few ticks sooner can raise the bonus
+        game_time = self.tick / TICK_RATE
+        # An explicit minimum, only a headless run can reach the goal before it
+        game_time = max(MIN_SCORED_GAME_TIME, game_time)
+        self.player.score += (self.level_score + round((1000 * self.level) / game_time) * (self.life_count + 1))
+        # The coins of the level are in the total now
+        self.level_score = 0
+        return self.player.score
+
+    def get_state(self) -> GameState:
+        return GameState(
+            tick=self.tick,
+            level=self.level,
+            life_count=self.life_count,
+            level_score=self.level_score,
+            score=self.player.score,
+            player_x=self.player_sprite.center_x,
+            player_y=self.player_sprite.center_y,
+            events=tuple(self.events),
+            finished=self.finished,
+        )
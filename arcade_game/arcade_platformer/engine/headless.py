@@ -0,0 +1,72 @@
+"""
+Runs the game with no window, no sound and no OpenGL context, as fast as the CPU allows
+
+The inputs come from a script: the commands to send at given ticks. Useful for regression tests,
+score validation and level tuning. Run from the root of the repository, for instance:
+    $ python -m arcade_game.arcade_platformer.engine.headless --level 2 --ticks 20000
+"""
+import argparse
+from timeit import default_timer
+from typing import Dict, List
+
+from arcade_game.arcade_platformer.config.config import TICK_RATE
+from arcade_game.arcade_platformer.engine.game_engine import Command, GameEngine, GameState
+from arcade_game.arcade_platformer.player.player import Player
+
+
+def create_engine(level: int = 1) -> GameEngine:
+    """Creates a game engine ready to play, with a new player
+
+    Arguments:
+        level -- The level to start from
+    """
+    # Prefetching only helps a real-time game, here the next level would be waited for anyway
+    engine = GameEngine(Player(), level=level, prefetch=False)
+    engine.setup()
+    return engine
+
+
+def run_script(engine: GameEngine, script: Dict[int, List[Command]], max_ticks: int) -> GameState:
+    """Plays a script of commands until the game ends or max_ticks ticks are played
+
+    Arguments:
+        engine -- The engine to play, already set up
+        script -- The commands to send before each tick, by tick number (the first tick is 1)
+        max_ticks -- Most ticks to play
+
+    Returns:
+        The state after the last tick
+    """
+    state = engine.get_state()
+    for _ in range(max_ticks):
+        state = engine.step(script.get(engine.tick + 1, ()))
+        if state.finished:
+            break
+    return state
+
+
+def create_runner_script(max_ticks: int, jump_interval: int) -> Dict[int, List[Command]]:
+    """A player running right and jumping at a regular interval"""
+    script = {tick: [Command.JUMP] for tick in range(jump_interval, max_ticks + 1, jump_interval)}
+    script[1] = [Command.RIGHT]
+    return script
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs the game without a window")
+    parser.add_argument("--level", type=int, default=1, help="The level to start from")
+    parser.add_argument("--ticks", type=int, default=10 * 60 * TICK_RATE, help="Most ticks to play")
+    parser.add_argument("--jump-interval", type=int, default=45,
+                        help="The player runs right and jumps every this many ticks")
+    arguments = parser.parse_args()
+
+    engine = create_engine(arguments.level)
+    script = create_runner_script(arguments.ticks, arguments.jump_interval)
+
+    start = default_timer()
+    state = run_script(engine, script, arguments.ticks)
+    duration = default_timer() - start
+
+    print(f"Played {state.tick} ticks ({state.tick / TICK_RATE:.0f} s of game) in {duration:.2f} s, "
+          f"{state.tick / duration:.0f} ticks per second")
+    print(f"Level {state.level}, {state.life_count} lives, score {state.score}, finished: {state.finished}")
@@ -0,0 +1,154 @@
+"""
+Records the commands of a run, to play them back in the game or headless
+
+The engine is deterministic, so the commands and the tick they were sent at are enough to play a run again.
+Binary format, little-endian:
+- header: magic, version, start level, number of ticks played
+- commands: one unsigned LEB128 varint each, (ticks since the previous command << 3) | command index.
+  Most ticks have no command, and a command rarely comes more than 15 ticks after the previous one,
+  so a command usually takes a single byte.
+
+Play a recorded run headless, as fast as possible, from the root of the repository:
+    $ python -m arcade_game.arcade_platformer.engine.replay replays/<file>.rpl
+Play it in the game window with:
+    $ python main.py --replay replays/<file>.rpl
+"""
+import argparse
+import struct
+from datetime import datetime
+from pathlib import Path
+from timeit import default_timer
+from typing import Dict, Iterable, List
+
+from arcade_game.arcade_platformer.config.config import MAX_RECORDED_REPLAYS, REPLAYS_PATH, TICK_RATE
+from arcade_game.arcade_platformer.engine.game_engine import Command
+
+MAGIC = b"PRPL"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHI")
+
+# Every command has a 3 bits index
+COMMANDS = list(Command)
+COMMAND_BITS = 3
+COMMAND_INDEXES = {command: index for index, command in enumerate(COMMANDS)}
+assert len(COMMANDS) <= 1 << COMMAND_BITS
+
+
+class Replay:
+    """
+    The commands of a run, by tick number (the first tick is 1), the same script format as run_script()
+    """
+    def __init__(self, start_level: int = 1, tick_count: int = 0,
+                 script: Dict[int, List[Command]] = None) -> None:
+        self.start_level = start_level
+        # Number of ticks played, the run may go on after the last command
+        self.tick_count = tick_count
+        self.script: Dict[int, List[Command]] = script or {}
+
+    def record(self, tick: int, commands: Iterable[Command]) -> None:
+        """Adds the commands sent before a tick
+
+        Arguments:
+            tick -- The tick played with the commands, ticks must be recorded in order
+            commands -- The commands, usually none
+        """
+        self.tick_count = tick
+        commands = list(commands)
+        if commands:
+            self.script.setdefault(tick, []).extend(commands)
+
+    def to_bytes(self) -> bytes:
+        data = bytearray(HEADER.pack(MAGIC, VERSION, self.start_level, self.tick_count))
+
+        previous_tick = 0
+        for tick in sorted(self.script):
+            for command in self.script[tick]:
+                value = ((tick - previous_tick) << COMMAND_BITS) | COMMAND_INDEXES[command]
+                previous_tick = tick
+                # Unsigned LEB128: 7 bits per byte, the high bit tells another byte follows
+                while value >= 0x80:
+                    data.append((value & 0x7F) | 0x80)
+                    value >>= 7
+                data.append(value)
+
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """
+        Raises:
+            ValueError if the data isn't a replay of the current version
+        """
+        magic, version, start_level, tick_count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a replay of version {VERSION}")
+
+        replay = cls(start_level, tick_count)
+        tick = 0
+        value = 0
+        shift = 0
+        for byte in data[HEADER.size:]:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if byte & 0x80:
+                continue
+            tick += value >> COMMAND_BITS
+            replay.script.setdefault(tick, []).append(COMMANDS[value & ((1 << COMMAND_BITS) - 1)])
+            value = 0
+            shift = 0
+
+        return replay
+
+    def save(self, path: Path = None) -> Path:
+        """Writes the replay, in the replays folder with the current date and time when no path is given.
+        Only the last MAX_RECORDED_REPLAYS games are kept in the replays folder.
+
+        Returns:
+            The path of the file
+        """
+        recorded = path is None
+        if recorded:
+            path = REPLAYS_PATH / f"run_{datetime.now():%Y%m%d_%H%M%S}.rpl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.to_bytes())
+        if recorded:
+            delete_old_replays(path.parent, MAX_RECORDED_REPLAYS)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "Replay":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+def delete_old_replays(folder: Path, kept: int) -> None:
+    """Deletes the oldest recorded games of a folder
+
+    Arguments:
+        folder -- Where the games are recorded
+        kept -- Number of recordings left, the most recent ones
+    """
+    # The names hold the date and time of the game, they sort from the oldest
+    recordings = sorted(folder.glob("run_*.rpl"))
+    for recording in recordings[:max(0, len(recordings) - kept)]:
+        recording.unlink()
+
+
+if __name__ == "__main__":
+    # Imported here, the replay format itself doesn't depend on the engine runner
+    from arcade_game.arcade_platformer.engine.headless import create_engine, run_script
+
+    parser = argparse.ArgumentParser(description="Plays a recorded run without a window, as fast as possible")
+    parser.add_argument("replay", type=Path, help="The replay file")
+    arguments = parser.parse_args()
+
+    replay = Replay.load(arguments.replay)
+    engine = create_engine(replay.start_level)
+
+    start = default_timer()
+    state = run_script(engine, replay.script, replay.tick_count)
+    duration = default_timer() - start
+
+    print(f"Played {state.tick} ticks ({state.tick / TICK_RATE:.0f} s of game) in {duration:.2f} s, "
+          f"{state.tick / duration:.0f} ticks per second")
+    print(f"Level {state.level}, {state.life_count} lives, score {state.score}, finished: {state.finished}")
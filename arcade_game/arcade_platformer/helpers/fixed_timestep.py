@@ -0,0 +1,54 @@
+from log.config_log import logger
+
+
+class FixedTimestep:
+    """
+    Turns the variable time between two frames into a whole number of fixed simulation ticks
+
+    The game logic always advances by the same duration, whatever the frame rate, so the game plays
+    the same on every machine. The time left over is kept for the next frame, and alpha tells how far
+    the display is between the last two ticks, to draw the moving sprites in between.
+    """
+    def __init__(self, tick_rate: int, max_ticks_per_update: int) -> None:
+        """
+        Arguments:
+            tick_rate -- Number of simulation ticks per second
+            max_ticks_per_update -- Most ticks to run for a single frame, after a hitch the rest is dropped
+        """
+        self.tick_duration = 1 / tick_rate
+        self.max_ticks_per_update = max_ticks_per_update
+        # Time not simulated yet, in seconds
+        self.accumulator = 0.0
+        # Number of ticks simulated since the start
+        self.tick_count = 0
+
+    def advance(self, delta_time: float) -> int:
+        """Adds the time of a frame, and returns the number of ticks to simulate for it
+
+        Arguments:
+            delta_time -- How much time since the last frame
+        """
+        self.accumulator += delta_time
+        # The small margin keeps rounding errors from dropping a tick when frames match the tick rate
+        ticks = int(self.accumulator / self.tick_duration + 1e-6)
+
+        if ticks > self.max_ticks_per_update:
+            # Catching up on a long hitch would make the next frames late too, slow down the game instead
+            logger.warning(f"Frame took {delta_time * 1000:.0f} ms, skipping {ticks - self.max_ticks_per_update} "
+                           f"simulation ticks")
+            ticks = self.max_ticks_per_update
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.tick_duration
+
+        self.tick_count += ticks
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        """How far the current time is between the last tick and the next one, from 0 to 1"""
+        return min(1.0, max(0.0, self.accumulator / self.tick_duration))
+
+    def reset(self) -> None:
+        """Forgets the time not simulated yet, after a pause or a loading"""
+        self.accumulator = 0.0
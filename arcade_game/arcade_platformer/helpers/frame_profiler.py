@@ -0,0 +1,157 @@
+import json
+from collections import defaultdict, deque
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, NamedTuple
+
+from log.config_log import logger
+
+
+class PhaseSample(NamedTuple):
+    """One run of a phase during a frame"""
+    name: str
+    # Seconds since the profiler was created
+    start: float
+    duration: float
+    # Number of phases it runs within
+    depth: int
+
+
+class Frame(NamedTuple):
+    index: int
+    # Seconds since the profiler was created
+    start: float
+    duration: float
+    phases: List[PhaseSample]
+    # Values counted during the frame, like the number of sprites drawn
+    counters: Dict[str, float]
+
+
+class _Measure:
+    """Times one run of a phase, a small class is cheaper than a generator based context manager"""
+    __slots__ = ("profiler", "phase", "start")
+
+    def __init__(self, profiler: "FrameProfiler", phase: str) -> None:
+        self.profiler = profiler
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.profiler.depth += 1
+        self.start = perf_counter()
+
+    def __exit__(self, *exception) -> None:
+        end = perf_counter()
+        profiler = self.profiler
+        profiler.depth -= 1
+        profiler.phases.append(
+            PhaseSample(self.phase, self.start - profiler.origin, end - self.start, profiler.depth)
+        )
+
+
+class FrameProfiler:
+    """
+    Times the phases of every frame, and keeps the last frames in a ring buffer
+
+    The view opens a frame with begin_frame() when it updates, and closes it with end_frame() once drawn.
+    Phases are measured in `with profiler.measure("phase"):` blocks, they may run within each other.
+    Values other than durations are recorded with count().
+    A frame over the budget is logged with all its phases. The frames kept can be shown on the screen with
+    view/profiler_overlay.py, or exported to the Chrome trace event format, to open in chrome://tracing
+    or https://ui.perfetto.dev
+    """
+    def __init__(self, capacity: int, budget: float) -> None:
+        """
+        Arguments:
+            capacity -- Number of frames kept, the oldest frames are dropped
+            budget -- Longest frame duration in seconds, longer frames are logged
+        """
+        self.frames = deque(maxlen=capacity)
+        self.budget = budget
+        # The timestamps are relative to this time
+        self.origin = perf_counter()
+        self.frame_count = 0
+        # The frame being measured
+        self.frame_start = None
+        self.phases: List[PhaseSample] = []
+        self.counters: Dict[str, float] = {}
+        self.depth = 0
+
+    def measure(self, phase: str) -> _Measure:
+        return _Measure(self, phase)
+
+    def count(self, name: str, value: float) -> None:
+        """Adds to a value counted during the frame being measured"""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def begin_frame(self) -> None:
+        """Starts a new frame, the phases measured since the previous frame are dropped"""
+        self.frame_start = perf_counter()
+        self.phases = []
+        self.counters = {}
+
+    def end_frame(self) -> None:
+        """Stores the frame being measured, and logs it when it took longer than the budget"""
+        if self.frame_start is None:
+            return
+        duration = perf_counter() - self.frame_start
+        # A phase is recorded when it ends, after the phases it runs, put them back in the order they started
+        self.phases.sort(key=lambda phase: phase.start)
+        frame = Frame(self.frame_count, self.frame_start - self.origin, duration, self.phases, self.counters)
+        self.frames.append(frame)
+        self.frame_count += 1
+        self.frame_start = None
+        self.phases = []
+        self.counters = {}
+
+        if duration > self.budget:
+            breakdown = "".join(f"\n    {'  ' * phase.depth}{phase.name}: {phase.duration * 1000:.2f} ms"
+                                for phase in frame.phases)
+            logger.warning(f"Frame {frame.index} took {duration * 1000:.1f} ms, over the budget of "
+                           f"{self.budget * 1000:.1f} ms:{breakdown}")
+
+    def get_phase_averages(self, frame_count: int) -> Dict[str, float]:
+        """The time spent in each phase per frame, over the last frames
+
+        Arguments:
+            frame_count -- Number of frames to average
+
+        Returns:
+            Seconds per frame by phase, with the whole frame as "frame"
+        """
+        frames = list(self.frames)[-frame_count:]
+        totals = defaultdict(float)
+        for frame in frames:
+            totals["frame"] += frame.duration
+            for phase in frame.phases:
+                totals[phase.name] += phase.duration
+        return {name: total / len(frames) for name, total in totals.items()}
+
+    def get_counter_averages(self, frame_count: int) -> Dict[str, float]:
+        """The average of each counter per frame, over the last frames"""
+        frames = list(self.frames)[-frame_count:]
+        totals = defaultdict(float)
+        for frame in frames:
+            for name, value in frame.counters.items():
+                totals[name] += value
+        return {name: total / len(frames) for name, total in totals.items()}
+
+    def export_chrome_trace(self, path: Path) -> Path:
+        """Writes the frames kept in the Chrome trace event format
+
+        Returns:
+            The path of the file
+        """
+        events = []
+        for frame in self.frames:
+            events.append({"name": "frame", "cat": "frame", "ph": "X", "pid": 1, "tid": 1,
+                           "ts": frame.start * 1e6, "dur": frame.duration * 1e6, "args": {"index": frame.index}})
+            events.extend({"name": phase.name, "cat": "phase", "ph": "X", "pid": 1, "tid": 1,
+                           "ts": phase.start * 1e6, "dur": phase.duration * 1e6} for phase in frame.phases)
+            if frame.counters:
+                events.append({"name": "counters", "ph": "C", "pid": 1, "tid": 1, "ts": frame.start * 1e6,
+                               "args": frame.counters})
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+        logger.info(f"{len(self.frames)} frames exported to {path}")
+        return path
@@ -0,0 +1,92 @@
+from typing import Callable, Optional
+
+import arcade
+import pyglet
+
+from arcade_game.arcade_platformer.config.config import FRAME_RATE, IDLE_DRAW_RATE, IDLE_UPDATE_RATE
+
+
+def get_redraw_windows() -> Optional[Callable[[float], None]]:
+    """The function pyglet.app.run() schedules on the clock to draw the windows, every 1/60 s
+
+    pyglet has no public way to change how often the windows are drawn once it runs, only the private
+    EventLoop._redraw_windows of pyglet 1.5 and 2.0 allows it.
+
+    Returns:
+        The function, None when this version of pyglet doesn't have it
+    """
+    return getattr(pyglet.app.event_loop, "_redraw_windows", None)
+
+
+def set_draw_rate(rate: float) -> bool:
+    """Sets how often the windows are drawn, like Window.set_update_rate() does for the updates
+
+    Arguments:
+        rate -- Seconds between two frames
+
+    Returns:
+        Whether the rate changed, otherwise the windows are still drawn at the rate pyglet chose
+    """
+    redraw_windows = get_redraw_windows()
+    if redraw_windows is None:
+        return False
+    pyglet.clock.unschedule(redraw_windows)
+    pyglet.clock.schedule_interval(redraw_windows, rate)
+    return True
+
+
+def redraw_windows_now(delta_time: float) -> None:
+    """Draws the windows once, out of the regular frames"""
+    redraw_windows = get_redraw_windows()
+    if redraw_windows is not None:
+        redraw_windows(delta_time)
+
+
+class IdleThrottle:
+    """
+    Updates and draws a screen which only changes now and then, like a menu, at a low rate
+
+    The screen is drawn again as soon as it changes: its view calls request_redraw() when the instructions
+    blink, or on a key press. The idle rates apply from start() to stop(), when the view is shown and hidden,
+    the window goes back to FRAME_RATE after that. With a pyglet that doesn't let the draw rate change,
+    only the updates slow down, and the screen is drawn at the usual rate.
+    """
+    def __init__(self, idle_update_rate: float = IDLE_UPDATE_RATE, idle_draw_rate: float = IDLE_DRAW_RATE) -> None:
+        """
+        Arguments:
+            idle_update_rate -- Seconds between two updates, the time the view takes to notice a change
+            idle_draw_rate -- Seconds between two frames when nothing changes
+        """
+        self.idle_update_rate = idle_update_rate
+        self.idle_draw_rate = idle_draw_rate
+        self.window = None
+        # Whether the windows are drawn at the idle rate, only then must a change be drawn on request
+        self.draw_rate_slowed = False
+
+    def start(self, window: arcade.Window) -> None:
+        """Slows the window down, the screen is drawn at once"""
+        self.window = window
+        # The first screen is shown before pyglet.app.run() schedules the frames, slow them down after that
+        pyglet.clock.schedule_once(self.slow_down, 0)
+        self.request_redraw()
+
+    def slow_down(self, delta_time: float) -> None:
+        self.window.set_update_rate(self.idle_update_rate)
+        self.draw_rate_slowed = set_draw_rate(self.idle_draw_rate)
+
+    def stop(self) -> None:
+        """Brings the window back to the full rate, for the next view"""
+        pyglet.clock.unschedule(self.slow_down)
+        pyglet.clock.unschedule(redraw_windows_now)
+        self.window.set_update_rate(FRAME_RATE)
+        if self.draw_rate_slowed:
+            set_draw_rate(FRAME_RATE)
+            self.draw_rate_slowed = False
+
+    def request_redraw(self) -> None:
+        """Draws the screen again as soon as possible, once however many times it is requested"""
+        # Before slow_down(), or when the draw rate can't change, the next regular frame comes soon enough
+        if not self.draw_rate_slowed:
+            return
+        pyglet.clock.unschedule(redraw_windows_now)
+        pyglet.clock.schedule_once(redraw_windows_now, 0)
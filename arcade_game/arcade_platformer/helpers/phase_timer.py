@@ -0,0 +1,72 @@
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from timeit import default_timer
+from typing import ContextManager, Dict, List
+
+import numpy as np
+
+# Percentiles reported for each phase
+PERCENTILES = (50, 95, 99)
+
+
+class PhaseTimer:
+    """
+    Measures how long the phases of the game loop take, every time they run
+
+    The code to measure runs in a `with timer.measure("phase"):` block. The game engine uses a NoPhaseTimer
+    unless told otherwise, so measuring costs nothing in the game.
+    """
+    def __init__(self) -> None:
+        # Durations in seconds, by phase name, in the order they were measured
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+
+    @contextmanager
+    def measure(self, phase: str):
+        start = default_timer()
+        try:
+            yield
+        finally:
+            self.durations[phase].append(default_timer() - start)
+
+    def add(self, phase: str, duration: float) -> None:
+        """Records a duration measured elsewhere
+
+        Arguments:
+            phase -- The name of the phase
+            duration -- How long it took, in seconds
+        """
+        self.durations[phase].append(duration)
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """The distribution of the durations of each phase, in milliseconds
+
+        Returns:
+            For each phase: count, mean, p50, p95, p99 and max
+        """
+        statistics = {}
+        for phase, durations in sorted(self.durations.items()):
+            milliseconds = np.array(durations) * 1000
+            statistics[phase] = {
+                "count": len(durations),
+                "mean": float(milliseconds.mean()),
+                **{f"p{percentile}": float(value)
+                   for percentile, value in zip(PERCENTILES, np.percentile(milliseconds, PERCENTILES))},
+                "max": float(milliseconds.max()),
+            }
+        return statistics
+
+    def clear(self) -> None:
+        self.durations.clear()
+
+
+class NoPhaseTimer:
+    """Stands for a PhaseTimer when nothing is measured"""
+    def __init__(self) -> None:
+        # A nullcontext can be entered again and again, a single one does for every phase
+        self._no_measure = nullcontext()
+
+    def measure(self, phase: str) -> ContextManager:
+        return self._no_measure
+
+    def add(self, phase: str, duration: float) -> None:
+        pass
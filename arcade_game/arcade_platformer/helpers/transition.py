@@ -0,0 +1,69 @@
+from enum import Enum
+from typing import Callable, Optional
+
+
+class TransitionState(Enum):
+    """What the game view is doing"""
+    PLAYING = "playing"
+    # Between the ready and go sounds, before the game starts
+    COUNTDOWN = "countdown"
+    # The player just lost a life
+    DYING = "dying"
+    # The player just reached the goal
+    LEVEL_CLEAR = "level_clear"
+
+
+class Transition:
+    """
+    A timed pause of the game, advanced by the frame time
+
+    The game logic waits while a transition runs, but the window keeps drawing and reading the inputs.
+    When the time is up, the game goes back to PLAYING and the end action runs.
+    """
+    def __init__(self) -> None:
+        self.state = TransitionState.PLAYING
+        self.duration = 0.0
+        # Seconds left before the end of the transition
+        self.remaining = 0.0
+        self.on_end: Optional[Callable[[], None]] = None
+
+    @property
+    def active(self) -> bool:
+        return self.state != TransitionState.PLAYING
+
+    @property
+    def progress(self) -> float:
+        """How far the transition has gone, from 0 to 1"""
+        if not self.active or self.duration <= 0:
+            return 1.0
+        return 1.0 - self.remaining / self.duration
+
+    def start(self, state: TransitionState, duration: float, on_end: Callable[[], None] = None) -> None:
+        """Pauses the game
+
+        Arguments:
+            state -- The kind of transition
+            duration -- How long it lasts, in seconds
+            on_end -- Runs when the time is up, after the game is back to PLAYING
+        """
+        self.state = state
+        self.duration = duration
+        self.remaining = duration
+        self.on_end = on_end
+
+    def update(self, delta_time: float) -> None:
+        """Advances the transition by the time of a frame, and ends it when the time is up
+
+        Arguments:
+            delta_time -- How much time since the last frame
+        """
+        if not self.active:
+            return
+        self.remaining -= delta_time
+        if self.remaining <= 0:
+            on_end = self.on_end
+            self.state = TransitionState.PLAYING
+            self.remaining = 0.0
+            self.on_end = None
+            if on_end is not None:
+                on_end()
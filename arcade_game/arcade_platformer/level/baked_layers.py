@@ -0,0 +1,173 @@
+import math
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+import arcade
+from arcade.gl import Program, geometry
+
+from arcade_game.arcade_platformer.level.chunked_layer import CullingStats
+from log.config_log import logger
+
+# Draws a column texture as a rectangle of the level, with the projection of the camera
+VERTEX_SHADER = """
+#version 330
+
+uniform Projection {
+    uniform mat4 matrix;
+} proj;
+
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 v_uv;
+
+void main() {
+    gl_Position = proj.matrix * vec4(in_vert, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+
+uniform sampler2D column_texture;
+
+in vec2 v_uv;
+out vec4 f_color;
+
+void main() {
+    f_color = texture(column_texture, v_uv);
+}
+"""
+
+# The program drawing the columns, by OpenGL context: it is compiled once, not for every level baked
+_programs: "weakref.WeakKeyDictionary[arcade.ArcadeContext, Program]" = weakref.WeakKeyDictionary()
+
+
+def get_program(ctx: arcade.ArcadeContext) -> Program:
+    """The program drawing the column textures, compiled the first time the context needs it"""
+    program = _programs.get(ctx)
+    if program is None:
+        program = _programs[ctx] = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
+    return program
+
+
+class BakedColumn:
+    """A column of the static layers, drawn once in a texture, and the rectangle it covers in the level"""
+    def __init__(self, ctx: arcade.ArcadeContext, left: int, bottom: int, width: int, height: int) -> None:
+        self.texture = ctx.texture((width, height), filter=(ctx.NEAREST, ctx.NEAREST))
+        self.framebuffer = ctx.framebuffer(color_attachments=[self.texture])
+        self.geometry = geometry.screen_rectangle(left, bottom, width, height)
+        self.projection = (left, left + width, bottom, bottom + height)
+
+    def delete(self) -> None:
+        self.framebuffer.delete()
+        self.texture.delete()
+
+
+class BakedLayers:
+    """
+    The layers of the map that never change, like the background and the ground, drawn once in textures
+
+    The layers are split in columns, like a ChunkedLayer, and each column is drawn in its own texture
+    when the level is shown. A frame then draws one rectangle for each column on the screen, instead
+    of all the tiles of the layers. The textures are opaque, filled with the background color first,
+    so the layers must be the first ones drawn, in the order they are given.
+    A BakedLayers is only good for the level it was made for, delete() frees its textures.
+    """
+    def __init__(self, sprite_lists: List[arcade.SpriteList], chunk_width: int,
+                 bounds: Tuple[int, int, int, int], background_color: arcade.Color) -> None:
+        """
+        Arguments:
+            sprite_lists -- The layers, back to front, their sprites must not move or change
+            chunk_width -- Width of a column in pixels
+            bounds -- Left, right, bottom and top of the sprites of the layers, in pixels
+            background_color -- The color behind the layers
+        """
+        self.chunk_width = chunk_width
+        self.ctx = arcade.get_window().ctx
+        self.program = get_program(self.ctx)
+
+        left, right, bottom, top = bounds
+        self.columns: Dict[int, BakedColumn] = {
+            column: BakedColumn(self.ctx, column * chunk_width, bottom, chunk_width, top - bottom)
+            for column in get_columns(left, right, chunk_width)
+        }
+        self.bake(sprite_lists, background_color)
+
+    @classmethod
+    def create(cls, sprite_lists: List[arcade.SpriteList], chunk_width: int, background_color: arcade.Color,
+               memory_budget: int) -> Optional["BakedLayers"]:
+        """Draws the layers in textures, unless the textures would take more than memory_budget bytes
+
+        Returns:
+            The baked layers, None when the layers must be drawn as sprites
+        """
+        bounds = get_bounds(sprite_lists)
+        if bounds is None:
+            return None
+        left, right, bottom, top = bounds
+        texture_bytes = len(get_columns(left, right, chunk_width)) * chunk_width * (top - bottom) * 4
+        max_texture_size = arcade.get_window().ctx.limits.MAX_TEXTURE_SIZE
+        if texture_bytes > memory_budget or max(chunk_width, top - bottom) > max_texture_size:
+            logger.info(f"The static layers would take {texture_bytes / 2 ** 20:.1f} MB of textures, "
+                        f"drawing them as sprites")
+            return None
+        return cls(sprite_lists, chunk_width, bounds, background_color)
+
+    def bake(self, sprite_lists: List[arcade.SpriteList], background_color: arcade.Color) -> None:
+        """Draws the layers in the texture of each column"""
+        projection = self.ctx.projection_2d
+        # Opaque, so drawing the texture over the background color is drawing the layers over it
+        background_color = background_color[:3] + (255,)
+        try:
+            for column in self.columns.values():
+                column.framebuffer.clear(background_color)
+                with column.framebuffer.activate():
+                    self.ctx.projection_2d = column.projection
+                    for sprite_list in sprite_lists:
+                        sprite_list.draw()
+        finally:
+            self.ctx.projection_2d = projection
+
+    @property
+    def texture_bytes(self) -> int:
+        return sum(column.texture.width * column.texture.height * 4 for column in self.columns.values())
+
+    def draw(self, left: float, right: float) -> CullingStats:
+        """Draws the columns between left and right, in pixels
+
+        Returns:
+            How much of the layers was drawn, no sprite is drawn
+        """
+        first_column = math.floor(left / self.chunk_width)
+        last_column = math.floor(right / self.chunk_width)
+        visible_columns = [self.columns[column] for column in range(first_column, last_column + 1)
+                           if column in self.columns]
+        # The colors of the textures already went through blending, only their alpha was blended too
+        self.ctx.disable(self.ctx.BLEND)
+        for column in visible_columns:
+            column.texture.use(0)
+            column.geometry.render(self.program)
+        self.ctx.enable(self.ctx.BLEND)
+        return CullingStats(chunks_drawn=len(visible_columns), chunks_total=len(self.columns),
+                            sprites_drawn=0, sprites_total=0)
+
+    def delete(self) -> None:
+        """Frees the textures, the layers can't be drawn anymore"""
+        for column in self.columns.values():
+            column.delete()
+        self.columns.clear()
+
+
+def get_bounds(sprite_lists: List[arcade.SpriteList]) -> Optional[Tuple[int, int, int, int]]:
+    """Left, right, bottom and top of the sprites, rounded out to whole pixels, None without sprites"""
+    sprites = [sprite for sprite_list in sprite_lists for sprite in sprite_list]
+    if not sprites:
+        return None
+    return (math.floor(min(sprite.left for sprite in sprites)), math.ceil(max(sprite.right for sprite in sprites)),
+            math.floor(min(sprite.bottom for sprite in sprites)), math.ceil(max(sprite.top for sprite in sprites)))
+
+
+def get_columns(left: int, right: int, chunk_width: int) -> range:
+    """The columns covering left to right, in pixels"""
+    return range(math.floor(left / chunk_width), math.ceil(right / chunk_width))
@@ -0,0 +1,64 @@
+import math
+from typing import Dict, List, NamedTuple
+
+import arcade
+
+
+class CullingStats(NamedTuple):
+    """What a layer drew in a frame"""
+    chunks_drawn: int
+    chunks_total: int
+    sprites_drawn: int
+    sprites_total: int
+
+
+class ChunkedLayer:
+    """
+    A layer of the map split in columns, so only the columns on the screen are drawn
+
+    Each column is a sprite list with the sprites whose center is in it, sharing the sprites of the layer.
+    The game logic keeps using the sprite list of the whole layer. A sprite removed from its sprite lists,
+    like a coin picked up, disappears from its column too, add() puts it back.
+    """
+    def __init__(self, sprite_list: arcade.SpriteList, chunk_width: float) -> None:
+        """
+        Arguments:
+            sprite_list -- The sprites of the layer, they must not move
+            chunk_width -- Width of a column in pixels
+        """
+        self.chunk_width = chunk_width
+        self.chunks: Dict[int, arcade.SpriteList] = {}
+        # A sprite sticks out of its column by up to half its width
+        self.margin = 0.0
+        for sprite in sprite_list:
+            self.add(sprite)
+
+    def add(self, sprite: arcade.Sprite) -> None:
+        column = math.floor(sprite.center_x / self.chunk_width)
+        chunk = self.chunks.get(column)
+        if chunk is None:
+            chunk = self.chunks[column] = arcade.SpriteList()
+        chunk.append(sprite)
+        self.margin = max(self.margin, sprite.width / 2)
+
+    def get_visible_chunks(self, left: float, right: float) -> List[arcade.SpriteList]:
+        """The columns with sprites between left and right, in pixels"""
+        first_column = math.floor((left - self.margin) / self.chunk_width)
+        last_column = math.floor((right + self.margin) / self.chunk_width)
+        return [self.chunks[column] for column in range(first_column, last_column + 1) if column in self.chunks]
+
+    def draw(self, left: float, right: float) -> CullingStats:
+        """Draws the columns between left and right, in pixels
+
+        Returns:
+            How much of the layer was drawn
+        """
+        visible_chunks = self.get_visible_chunks(left, right)
+        for chunk in visible_chunks:
+            chunk.draw()
+        return CullingStats(
+            chunks_drawn=len(visible_chunks),
+            chunks_total=len(self.chunks),
+            sprites_drawn=sum(len(chunk) for chunk in visible_chunks),
+            sprites_total=sum(len(chunk) for chunk in self.chunks.values()),
+        )
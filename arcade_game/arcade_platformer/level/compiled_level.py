@@ -0,0 +1,363 @@
+"""
+Binary level format, produced offline by level_compiler.py from the .tmx maps
+
+All values are little-endian:
+- header: magic, version, map and tile sizes, scaling, background color, table sizes
+- strings: image paths and layer names, relative to the assets folder
+- sources: indexes of the strings naming the .tmx/.tsx files the level was compiled from
+- tiles: one record per tile id used in the map, with its image, flips, properties, hit box and animation
+- layers: tile layers are packed arrays of tile ids (16 bits when no tile is flipped), object layers are typed records
+- enemy spawns: sprite name, position, speed and patrol distance of each enemy
+"""
+import mmap
+import struct
+from array import array
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH
+from arcade_game.arcade_platformer.enemy.enemy_spawn import EnemySpawn
+
+
+MAGIC = b"PLVL"
+VERSION = 2
+
+HEADER = struct.Struct("<4sHHHHHf?4BHHHHH")
+STRING_LENGTH = struct.Struct("<H")
+SOURCE = struct.Struct("<H")
+TILE = struct.Struct("<IHHHHHBiIHH")
+HIT_BOX_POINT = struct.Struct("<ff")
+ANIMATION_FRAME = struct.Struct("<HII")
+LAYER = struct.Struct("<HBBBI")
+OBJECT = struct.Struct("<Ifffff?i")
+ENEMY_SPAWN = struct.Struct("<Hffff")
+
+# Layer kinds
+TILE_LAYER = 0
+OBJECT_LAYER = 1
+
+# Tile flags
+FLIPPED_HORIZONTALLY = 1
+FLIPPED_VERTICALLY = 2
+FLIPPED_DIAGONALLY = 4
+HAS_POINT_VALUE = 8
+
+
+class CompiledTile(NamedTuple):
+    """A tile used by the map, with everything needed to create its sprites"""
+    gid: int
+    image: str
+    image_x: int
+    image_y: int
+    image_width: int
+    image_height: int
+    flags: int
+    point_value: int
+    tile_id: int
+    hit_box: Tuple[Tuple[float, float], ...]
+    # (image, tile id, duration in ms) for each frame of animated tiles
+    frames: Tuple[Tuple[str, int, int], ...]
+
+
+class CompiledObject(NamedTuple):
+    """A tile object placed freely on the map, like a coin"""
+    gid: int
+    center_x: float
+    center_y: float
+    width: float
+    height: float
+    angle: float
+    point_value: Optional[int]
+
+
+class CompiledLayer(NamedTuple):
+    name: str
+    visible: bool
+    # Tile ids row by row, top row first, for tile layers
+    grid: Optional[array]
+    # Objects, for object layers
+    objects: Optional[List[CompiledObject]]
+
+
+class CompiledLevel:
+    """
+    The content of a compiled level file
+
+    Reading it doesn't touch OpenGL, so it can be done on a worker thread like parsing a .tmx
+    """
+    def __init__(self, width: int, height: int, tile_width: int, tile_height: int, scaling: float,
+                 background_color: Optional[Tuple[int, int, int, int]], sources: List[str],
+                 tiles: Dict[int, CompiledTile], layers: List[CompiledLayer],
+                 enemy_spawns: List[EnemySpawn]) -> None:
+        self.width = width
+        self.height = height
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.scaling = scaling
+        self.background_color = background_color
+        self.sources = sources
+        self.tiles = tiles
+        self.layers = layers
+        self.enemy_spawns = enemy_spawns
+
+    def is_up_to_date(self, compiled_path: Path) -> bool:
+        """Whether the compiled file is at least as recent as the maps and tilesets it was made from"""
+        compiled_time = compiled_path.stat().st_mtime
+        for source in self.sources:
+            source_path = ASSETS_PATH / source
+            if not source_path.exists() or source_path.stat().st_mtime > compiled_time:
+                return False
+        return True
+
+    def get_texture_arguments(self, tile: CompiledTile) -> Dict:
+        """The arguments to load the texture of a tile
+
+        The hit box is stored in the file, so arcade doesn't have to compute it from the image.
+        """
+        return {
+            "file_name": str(ASSETS_PATH / tile.image),
+            "x": tile.image_x,
+            "y": tile.image_y,
+            "width": tile.image_width,
+            "height": tile.image_height,
+            "flipped_horizontally": bool(tile.flags & FLIPPED_HORIZONTALLY),
+            "flipped_vertically": bool(tile.flags & FLIPPED_VERTICALLY),
+            "flipped_diagonally": bool(tile.flags & FLIPPED_DIAGONALLY),
+            "hit_box_algorithm": "None",
+        }
+
+    def preload_textures(self) -> None:
+        """Decodes the images of every tile used by the level, without touching OpenGL"""
+        for tile in self.tiles.values():
+            arcade.load_texture(**self.get_texture_arguments(tile))
+            for frame_image, _, _ in tile.frames:
+                arcade.load_texture(str(ASSETS_PATH / frame_image))
+
+    def create_sprite(self, tile: CompiledTile) -> arcade.Sprite:
+        """Creates a sprite for a tile, the same way arcade does when it reads a .tmx"""
+        texture = arcade.load_texture(**self.get_texture_arguments(tile))
+
+        if tile.frames:
+            sprite = arcade.AnimatedTimeBasedSprite(scale=self.scaling)
+            sprite.texture = texture
+            for frame_image, frame_tile_id, duration in tile.frames:
+                frame_texture = arcade.load_texture(str(ASSETS_PATH / frame_image))
+                sprite.frames.append(arcade.AnimationKeyframe(frame_tile_id, duration, frame_texture))
+            # Animated tiles start on their first frame
+            sprite.texture = sprite.frames[0].texture
+        else:
+            sprite = arcade.Sprite(texture=texture, scale=self.scaling)
+
+        sprite.hit_box = tile.hit_box
+
+        if tile.flags & HAS_POINT_VALUE:
+            sprite.properties["point_value"] = tile.point_value
+        sprite.properties["tile_id"] = tile.tile_id
+
+        return sprite
+
+    def create_sprite_lists(self, layer_options: Dict[str, Dict]) -> Dict[str, arcade.SpriteList]:
+        """Creates the sprite lists of every layer. This must run on the main thread.
+
+        Arguments:
+            layer_options -- The arcade options for each layer of the map
+        """
+        sprite_lists = {}
+
+        for layer in self.layers:
+            use_spatial_hash = layer_options.get(layer.name, {}).get("use_spatial_hash")
+            sprite_list = arcade.SpriteList(use_spatial_hash=use_spatial_hash)
+            sprite_list.visible = layer.visible
+
+            if layer.grid is not None:
+                for index, gid in enumerate(layer.grid):
+                    # Check for an empty tile
+                    if gid == 0:
+                        continue
+
+                    row_index, column_index = divmod(index, self.width)
+                    sprite = self.create_sprite(self.tiles[gid])
+                    sprite.center_x = column_index * (self.tile_width * self.scaling) + sprite.width / 2
+                    sprite.center_y = (
+                        (self.height - row_index - 1) * (self.tile_height * self.scaling) + sprite.height / 2
+                    )
+                    sprite_list.append(sprite)
+            else:
+                for tiled_object in layer.objects:
+                    sprite = self.create_sprite(self.tiles[tiled_object.gid])
+                    # Resizing the sprite scales its hit box, like for the .tmx objects
+                    sprite.width = tiled_object.width
+                    sprite.height = tiled_object.height
+                    sprite.position = (tiled_object.center_x, tiled_object.center_y)
+                    sprite.angle = tiled_object.angle
+                    if tiled_object.point_value is not None:
+                        sprite.properties["point_value"] = tiled_object.point_value
+                    sprite_list.append(sprite)
+
+            sprite_lists[layer.name] = sprite_list
+
+        return sprite_lists
+
+
+def read_compiled_level(path: Path) -> CompiledLevel:
+    """Reads a compiled level file through a memory map
+
+    Raises:
+        ValueError if the file isn't a compiled level of the current version, or if it is truncated
+    """
+    try:
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return parse_compiled_level(data, path)
+    except (struct.error, IndexError) as error:
+        # A file cut short, by a copy or a compilation that didn't finish
+        raise ValueError(f"{path} is truncated or corrupt: {error}") from error
+
+
+def parse_compiled_level(data: bytes, path: Path) -> CompiledLevel:
+    """Decodes the content of a compiled level file, see read_compiled_level()"""
+    (magic, version, width, height, tile_width, tile_height, scaling, has_background_color,
+     red, green, blue, alpha, string_count, source_count, tile_count, layer_count,
+     enemy_spawn_count) = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a compiled level of version {VERSION}")
+    offset = HEADER.size
+
+    strings = []
+    for _ in range(string_count):
+        (length,) = STRING_LENGTH.unpack_from(data, offset)
+        offset += STRING_LENGTH.size
+        strings.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    sources = []
+    for _ in range(source_count):
+        (string_index,) = SOURCE.unpack_from(data, offset)
+        offset += SOURCE.size
+        sources.append(strings[string_index])
+
+    tiles = {}
+    for _ in range(tile_count):
+        (gid, image, image_x, image_y, image_width, image_height, flags, point_value, tile_id,
+         hit_box_count, frame_count) = TILE.unpack_from(data, offset)
+        offset += TILE.size
+
+        hit_box = tuple(HIT_BOX_POINT.iter_unpack(data[offset:offset + hit_box_count * HIT_BOX_POINT.size]))
+        offset += hit_box_count * HIT_BOX_POINT.size
+
+        frames = tuple(
+            (strings[frame_image], frame_tile_id, duration)
+            for frame_image, frame_tile_id, duration
+            in ANIMATION_FRAME.iter_unpack(data[offset:offset + frame_count * ANIMATION_FRAME.size])
+        )
+        offset += frame_count * ANIMATION_FRAME.size
+
+        tiles[gid] = CompiledTile(gid, strings[image], image_x, image_y, image_width, image_height,
+                                  flags, point_value, tile_id, hit_box, frames)
+
+    layers = []
+    for _ in range(layer_count):
+        name, kind, visible, item_size, count = LAYER.unpack_from(data, offset)
+        offset += LAYER.size
+
+        if kind == TILE_LAYER:
+            # The writer aligns the tile ids on 4 bytes
+            offset += -offset % 4
+            grid = array("H" if item_size == 2 else "I")
+            grid.frombytes(data[offset:offset + count * grid.itemsize])
+            offset += count * grid.itemsize
+            layers.append(CompiledLayer(strings[name], visible, grid, None))
+        else:
+            objects = [
+                CompiledObject(gid, center_x, center_y, object_width, object_height, angle,
+                               point_value if has_point_value else None)
+                for gid, center_x, center_y, object_width, object_height, angle, has_point_value, point_value
+                in OBJECT.iter_unpack(data[offset:offset + count * OBJECT.size])
+            ]
+            offset += count * OBJECT.size
+            layers.append(CompiledLayer(strings[name], visible, None, objects))
+
+    enemy_spawns = [
+        EnemySpawn(strings[sprite_name], center_x, center_y, speed, patrol_distance)
+        for sprite_name, center_x, center_y, speed, patrol_distance
+        in ENEMY_SPAWN.iter_unpack(data[offset:offset + enemy_spawn_count * ENEMY_SPAWN.size])
+    ]
+    offset += enemy_spawn_count * ENEMY_SPAWN.size
+    # The slices of a file cut between two records are only shorter, check nothing is missing
+    if offset != len(data):
+        raise ValueError(f"{path} is truncated or corrupt: {len(data)} bytes, {offset} expected")
+
+    background_color = (red, green, blue, alpha) if has_background_color else None
+    return CompiledLevel(width, height, tile_width, tile_height, scaling, background_color, sources, tiles, layers,
+                         enemy_spawns)
+
+
+def write_compiled_level(path: Path, level: CompiledLevel) -> None:
+    """Writes a compiled level file"""
+    strings: List[str] = []
+    string_indexes: Dict[str, int] = {}
+
+    def string_index(value: str) -> int:
+        if value not in string_indexes:
+            string_indexes[value] = len(strings)
+            strings.append(value)
+        return string_indexes[value]
+
+    # Fill the string table first, it comes before everything that refers to it
+    source_indexes = [string_index(source) for source in level.sources]
+    for tile in level.tiles.values():
+        string_index(tile.image)
+        for frame_image, _, _ in tile.frames:
+            string_index(frame_image)
+    for layer in level.layers:
+        string_index(layer.name)
+    for spawn in level.enemy_spawns:
+        string_index(spawn.sprite_name)
+
+    background_color = level.background_color or (0, 0, 0, 255)
+    body = bytearray(HEADER.pack(
+        MAGIC, VERSION, level.width, level.height, level.tile_width, level.tile_height, level.scaling,
+        level.background_color is not None, *background_color,
+        len(strings), len(source_indexes), len(level.tiles), len(level.layers), len(level.enemy_spawns),
+    ))
+
+    for value in strings:
+        encoded = value.encode("utf-8")
+        body += STRING_LENGTH.pack(len(encoded))
+        body += encoded
+
+    for source_index in source_indexes:
+        body += SOURCE.pack(source_index)
+
+    for tile in level.tiles.values():
+        body += TILE.pack(tile.gid, string_indexes[tile.image], tile.image_x, tile.image_y,
+                          tile.image_width, tile.image_height, tile.flags, tile.point_value, tile.tile_id,
+                          len(tile.hit_box), len(tile.frames))
+        for point in tile.hit_box:
+            body += HIT_BOX_POINT.pack(*point)
+        for frame_image, frame_tile_id, duration in tile.frames:
+            body += ANIMATION_FRAME.pack(string_indexes[frame_image], frame_tile_id, duration)
+
+    for layer in level.layers:
+        if layer.grid is not None:
+            # Flipped tiles have flags in the high bits of their id, otherwise 16 bits are enough
+            grid = array("H" if max(layer.grid, default=0) <= 0xFFFF else "I", layer.grid)
+            body += LAYER.pack(string_indexes[layer.name], TILE_LAYER, layer.visible, grid.itemsize, len(grid))
+            body += bytes(-len(body) % 4)
+            body += grid.tobytes()
+        else:
+            body += LAYER.pack(string_indexes[layer.name], OBJECT_LAYER, layer.visible, 0, len(layer.objects))
+            for tiled_object in layer.objects:
+                point_value = tiled_object.point_value
+                body += OBJECT.pack(tiled_object.gid, tiled_object.center_x, tiled_object.center_y,
+                                    tiled_object.width, tiled_object.height, tiled_object.angle,
+                                    point_value is not None, point_value or 0)
+
+    for spawn in level.enemy_spawns:
+        body += ENEMY_SPAWN.pack(string_indexes[spawn.sprite_name], spawn.center_x, spawn.center_y, spawn.speed,
+                                 spawn.patrol_distance)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(body)
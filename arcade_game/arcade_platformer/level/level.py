@@ -0,0 +1,278 @@
+from typing import Dict, List, Optional, Union
+
+import arcade
+import numpy as np
+import pytiled_parser
+
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH, MAP_SCALING, COMPILED_LEVELS_PATH, \
+    USE_COMPILED_LEVELS, CHUNK_WIDTH
+from arcade_game.arcade_platformer.enemy.enemy import load_enemy_textures
+from arcade_game.arcade_platformer.enemy.enemy_patrol import compute_patrol_bounds
+from arcade_game.arcade_platformer.enemy.enemy_spawn import EnemySpawn, read_enemy_spawns
+from arcade_game.arcade_platformer.level.chunked_layer import ChunkedLayer
+from arcade_game.arcade_platformer.level.compiled_level import CompiledLevel, read_compiled_level
+from arcade_game.arcade_platformer.level.tile_grid import TileGrid
+from log.config_log import logger
+
+
+class Level:
+    """
+    Holds the parsed data of a level map: its sprite lists, dimensions and enemies
+
+    Level objects are cached and reused between lives, so anything the game changes
+    while playing (the coins being picked up) is put back by reset()
+    """
+    def __init__(self, number: int, sprite_lists: Dict[str, arcade.SpriteList], width: int, height: int,
+                 tile_width: int, tile_height: int, background_color: Optional[arcade.Color] = None,
+                 enemy_spawns: Optional[List[EnemySpawn]] = None) -> None:
+        self.number = number
+        self.sprite_lists = sprite_lists
+        # The enemies are created by the enemy pool, the level only says where they start
+        self.enemy_spawns = enemy_spawns or []
+
+        # width/height : size expressed in number of tiles
+        # tile_width/tile_height : size of a given tile in pixels
+        self.width = width
+        self.height = height
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.background_color = background_color
+
+        # Keep every coin of the map, so the ones picked up can be put back on reset
+        self.all_coins = list(self.coins) if self.coins is not None else []
+
+        # Grid indexes of the static layers, built the first time they are needed
+        self.tile_grids: Dict[str, TileGrid] = {}
+        # The layers split in columns for drawing, built the first time they are needed
+        self.chunked_layers: Dict[str, ChunkedLayer] = {}
+        # Where each enemy turns around, computed the first time they are needed
+        self.patrol_bounds: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_tilemap(cls, number: int, game_map: arcade.TileMap) -> "Level":
+        """Creates a level from a loaded Tiled map
+
+        Arguments:
+            number -- The level number
+            game_map -- The map loaded by arcade
+        """
+        return cls(
+            number=number,
+            sprite_lists=dict(game_map.sprite_lists),
+            width=game_map.width,
+            height=game_map.height,
+            tile_width=game_map.tile_width,
+            tile_height=game_map.tile_height,
+            background_color=game_map.background_color,
+            enemy_spawns=read_enemy_spawns(game_map.tiled_map),
+        )
+
+    @classmethod
+    def from_compiled(cls, number: int, compiled_level: CompiledLevel, layer_options: Dict[str, Dict]) -> "Level":
+        """Creates a level from a compiled level file
+
+        Arguments:
+            number -- The level number
+            compiled_level -- The content of the compiled file
+            layer_options -- The arcade options for each layer of the map
+        """
+        return cls(
+            number=number,
+            sprite_lists=compiled_level.create_sprite_lists(layer_options),
+            width=compiled_level.width,
+            height=compiled_level.height,
+            tile_width=compiled_level.tile_width,
+            tile_height=compiled_level.tile_height,
+            background_color=compiled_level.background_color,
+            enemy_spawns=compiled_level.enemy_spawns,
+        )
+
+    @property
+    def background(self) -> Optional[arcade.SpriteList]:
+        return self.sprite_lists.get("background")
+
+    @property
+    def walls(self) -> Optional[arcade.SpriteList]:
+        return self.sprite_lists.get("ground")
+
+    @property
+    def goals(self) -> Optional[arcade.SpriteList]:
+        return self.sprite_lists.get("goal")
+
+    @property
+    def coins(self) -> Optional[arcade.SpriteList]:
+        return self.sprite_lists.get("coins")
+
+    @property
+    def ladders(self) -> Optional[arcade.SpriteList]:
+        """Not all maps have ladders"""
+        return self.sprite_lists.get("ladders")
+
+    @property
+    def traps(self) -> Optional[arcade.SpriteList]:
+        """Not all maps have traps"""
+        return self.sprite_lists.get("traps")
+
+    @property
+    def map_width(self) -> int:
+        """Width of the map in pixels, used to control viewport scrolling"""
+        # Subtracting 1 from the width corrects for the tile indexing used by Tiled.
+        return (self.width - 1) * self.tile_width
+
+    def get_tile_grid(self, layer_name: str) -> Optional[TileGrid]:
+        """Returns the grid index of a static layer (walls, traps, goals, ladders), None if the map doesn't have it
+
+        Arguments:
+            layer_name -- The name of the layer in the map
+        """
+        if layer_name not in self.tile_grids:
+            sprite_list = self.sprite_lists.get(layer_name)
+            if sprite_list is None:
+                return None
+            self.tile_grids[layer_name] = TileGrid(
+                sprite_list, self.tile_width * MAP_SCALING, self.tile_height * MAP_SCALING
+            )
+        return self.tile_grids[layer_name]
+
+    def get_chunked_layer(self, layer_name: str) -> Optional[ChunkedLayer]:
+        """Returns a layer split in columns for drawing, None if the map doesn't have it.
+        This creates sprite lists, it must run on the main thread.
+
+        Arguments:
+            layer_name -- The name of the layer in the map
+        """
+        if layer_name not in self.chunked_layers:
+            sprite_list = self.sprite_lists.get(layer_name)
+            if sprite_list is None:
+                return None
+            self.chunked_layers[layer_name] = ChunkedLayer(sprite_list, CHUNK_WIDTH)
+        return self.chunked_layers[layer_name]
+
+    def get_patrol_bounds(self) -> np.ndarray:
+        """Returns the lowest and highest center_x of each enemy, in the order of enemy_spawns"""
+        if self.patrol_bounds is None:
+            self.patrol_bounds = compute_patrol_bounds(self.enemy_spawns, self.get_tile_grid("ground"),
+                                                       self.width, self.height)
+        return self.patrol_bounds
+
+    def reset(self) -> None:
+        """Puts the level back in the state it was loaded in, without reading the map again"""
+        if self.coins is None:
+            return
+
+        # Coins picked up have been removed from every sprite list, add them back
+        chunked_coins = self.chunked_layers.get("coins")
+        for coin in self.all_coins:
+            if not coin.sprite_lists:
+                self.coins.append(coin)
+                if chunked_coins is not None:
+                    chunked_coins.add(coin)
+
+
+def get_map_path(level_number: int):
+    """Returns the path of the Tiled map for a given level"""
+    return ASSETS_PATH / f"platform_level_{level_number:02}.tmx"
+
+
+def get_compiled_map_path(level_number: int):
+    """Returns the path of the compiled map for a given level"""
+    return COMPILED_LEVELS_PATH / f"platform_level_{level_number:02}.lvl"
+
+
+def read_level(level_number: int) -> Union[CompiledLevel, pytiled_parser.TiledMap]:
+    """Reads the map of a level, from its compiled file when it is up-to-date, from the .tmx otherwise.
+    This does not touch OpenGL, so it can run on a worker thread.
+
+    Arguments:
+        level_number -- The level to read
+    """
+    compiled_path = get_compiled_map_path(level_number)
+
+    if USE_COMPILED_LEVELS and compiled_path.exists():
+        try:
+            compiled_level = read_compiled_level(compiled_path)
+        except ValueError as error:
+            logger.warning(f"{error}, reading the .tmx instead")
+        else:
+            if compiled_level.scaling != MAP_SCALING:
+                logger.warning(f"{compiled_path.name} was compiled with another scaling, reading the .tmx instead")
+            elif compiled_level.is_up_to_date(compiled_path):
+                return compiled_level
+            else:
+                logger.warning(f"{compiled_path.name} is older than its map, reading the .tmx instead")
+
+    return parse_level_map(level_number)
+
+
+def parse_level_map(level_number: int) -> pytiled_parser.TiledMap:
+    """Reads and parses the Tiled map of a level, resolving its tilesets.
+    This does not touch OpenGL, so it can run on a worker thread.
+
+    Arguments:
+        level_number -- The level to parse
+
+    Returns:
+        The parsed Tiled map
+    """
+    return pytiled_parser.parse_map(get_map_path(level_number))
+
+
+def preload_tile_textures(tiled_map: pytiled_parser.TiledMap) -> None:
+    """Decodes the tile images of a parsed map and computes their hit boxes.
+    This does not touch OpenGL either, the textures are sent to the GPU on the first draw.
+
+    Arguments:
+        tiled_map -- The parsed Tiled map
+    """
+    for tileset in tiled_map.tilesets.values():
+        for tile in (tileset.tiles or {}).values():
+            if tile.image:
+                # Same arguments as the ones used by arcade when it creates the tile sprites,
+                # so the textures end up in arcade's texture cache under the same name
+                texture = arcade.load_texture(
+                    tile.image, tile.x, tile.y, tile.width, tile.height, hit_box_algorithm="Simple"
+                )
+                # The hit box is computed on first access, and it is the most expensive part
+                texture.hit_box_points
+
+
+def preload_level_textures(level_map: Union[CompiledLevel, pytiled_parser.TiledMap]) -> None:
+    """Decodes the images of a level read by read_level(), and of its enemies, without touching OpenGL"""
+    if isinstance(level_map, CompiledLevel):
+        level_map.preload_textures()
+        enemy_spawns = level_map.enemy_spawns
+    else:
+        preload_tile_textures(level_map)
+        enemy_spawns = read_enemy_spawns(level_map)
+
+    for sprite_name in {spawn.sprite_name for spawn in enemy_spawns}:
+        load_enemy_textures(sprite_name)
+
+
+def build_level(level_number: int, level_map: Union[CompiledLevel, pytiled_parser.TiledMap],
+                layer_options: Dict[str, Dict]) -> Level:
+    """Creates the sprite lists of a level from its map. This must run on the main thread.
+
+    Arguments:
+        level_number -- The level to build
+        level_map -- The compiled level or the parsed Tiled map, as returned by read_level()
+        layer_options -- The arcade options for each layer of the map
+    """
+    if isinstance(level_map, CompiledLevel):
+        return Level.from_compiled(level_number, level_map, layer_options)
+
+    game_map = arcade.TileMap(tiled_map=level_map, layer_options=layer_options, scaling=MAP_SCALING)
+    return Level.from_tilemap(level_number, game_map)
+
+
+def load_level(level_number: int, layer_options: Dict[str, Dict]) -> Level:
+    """Reads the map of a level from disk and builds it
+
+    Arguments:
+        level_number -- The level to load
+        layer_options -- The arcade options for each layer of the map
+
+    Returns:
+        The loaded level
+    """
+    return build_level(level_number, read_level(level_number), layer_options)
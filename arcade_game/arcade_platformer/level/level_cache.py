@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from arcade_game.arcade_platformer.config.config import LEVEL_CACHE_SIZE
+from arcade_game.arcade_platformer.level.level import Level, load_level
+from log.config_log import logger
+
+
+class LevelCache:
+    """
+    Keeps the parsed levels in memory, so dying or restarting a game does not read the maps again
+
+    Levels are keyed by level number and layer options. When more than max_size levels are
+    cached, the least recently used one is dropped.
+    """
+    def __init__(self, max_size: int = LEVEL_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._levels: "OrderedDict[Tuple, Level]" = OrderedDict()
+
+        # Some stats to check the cache is doing its job
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(level_number: int, layer_options: Dict[str, Dict]) -> Tuple:
+        """Turns the level number and the layer options (nested dicts) into a hashable key"""
+        options = tuple(
+            (layer_name, tuple(sorted(options.items())))
+            for layer_name, options in sorted(layer_options.items())
+        )
+        return level_number, options
+
+    def get(self, level_number: int, layer_options: Dict[str, Dict]) -> Level:
+        """Returns the level, loading it from disk only if it is not cached yet
+
+        Arguments:
+            level_number -- The level to get
+            layer_options -- The arcade options for each layer of the map
+        """
+        key = self.make_key(level_number, layer_options)
+
+        level = self._levels.get(key)
+        if level is not None:
+            self.hits += 1
+            # Mark the level as the most recently used
+            self._levels.move_to_end(key)
+            return level
+
+        self.misses += 1
+        level = load_level(level_number, layer_options)
+        self.put(level_number, layer_options, level)
+        return level
+
+    def put(self, level_number: int, layer_options: Dict[str, Dict], level: Level) -> None:
+        """Adds a level to the cache, evicting the least recently used levels if it is full"""
+        key = self.make_key(level_number, layer_options)
+        self._levels[key] = level
+        self._levels.move_to_end(key)
+
+        while len(self._levels) > self.max_size:
+            evicted_key, _ = self._levels.popitem(last=False)
+            logger.info(f"Level cache full, dropping level {evicted_key[0]}")
+
+    def contains(self, level_number: int, layer_options: Dict[str, Dict]) -> bool:
+        return self.make_key(level_number, layer_options) in self._levels
+
+    def clear(self) -> None:
+        self._levels.clear()
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+
+# The cache is shared by every game played, so a new game does not read the maps again either
+level_cache = LevelCache()
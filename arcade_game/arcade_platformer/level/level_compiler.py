@@ -0,0 +1,157 @@
+"""
+Compiles the Tiled maps of the game into the binary level format read by compiled_level.py
+
+Run it from the root of the repository whenever a .tmx or .tsx file changes:
+    $ python -m arcade_game.arcade_platformer.level.level_compiler
+Levels which are not compiled, or whose compiled file is older than the map, are read from the .tmx.
+"""
+import os
+import xml.etree.ElementTree as ElementTree
+from array import array
+from pathlib import Path
+from typing import List
+
+import arcade
+import pytiled_parser
+
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH, ENEMY_LAYER_NAME, LEVEL_COUNT, MAP_SCALING
+from arcade_game.arcade_platformer.enemy.enemy_spawn import read_enemy_spawns
+from arcade_game.arcade_platformer.level.compiled_level import CompiledLayer, CompiledLevel, CompiledObject, \
+    CompiledTile, FLIPPED_DIAGONALLY, FLIPPED_HORIZONTALLY, FLIPPED_VERTICALLY, HAS_POINT_VALUE, \
+    write_compiled_level
+from arcade_game.arcade_platformer.level.level import get_compiled_map_path, get_map_path
+
+
+def get_relative_path(path) -> str:
+    """Paths are stored relative to the assets folder, so the game can be moved around"""
+    return Path(os.path.relpath(Path(path).resolve(), ASSETS_PATH)).as_posix()
+
+
+def get_sources(map_path: Path) -> List[str]:
+    """Lists the map and the external tilesets it uses"""
+    sources = [get_relative_path(map_path)]
+    for tileset in ElementTree.parse(map_path).getroot().iter("tileset"):
+        if "source" in tileset.attrib:
+            sources.append(get_relative_path(map_path.parent / tileset.attrib["source"]))
+    return sources
+
+
+def compile_tile(game_map: arcade.TileMap, gid: int) -> CompiledTile:
+    """Creates the sprite of a tile with arcade, and keeps what is needed to create it again"""
+    # Going through arcade makes sure the hit box, flips and properties are exactly the ones
+    # the game gets when it reads the .tmx
+    # These are private methods of arcade 2.6.17, pinned in requirements.txt for them
+    tile = game_map._get_tile_by_gid(gid)
+    sprite = game_map._create_sprite_from_tile(tile, scaling=MAP_SCALING)
+
+    flags = 0
+    if tile.flipped_horizontally:
+        flags |= FLIPPED_HORIZONTALLY
+    if tile.flipped_vertically:
+        flags |= FLIPPED_VERTICALLY
+    if tile.flipped_diagonally:
+        flags |= FLIPPED_DIAGONALLY
+
+    point_value = 0
+    if "point_value" in sprite.properties:
+        flags |= HAS_POINT_VALUE
+        point_value = int(sprite.properties["point_value"])
+
+    frames = tuple(
+        (get_relative_path(tile.tileset.tiles[frame.tile_id].image), frame.tile_id, frame.duration)
+        for frame in (tile.animation or [])
+    )
+
+    return CompiledTile(
+        gid=gid,
+        image=get_relative_path(tile.image),
+        image_x=tile.x,
+        image_y=tile.y,
+        image_width=tile.width,
+        image_height=tile.height,
+        flags=flags,
+        point_value=point_value,
+        tile_id=tile.id,
+        hit_box=tuple((float(x), float(y)) for x, y in sprite.hit_box),
+        frames=frames,
+    )
+
+
+def compile_level(level_number: int) -> CompiledLevel:
+    """Reads a level with arcade and converts it to the compiled format
+
+    Arguments:
+        level_number -- The level to compile
+    """
+    map_path = get_map_path(level_number)
+    tiled_map = pytiled_parser.parse_map(map_path)
+    game_map = arcade.TileMap(tiled_map=tiled_map, scaling=MAP_SCALING)
+
+    tiles = {}
+    layers = []
+    for layer in tiled_map.layers:
+        if isinstance(layer, pytiled_parser.TileLayer):
+            grid = array("I", [gid for row in layer.data for gid in row])
+            for gid in set(grid) - {0}:
+                if gid not in tiles:
+                    tiles[gid] = compile_tile(game_map, gid)
+            layers.append(CompiledLayer(layer.name, layer.visible, grid, None))
+
+        elif isinstance(layer, pytiled_parser.ObjectLayer) and layer.name == ENEMY_LAYER_NAME:
+            # The enemies are stored apart, they are not sprites of the map
+            continue
+
+        elif isinstance(layer, pytiled_parser.ObjectLayer):
+            tile_objects = [
+                tiled_object for tiled_object in layer.tiled_objects
+                if isinstance(tiled_object, pytiled_parser.tiled_object.Tile)
+            ]
+            # arcade creates one sprite per tile object, in the same order
+            sprites = game_map.sprite_lists.get(layer.name, [])
+
+            objects = []
+            for tiled_object, sprite in zip(tile_objects, sprites):
+                if tiled_object.gid not in tiles:
+                    tiles[tiled_object.gid] = compile_tile(game_map, tiled_object.gid)
+
+                point_value = None
+                if tiled_object.properties and "point_value" in tiled_object.properties:
+                    point_value = int(tiled_object.properties["point_value"])
+
+                objects.append(CompiledObject(
+                    gid=tiled_object.gid,
+                    center_x=sprite.center_x,
+                    center_y=sprite.center_y,
+                    width=sprite.width,
+                    height=sprite.height,
+                    angle=sprite.angle,
+                    point_value=point_value,
+                ))
+            layers.append(CompiledLayer(layer.name, layer.visible, None, objects))
+
+        else:
+            raise ValueError(f"Layer '{layer.name}' of {map_path.name} can't be compiled, "
+                             f"only tile and object layers are supported")
+
+    background_color = tuple(tiled_map.background_color) if tiled_map.background_color else None
+
+    return CompiledLevel(
+        width=game_map.width,
+        height=game_map.height,
+        tile_width=game_map.tile_width,
+        tile_height=game_map.tile_height,
+        scaling=MAP_SCALING,
+        background_color=background_color,
+        sources=get_sources(map_path),
+        tiles=tiles,
+        layers=layers,
+        enemy_spawns=read_enemy_spawns(tiled_map),
+    )
+
+
+if __name__ == "__main__":
+    for level_number in range(1, LEVEL_COUNT + 1):
+        compiled_path = get_compiled_map_path(level_number)
+        write_compiled_level(compiled_path, compile_level(level_number))
+        print(f"Compiled {get_map_path(level_number).name} into {compiled_path} "
+              f"({compiled_path.stat().st_size} bytes)")
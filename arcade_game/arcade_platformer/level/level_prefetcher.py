@@ -0,0 +1,74 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict
+
+from arcade_game.arcade_platformer.config.config import LEVEL_COUNT
+from arcade_game.arcade_platformer.level.level import Level, build_level, read_level, preload_level_textures
+from arcade_game.arcade_platformer.level.level_cache import LevelCache, level_cache
+from log.config_log import logger
+
+
+class LevelPrefetcher:
+    """
+    Parses the map of the next level on a worker thread while the current level is played
+
+    The worker only does the work that doesn't need OpenGL: XML parsing, layer decoding,
+    tileset resolution and image decoding. The sprite lists are built on the main thread
+    when the level is actually needed, and the textures are sent to the GPU on the first draw.
+    """
+    def __init__(self, cache: LevelCache) -> None:
+        self.cache = cache
+        # A single worker is enough, we only ever look one level ahead
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LevelPrefetch")
+        # Parsed maps being prepared, by level number
+        self._pending: Dict[int, Future] = {}
+
+    def prefetch(self, level_number: int, layer_options: Dict[str, Dict]) -> None:
+        """Starts parsing a level in the background, unless it is already cached or on its way
+
+        Arguments:
+            level_number -- The level to prepare
+            layer_options -- The arcade options the level will be built with
+        """
+        if level_number > LEVEL_COUNT or level_number in self._pending:
+            return
+        if self.cache.contains(level_number, layer_options):
+            return
+
+        self._pending[level_number] = self._executor.submit(self.prepare_level, level_number)
+
+    @staticmethod
+    def prepare_level(level_number: int):
+        """Reads a level map and decodes its tiles, this is what runs on the worker thread"""
+        level_map = read_level(level_number)
+        preload_level_textures(level_map)
+        return level_map
+
+    def is_prefetched(self, level_number: int) -> bool:
+        """Whether the level was requested in advance (its parsing may still be running)"""
+        return level_number in self._pending
+
+    def get(self, level_number: int, layer_options: Dict[str, Dict]) -> Level:
+        """Returns the level, using the cache or the map parsed in the background when possible
+
+        Arguments:
+            level_number -- The level to get
+            layer_options -- The arcade options for each layer of the map
+        """
+        future = self._pending.pop(level_number, None)
+        if future is None or self.cache.contains(level_number, layer_options):
+            return self.cache.get(level_number, layer_options)
+
+        try:
+            # Waits for the worker if it is not done yet, that's still less than parsing from scratch
+            level_map = future.result()
+        except Exception:
+            logger.exception(f"Prefetching level {level_number} failed, loading it again")
+            return self.cache.get(level_number, layer_options)
+
+        level = build_level(level_number, level_map, layer_options)
+        self.cache.put(level_number, layer_options, level)
+        return level
+
+
+# Shared by every game played, like the level cache
+level_prefetcher = LevelPrefetcher(level_cache)
@@ -0,0 +1,50 @@
+import arcade
+
+from arcade_game.arcade_platformer.enemy.enemy_manager import EnemyManager
+from arcade_game.arcade_platformer.level.level import Level
+
+
+class LevelSnapshot:
+    """
+    Records the state of a level right after it was set up: coins, enemies and player start
+
+    Losing a life restores this state in place, on the sprites and physics engine already there,
+    instead of building the whole level again.
+    """
+    def __init__(self, level: Level, enemy_manager: EnemyManager, player_sprite: arcade.Sprite,
+                 physics_engine: arcade.PhysicsEnginePlatformer) -> None:
+        # The level keeps track of its coins, every coin is present right after the setup
+        self.level = level
+        self.physics_engine = physics_engine
+
+        # The enemy manager keeps its own copy of the arrays it works on
+        self.enemy_manager = enemy_manager
+        self.enemy_manager.save_state()
+
+        self.player_sprite = player_sprite
+        self.player_state = (
+            player_sprite.center_x,
+            player_sprite.center_y,
+            player_sprite.change_x,
+            player_sprite.change_y,
+            player_sprite.state,
+            player_sprite.texture,
+        )
+
+    def restore(self) -> None:
+        """Puts the level back in the recorded state, only positions and flags are changed"""
+        # Put back the coins picked up
+        self.level.reset()
+
+        self.enemy_manager.restore_state()
+
+        center_x, center_y, change_x, change_y, state, texture = self.player_state
+        self.player_sprite.center_x = center_x
+        self.player_sprite.center_y = center_y
+        self.player_sprite.change_x = change_x
+        self.player_sprite.change_y = change_y
+        self.player_sprite.state = state
+        self.player_sprite.texture = texture
+
+        # The physics engine is reused, only its jump counter depends on what happened before
+        self.physics_engine.jumps_since_ground = 0
@@ -0,0 +1,77 @@
+import math
+from typing import Dict, List, Tuple
+
+import arcade
+import numpy as np
+
+
+class TileGrid:
+    """
+    Index of the static tiles of a layer by grid cell
+
+    The maps are uniform tile grids, so finding the tiles overlapping a box only needs to look
+    at the few cells under that box, whatever the size of the map.
+    Only use it for layers whose sprites never move or get removed.
+    """
+    def __init__(self, sprite_list: arcade.SpriteList, cell_width: float, cell_height: float) -> None:
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        # The sprites touching each cell, by (column, row) from the bottom left of the map
+        self.cells: Dict[Tuple[int, int], List[arcade.Sprite]] = {}
+
+        for sprite in sprite_list:
+            self.add(sprite)
+
+    def add(self, sprite: arcade.Sprite) -> None:
+        """Adds a sprite in every cell its bounding box covers"""
+        # A tile lying exactly on a cell doesn't spill over in the next cells
+        first_column = math.floor(sprite.left / self.cell_width)
+        last_column = max(first_column, math.ceil(sprite.right / self.cell_width) - 1)
+        first_row = math.floor(sprite.bottom / self.cell_height)
+        last_row = max(first_row, math.ceil(sprite.top / self.cell_height) - 1)
+
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                self.cells.setdefault((column, row), []).append(sprite)
+
+    def get_sprites_in_box(self, left: float, bottom: float, right: float, top: float) -> List[arcade.Sprite]:
+        """Returns the sprites in the cells overlapping a box, with no duplicates
+
+        Arguments:
+            left, bottom, right, top -- The box, in pixels
+        """
+        # A sprite covering several cells shows up once, in the order it is first found
+        sprites: Dict[arcade.Sprite, None] = {}
+        for column in range(math.floor(left / self.cell_width), math.floor(right / self.cell_width) + 1):
+            for row in range(math.floor(bottom / self.cell_height), math.floor(top / self.cell_height) + 1):
+                sprites.update(dict.fromkeys(self.cells.get((column, row), ())))
+        return list(sprites)
+
+    def is_cell_occupied(self, column: int, row: int) -> bool:
+        return (column, row) in self.cells
+
+    def get_occupancy(self, columns: int, rows: int) -> np.ndarray:
+        """Returns which cells hold a tile, as a boolean array indexed by [row, column]
+
+        Arguments:
+            columns, rows -- The size of the map, cells outside of it are left out
+        """
+        occupancy = np.zeros((rows, columns), dtype=bool)
+        for column, row in self.cells:
+            if 0 <= column < columns and 0 <= row < rows:
+                occupancy[row, column] = True
+        return occupancy
+
+    def check_for_collision(self, sprite: arcade.Sprite) -> List[arcade.Sprite]:
+        """Same as arcade.check_for_collision_with_list, but only looks at the tiles near the sprite
+
+        Arguments:
+            sprite -- The sprite to check, usually the player or an enemy
+
+        Returns:
+            The tiles colliding with the sprite
+        """
+        return [
+            tile for tile in self.get_sprites_in_box(sprite.left, sprite.bottom, sprite.right, sprite.top)
+            if arcade.check_for_collision(sprite, tile)
+        ]
@@ -1,10 +1,40 @@
 import arcade
 import logging
+from functools import lru_cache
 
+from arcade_game.arcade_platformer.asset.character_atlas import CharacterTextures, character_atlas
 from arcade_game.arcade_platformer.config.config import PLAYER_START_X, PLAYER_START_Y, ASSETS_PATH, \
     PLAYER_MOVE_SPEED, PLAYER_JUMP_SPEED
 
 
+@lru_cache(maxsize=None)
+def load_player_textures() -> CharacterTextures:
+    """Loads the textures of the player, once. Every player sprite uses the same texture lists."""
+    # Where are the player images stored?
+    texture_path = ASSETS_PATH / "images" / "player"
+
+    # Set up the appropriate textures
+    walking_paths = [
+        #texture_path / f"alienGreen_walk{x}.png" for x in (1, 2)  # TODO make configurable!!!!
+        texture_path / f"megaman_walk{x}.png" for x in (1, 2)
+    ]
+    climbing_paths = [
+        #texture_path / f"alienGreen_climb{x}.png" for x in (1, 2)
+        texture_path / f"megaman_climb{x}.png" for x in (1, 2)
+    ]
+    #standing_path = texture_path / "alienGreen_stand.png"
+    standing_path = texture_path / "megaman_stand.png"
+
+    # Load them all now, the same climbing frames are used going up and down
+    return CharacterTextures(
+        walk_left=character_atlas.load_frames(walking_paths, flipped_horizontally=True),
+        walk_right=character_atlas.load_frames(walking_paths),
+        stand_left=character_atlas.load_frames([standing_path], flipped_horizontally=True),
+        stand_right=character_atlas.load_frames([standing_path]),
+        climb=character_atlas.load_frames(climbing_paths),
+    )
+
+
 class Player:
     """
     Controls the player animations (images for the various positions) and movements
@@ -12,9 +42,6 @@ class Player:
     def __init__(self):
         self.sprite = self.create_player_sprite()
         self.physics_engine = None
-        self.jump_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "jump.wav")
-        )
         self.name = ""
         self.score = 0
 
@@ -28,53 +55,18 @@ class Player:
         Returns:
             The properly set up player sprite
         """
-        # Where are the player images stored?
-        texture_path = ASSETS_PATH / "images" / "player"
-
-        # Set up the appropriate textures
-        walking_paths = [
-            #texture_path / f"alienGreen_walk{x}.png" for x in (1, 2)  # TODO make configurable!!!!
-            texture_path / f"megaman_walk{x}.png" for x in (1, 2)
-        ]
-        climbing_paths = [
-            #texture_path / f"alienGreen_climb{x}.png" for x in (1, 2)
-            texture_path / f"megaman_climb{x}.png" for x in (1, 2)
-        ]
-        #standing_path = texture_path / "alienGreen_stand.png"
-        standing_path = texture_path / "megaman_stand.png"
-
-        # Load them all now
-        walking_right_textures = [
-            arcade.load_texture(texture) for texture in walking_paths
-        ]
-        walking_left_textures = [
-            arcade.load_texture(texture, mirrored=True)
-            for texture in walking_paths
-        ]
-
-        walking_up_textures = [
-            arcade.load_texture(texture) for texture in climbing_paths
-        ]
-        walking_down_textures = [
-            arcade.load_texture(texture) for texture in climbing_paths
-        ]
-
-        standing_right_textures = [arcade.load_texture(standing_path)]
-
-        standing_left_textures = [
-            arcade.load_texture(standing_path, mirrored=True)
-        ]
+        textures = load_player_textures()
 
         # Create the sprite
         player = arcade.AnimatedWalkingSprite()
 
         # Add the proper textures
-        player.stand_left_textures = standing_left_textures
-        player.stand_right_textures = standing_right_textures
-        player.walk_left_textures = walking_left_textures
-        player.walk_right_textures = walking_right_textures
-        player.walk_up_textures = walking_up_textures
-        player.walk_down_textures = walking_down_textures
+        player.stand_left_textures = textures.stand_left
+        player.stand_right_textures = textures.stand_right
+        player.walk_left_textures = textures.walk_left
+        player.walk_right_textures = textures.walk_right
+        player.walk_up_textures = textures.climb
+        player.walk_down_textures = textures.climb
 
         # Set the player defaults
         player.center_x = PLAYER_START_X
@@ -107,8 +99,9 @@ class Player:
     def reset_change_y(self):
         self.sprite.change_y = 0
 
-    def jump(self):
+    def jump(self) -> bool:
+        """Jumps when the player can, and tells whether it did, for the view to play the jump sound"""
         if self.physics_engine.can_jump():
             self.sprite.change_y = PLAYER_JUMP_SPEED
-            # Play the jump sound
-            arcade.play_sound(self.jump_sound)
+            return True
+        return False
@@ -0,0 +1,75 @@
+from threading import Event, Thread
+from timeit import default_timer
+from typing import List, Optional
+
+import arcade
+from pyglet import media
+
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH, RESIDENT_SOUNDS
+from log.config_log import logger
+
+
+class AudioWarmup:
+    """
+    Gets the audio ready on a background thread, while the welcome screen shows
+
+    Opening the audio device and decoding the sound effects used to be done when the first sound of
+    the game played, which made it lag. The warm-up opens the audio driver, then decodes the sound
+    effects into the asset manager and keeps them there, so the game view finds them in memory.
+    """
+    def __init__(self, sound_names: List[str]) -> None:
+        """
+        Arguments:
+            sound_names -- The sound effects to decode, in the sounds folder
+        """
+        self.sound_names = sound_names
+        # The sounds decoded, held for the whole run of the game
+        self.sounds: List[arcade.Sound] = []
+        # Set once the audio driver is open, sounds can play from then on
+        self.driver_ready = Event()
+        # Seconds the warm-up took, once done
+        self.duration: Optional[float] = None
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        """Starts the warm-up, unless it already ran"""
+        if self._thread is not None:
+            return
+        self._thread = Thread(target=self._run, name="AudioWarmup", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        start = default_timer()
+        try:
+            media.get_audio_driver()
+        except Exception:
+            logger.exception("Opening the audio driver failed")
+        finally:
+            # Nobody must wait on a driver that won't come, the sounds will open it when they play
+            self.driver_ready.set()
+
+        for name in self.sound_names:
+            try:
+                self.sounds.append(asset_manager.load_sound(ASSETS_PATH / "sounds" / name))
+            except Exception:
+                logger.exception(f"Decoding {name} failed, it will be loaded by the game")
+
+        self.duration = default_timer() - start
+        logger.info(f"Audio warmed up in {self.duration * 1000:.1f} ms, {len(self.sounds)} sounds decoded")
+
+    @property
+    def done(self) -> bool:
+        return self.duration is not None
+
+    def wait(self) -> None:
+        """Waits for the warm-up to finish, if it was started, so the sounds aren't loaded twice at once"""
+        if self._thread is None or self.done:
+            return
+        start = default_timer()
+        self._thread.join()
+        logger.info(f"Waited {(default_timer() - start) * 1000:.1f} ms for the audio warm-up")
+
+
+# Started by the welcome view, the game view only waits for it
+audio_warmup = AudioWarmup(RESIDENT_SOUNDS)
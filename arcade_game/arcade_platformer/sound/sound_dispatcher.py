@@ -0,0 +1,130 @@
+from math import inf
+from timeit import default_timer
+from typing import Callable, Dict, List, NamedTuple
+
+import arcade
+from pyglet import media
+
+
+class SoundPolicy(NamedTuple):
+    """How a sound effect may be played"""
+    # Most copies of the sound playing at once, the oldest copy is cut for a new one
+    polyphony: int = 1
+    # Seconds before the sound can start again, requests in between are dropped
+    min_interval: float = 0.0
+    # When all the channels are busy, a sound can only take the channel of a sound with the same or a lower priority
+    priority: int = 0
+    volume: float = 1.0
+
+
+class Voice(NamedTuple):
+    """A sound effect playing"""
+    sound: arcade.Sound
+    player: media.Player
+    start: float
+    # When the sound will have played to the end
+    end: float
+    priority: int
+
+
+class SoundDispatcher:
+    """
+    Plays the sound effects within limits, so a burst of events doesn't start a burst of players
+
+    Sounds are requested with play() during the frame and started by flush() at its end: the same sound
+    requested several times in a frame plays once. Each sound has a policy: how many copies may play at
+    once, and how soon it may start again. At most max_voices sounds play at once, beyond that a new sound
+    takes the channel of the oldest sound with the lowest priority, or isn't played.
+    """
+    def __init__(self, max_voices: int, clock: Callable[[], float] = default_timer) -> None:
+        """
+        Arguments:
+            max_voices -- Most sound effects playing at once
+            clock -- Current time in seconds
+        """
+        self.max_voices = max_voices
+        self.clock = clock
+        self.policies: Dict[arcade.Sound, SoundPolicy] = {}
+        # Sounds requested during the frame, a dict keeps the order of the requests
+        self.requests: Dict[arcade.Sound, None] = {}
+        self.voices: List[Voice] = []
+        self.last_start: Dict[arcade.Sound, float] = {}
+
+        # Some stats to check the limits are right
+        self.played = 0
+        # Requested again in the same frame
+        self.collapsed = 0
+        # Requested again before its minimum interval
+        self.throttled = 0
+        # Cut to make room for another sound
+        self.stolen = 0
+        # No channel free for its priority
+        self.dropped = 0
+
+    def register(self, sound: arcade.Sound, policy: SoundPolicy) -> None:
+        self.policies[sound] = policy
+
+    def play(self, sound: arcade.Sound) -> None:
+        """Asks for a sound to play at the end of the frame"""
+        if sound in self.requests:
+            self.collapsed += 1
+        else:
+            self.requests[sound] = None
+
+    def flush(self) -> None:
+        """Starts the sounds requested during the frame"""
+        if not self.requests:
+            return
+        now = self.clock()
+        self.voices = [voice for voice in self.voices if voice.end > now]
+
+        # The most important sounds get the free channels first
+        for sound in sorted(self.requests, key=lambda requested: -self.get_policy(requested).priority):
+            self._start(sound, now)
+        self.requests.clear()
+
+    def get_policy(self, sound: arcade.Sound) -> SoundPolicy:
+        return self.policies.get(sound) or SoundPolicy()
+
+    def _start(self, sound: arcade.Sound, now: float) -> None:
+        policy = self.get_policy(sound)
+        if now - self.last_start.get(sound, -inf) < policy.min_interval:
+            self.throttled += 1
+            return
+
+        copies = [voice for voice in self.voices if voice.sound is sound]
+        if len(copies) >= policy.polyphony:
+            # Restart the sound rather than adding a copy
+            self._stop(copies[0])
+        elif len(self.voices) >= self.max_voices:
+            victim = min(self.voices, key=lambda voice: (voice.priority, voice.start))
+            if victim.priority > policy.priority:
+                self.dropped += 1
+                return
+            self._stop(victim)
+
+        player = sound.play(volume=policy.volume)
+        self.voices.append(Voice(sound, player, now, now + sound.get_length(), policy.priority))
+        self.last_start[sound] = now
+        self.played += 1
+
+    def _stop(self, voice: Voice) -> None:
+        voice.sound.stop(voice.player)
+        self.voices.remove(voice)
+        self.stolen += 1
+
+    def stop_all(self) -> None:
+        """Cuts every sound effect, and forgets the requests not played yet"""
+        for voice in self.voices:
+            voice.sound.stop(voice.player)
+        self.voices.clear()
+        self.requests.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "played": self.played,
+            "collapsed": self.collapsed,
+            "throttled": self.throttled,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+        }
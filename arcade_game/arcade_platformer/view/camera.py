@@ -0,0 +1,79 @@
+from typing import Tuple
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import SCREEN_HEIGHT, SCREEN_WIDTH
+from .viewport import follow_player
+
+Projection = Tuple[float, float, float, float]
+
+
+class Camera:
+    """
+    Shows a screen sized part of the world, from its bottom left corner
+
+    use() sends the projection to OpenGL only when it isn't the one in use already.
+    The camera left at the origin is the GUI camera, what is drawn with it stays on the screen.
+    """
+    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT) -> None:
+        self.width = width
+        self.height = height
+        self.left = 0
+        self.bottom = 0
+
+    def get_projection(self, left: float, bottom: float) -> Projection:
+        return left, left + self.width, bottom, bottom + self.height
+
+    def use(self) -> None:
+        """Draws what comes next through this camera"""
+        self.set_projection(self.get_projection(self.left, self.bottom))
+
+    def set_projection(self, projection: Projection) -> None:
+        ctx = arcade.get_window().ctx
+        if ctx.projection_2d != projection:
+            ctx.projection_2d = projection
+
+
+class WorldCamera(Camera):
+    """
+    Follows the player through the level, scrolling only when the player gets close to the edges of the screen
+
+    The camera moves with the game ticks, and is drawn between its positions of the last two ticks,
+    like the player.
+    """
+    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT) -> None:
+        super().__init__(width, height)
+        # The camera doesn't scroll past the edges of the map
+        self.map_width = 0
+        # Position before the last tick
+        self.previous_position = (0, 0)
+
+    def reset(self) -> None:
+        """Goes back to the beginning of the level, without scrolling from where the camera was"""
+        self.left = 0
+        self.bottom = 0
+        self.record_previous_position()
+
+    def record_previous_position(self) -> None:
+        self.previous_position = (self.left, self.bottom)
+
+    def follow(self, player_sprite: arcade.Sprite) -> None:
+        """Scrolls when the player has gone past the margins of the screen"""
+        self.left, self.bottom = follow_player(self.left, self.bottom, player_sprite, self.map_width)
+
+    def use_between(self, alpha: float) -> Projection:
+        """Draws what comes next from between the last two positions of the camera
+
+        Arguments:
+            alpha -- 0 for the previous tick, 1 for the last one
+
+        Returns:
+            What the camera shows: left, right, bottom and top in pixels
+        """
+        previous_left, previous_bottom = self.previous_position
+        # Only scroll to integers, otherwise we end up with pixels that don't line up on the screen.
+        left = int(previous_left + (self.left - previous_left) * alpha)
+        bottom = int(previous_bottom + (self.bottom - previous_bottom) * alpha)
+        projection = self.get_projection(left, bottom)
+        self.set_projection(projection)
+        return projection
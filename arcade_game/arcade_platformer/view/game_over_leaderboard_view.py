@@ -1,6 +1,7 @@
 import arcade
 
 from arcade_game.arcade_platformer.config.config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_PATH
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
 from . import platform_view
 from arcade_game.arcade_platformer.player.player import Player
 from arcade_game.arcade_platformer.helpers.speech_recognition import SpeechRecognition
@@ -15,8 +16,6 @@ class GameOverLeaderboardView(LeaderboardView):
         super().__init__(player=player, speech_recognition=speech_recognition)
 
         # Load and play Game over music
-        self.sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "game_over.wav")  # TODO leaderboard sound ?
-        )
+        self.sound = asset_manager.load_sound(ASSETS_PATH / "sounds" / "game_over.wav")  # TODO leaderboard sound ?
         # Play the game over sound
         self.sound_player = self.sound.play(volume=0.3)
@@ -1,8 +1,10 @@
 import arcade
 
 from arcade_game.arcade_platformer.config.config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_PATH
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
 from . import platform_view, game_over_leaderboard_view
 from arcade_game.arcade_platformer.player.player import Player
+from arcade_game.arcade_platformer.helpers.idle_throttle import IdleThrottle
 from arcade_game.arcade_platformer.helpers.speech_recognition import SpeechRecognition
 
 class GameOverView(arcade.View):
@@ -20,9 +22,7 @@ class GameOverView(arcade.View):
         self.speech_recognition = speech_recognition
 
         # Load and play Game over music
-        self.game_over_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "game_over.wav")
-        )
+        self.game_over_sound = asset_manager.load_sound(ASSETS_PATH / "sounds" / "game_over.wav")
         # Play the game over sound
         self.sound_player = self.game_over_sound.play(volume=0.3)
 
@@ -30,7 +30,7 @@ class GameOverView(arcade.View):
         game_over_image_path = ASSETS_PATH / "images" / "game_over.png"
 
         # Load our game over image
-        self.game_over_image = arcade.load_texture(game_over_image_path)
+        self.game_over_image = asset_manager.load_texture(game_over_image_path)
 
         # Set our display timer
         self.display_timer = 2.0
@@ -38,10 +38,20 @@ class GameOverView(arcade.View):
         # Are we showing the instructions?
         self.show_instructions = False
 
+        # The screen only changes when the instructions blink, it is drawn at a low rate otherwise
+        self.idle_throttle = IdleThrottle()
+
         # Reset the viewport, necessary if we have a scrolling game, and we need
         # to reset the viewport back to the start, so we can see what we draw.
         arcade.set_viewport(0, SCREEN_WIDTH - 1, 0, SCREEN_HEIGHT - 1)
 
+    def on_show_view(self) -> None:
+        self.idle_throttle.start(self.window)
+
+    def on_hide_view(self) -> None:
+        asset_manager.release(self.game_over_sound, self.game_over_image)
+        self.idle_throttle.stop()
+
     def on_update(self, delta_time: float) -> None:
         """Manages the timer to toggle the instructions
 
@@ -59,6 +69,7 @@ class GameOverView(arcade.View):
 
             # And reset the timer so the instructions flash slowly
             self.display_timer = 1.0
+            self.idle_throttle.request_redraw()
 
     def on_draw(self) -> None:
         self.clear()
@@ -93,6 +104,7 @@ class GameOverView(arcade.View):
             key -- Which key was pressed
             modifiers -- What modifiers were active
         """
+        self.idle_throttle.request_redraw()
         if key == arcade.key.RETURN:
             # Stop Game Over music
             self.game_over_sound.stop(self.sound_player)
@@ -0,0 +1,115 @@
+from typing import Dict, Tuple
+
+import arcade
+import pyglet
+from pyglet.math import Mat4, Vec3
+
+from arcade_game.arcade_platformer.config.config import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Height of the text line, in screen coordinates
+HUD_Y = 615
+# The red shadow is drawn behind the white text, slightly to the left
+SHADOW_OFFSET = 2
+SHADOW_COLOR = arcade.csscolor.RED + (255,)
+TEXT_COLOR = arcade.csscolor.WHITE + (255,)
+FONT_NAME = ("calibri", "arial")
+
+
+class Hud:
+    """
+    The score, the lives, the level and the game time shown at the top of the game view,
+    with the fade and the message of the transitions under them
+
+    Each text is a label kept from one frame to the next, with its red shadow. A label is only laid out
+    again when its text changes, at most once a second for the timer, and all of them are drawn at once
+    from the same batch. They are placed on the screen, not in the level: the batch is moved to where the
+    world camera is with pyglet's view matrix, the projection of the level isn't changed to draw them.
+    """
+    def __init__(self, font_size: int) -> None:
+        """
+        Arguments:
+            font_size -- Size of the text
+        """
+        self.font_size = font_size
+        self.batch = pyglet.graphics.Batch()
+        # Back to front: the fade over the level, the message, the black bar, the shadows and the texts
+        self.fade_group = pyglet.graphics.Group(order=0)
+        self.message_group = pyglet.graphics.Group(order=1)
+        self.bar_group = pyglet.graphics.Group(order=2)
+        self.shadow_group = pyglet.graphics.Group(order=3)
+        self.text_group = pyglet.graphics.Group(order=4)
+
+        self.fade = pyglet.shapes.Rectangle(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT, color=(0, 0, 0, 0),
+                                            batch=self.batch, group=self.fade_group)
+        self.message = pyglet.text.Label("", font_name=FONT_NAME, font_size=font_size * 3, color=TEXT_COLOR,
+                                         x=SCREEN_WIDTH / 2, y=SCREEN_HEIGHT / 2, anchor_x="center",
+                                         anchor_y="center", batch=self.batch, group=self.message_group)
+        self.bar = pyglet.shapes.Rectangle(0, HUD_Y - 15, SCREEN_WIDTH, 50, color=arcade.color.BLACK,
+                                           batch=self.batch, group=self.bar_group)
+
+        # Shadow and text labels, by name
+        self.labels: Dict[str, Tuple[pyglet.text.Label, pyglet.text.Label]] = {}
+
+        self.add_label("title", 30)
+        self.add_label("game_time", 270)
+        self.add_label("level_score_title", 600, "Score:")
+        self.add_label("level_score", 700)
+        self.add_label("total_score_title", 750, "Total:")
+        self.add_label("total_score", 850)
+        self.add_label("life_count_title", 905, "Lives:")
+        self.add_label("life_count", 980)
+
+    def add_label(self, name: str, x: int, text: str = "") -> None:
+        """Creates a text with its shadow
+
+        Arguments:
+            name -- How the text is changed by set_text()
+            x -- Left of the shadow, in screen coordinates
+            text -- What the label shows first
+        """
+        self.labels[name] = tuple(
+            pyglet.text.Label(text, font_name=FONT_NAME, font_size=self.font_size, color=color, x=label_x, y=HUD_Y,
+                              batch=self.batch, group=group)
+            for label_x, color, group in ((x, SHADOW_COLOR, self.shadow_group),
+                                          (x + SHADOW_OFFSET, TEXT_COLOR, self.text_group))
+        )
+
+    def set_text(self, name: str, text: str) -> None:
+        """Changes the text of a label, it is laid out again only when the text is different"""
+        shadow, label = self.labels[name]
+        if label.text != text:
+            shadow.text = text
+            label.text = text
+
+    def update(self, player_name: str, level: int, game_time: int, level_score: int, total_score: int,
+               life_count: int) -> None:
+        """Shows the current values, this is cheap when nothing changed"""
+        self.set_text("title", f"{player_name} - Level: {level} - Time:")
+        self.set_text("game_time", str(game_time))
+        self.set_text("level_score", str(level_score))
+        self.set_text("total_score", str(total_score))
+        self.set_text("life_count", str(life_count))
+
+    def update_transition(self, message: str, fade: float) -> None:
+        """Shows the message of a transition in the middle of the screen, and fades the level out
+
+        Arguments:
+            message -- The text, empty for none
+            fade -- 0 to see the level, 1 to hide it completely
+        """
+        if self.message.text != message:
+            self.message.text = message
+        self.fade.opacity = int(255 * fade)
+
+    def draw(self, left: float, bottom: float) -> None:
+        """Draws all the labels at the top of the screen
+
+        Arguments:
+            left, bottom -- The bottom left corner of what the world camera shows, in pixels
+        """
+        window = arcade.get_window()
+        with window.ctx.pyglet_rendering():
+            # The projection is the one of the world camera, move the screen to where it is
+            window.view = Mat4.from_translation(Vec3(left, bottom, 0))
+            self.batch.draw()
+            window.view = Mat4()
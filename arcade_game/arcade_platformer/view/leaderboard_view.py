@@ -1,11 +1,12 @@
 import arcade
 
 from arcade_game.arcade_platformer.config.config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_PATH
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
 from . import welcome_view, player_name_view
 from arcade_game.arcade_platformer.player.player import Player
+from arcade_game.arcade_platformer.helpers.idle_throttle import IdleThrottle
 from arcade_game.arcade_platformer.helpers.speech_recognition import SpeechRecognition
 import arcade.gui as gui
-from arcade import load_texture
 from arcade_game.arcade_platformer.utils.leaderboard import Leaderboard
 
 class LeaderboardView(arcade.View):
@@ -24,7 +25,7 @@ class LeaderboardView(arcade.View):
         leaderboard_image_path = ASSETS_PATH / "images" / "leaderboard.png" 
 
         # Load our game over image
-        self.leaderboard_image = arcade.load_texture(leaderboard_image_path)
+        self.leaderboard_image = asset_manager.load_texture(leaderboard_image_path)
 
         # Set our display timer
         self.display_timer = 2.0
@@ -32,6 +33,9 @@ class LeaderboardView(arcade.View):
         # Are we showing the instructions?
         self.show_instructions = False
 
+        # The screen only changes when the instructions blink, it is drawn at a low rate otherwise
+        self.idle_throttle = IdleThrottle()
+
         # Reset the viewport, necessary if we have a scrolling game, and we need
         # to reset the viewport back to the start, so we can see what we draw.
         arcade.set_viewport(0, SCREEN_WIDTH - 1, 0, SCREEN_HEIGHT - 1)
@@ -41,7 +45,19 @@ class LeaderboardView(arcade.View):
         self.leaderboard = Leaderboard()
         self.leaderboard.add_score(name=self.player.name, score=self.player.score)
         self.leaderboard.save()
-        self.bg_tex = load_texture(":resources:gui_basic_assets/window/grey_panel.png")
+        self.bg_tex = asset_manager.load_texture(":resources:gui_basic_assets/window/grey_panel.png")
+        # The scores don't change while the screen shows, their widgets are added once
+        self.display_leaderboard()
+
+    def on_show_view(self) -> None:
+        self.idle_throttle.start(self.window)
+
+    def on_hide_view(self) -> None:
+        self.idle_throttle.stop()
+        # The sound is loaded by the subclasses
+        asset_manager.release(self.leaderboard_image, self.bg_tex)
+        if self.sound is not None:
+            asset_manager.release(self.sound)
 
     def on_update(self, delta_time: float) -> None:
         """Manages the timer to toggle the instructions
@@ -60,6 +76,7 @@ class LeaderboardView(arcade.View):
 
             # And reset the timer so the instructions flash slowly
             self.display_timer = 1.0
+            self.idle_throttle.request_redraw()
 
     def on_draw(self) -> None:
         self.clear()
@@ -85,8 +102,6 @@ class LeaderboardView(arcade.View):
                 font_size=25,
             )
         self.manager.draw()
-        
-        self.display_leaderboard()
 
     def display_leaderboard(self):
         text_area = gui.UITextArea(x=100,
@@ -110,6 +125,7 @@ class LeaderboardView(arcade.View):
     def check_message_queue(self):
         if not self.speech_recognition.message_queue.empty():
             message = self.speech_recognition.message_queue.get()
+            self.idle_throttle.request_redraw()
             if(message=="start"):
                  self.start_game()
             if(message=="menu"):
@@ -124,6 +140,10 @@ class LeaderboardView(arcade.View):
         _welcome_view = welcome_view.WelcomeView(self.player, self.speech_recognition)
         self.window.show_view(_welcome_view)
 
+    def on_mouse_scroll(self, x: int, y: int, scroll_x: int, scroll_y: int):
+        """The scores scroll with the mouse wheel"""
+        self.idle_throttle.request_redraw()
+
     def on_key_press(self, key: int, modifiers: int):
         """Restarts the game when the user presses the enter key
 
@@ -131,6 +151,7 @@ class LeaderboardView(arcade.View):
             key -- Which key was pressed
             modifiers -- What modifiers were active
         """
+        self.idle_throttle.request_redraw()
         if key == arcade.key.RETURN:
             # Stop Game Over music
             self.sound.stop(self.sound_player)
@@ -139,4 +160,4 @@ class LeaderboardView(arcade.View):
             self.start_game()
         if key == arcade.key.BACKSPACE:
             self.sound.stop(self.sound_player)
-            self.show_menu()
\ No newline at end of file
+            self.show_menu()
@@ -0,0 +1,100 @@
+from typing import Optional, Tuple
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import CHUNKED_DRAWING, CHUNKED_DRAWING_MIN_SCREENS, CHUNK_WIDTH, \
+    BAKE_STATIC_LAYERS, BAKED_LAYERS_MEMORY_BUDGET, SCREEN_WIDTH
+from arcade_game.arcade_platformer.helpers.frame_profiler import FrameProfiler
+from arcade_game.arcade_platformer.level.baked_layers import BakedLayers
+from arcade_game.arcade_platformer.level.chunked_layer import CullingStats
+from arcade_game.arcade_platformer.level.level import Level
+from log.config_log import logger
+
+# The layers of the map drawn first, which never change: they can be drawn once in textures
+STATIC_LAYERS = ("background", "ground")
+# The layers of the map drawn, back to front. Not all maps have ladders or traps.
+DRAWN_LAYERS = STATIC_LAYERS + ("coins", "goal", "ladders", "traps")
+
+
+class LevelRenderer:
+    """
+    Draws the layers of the level being played, under the player and the enemies
+
+    The static layers are drawn from textures when BAKE_STATIC_LAYERS is set, the other layers as sprites,
+    split in columns on the maps wide enough for it, whole otherwise. The game view and the benchmarks draw
+    the level through it.
+    """
+    def __init__(self, profiler: Optional[FrameProfiler] = None) -> None:
+        """
+        Arguments:
+            profiler -- Counts the sprites and columns drawn each frame, when set
+        """
+        self.profiler = profiler
+        # The layers drawn as sprites: whole or split in columns
+        self.level_layers = []
+        # Whether the layers of the current level are split in columns
+        self.chunked = False
+        # The static layers drawn in textures for the current level, None when they are drawn as sprites
+        self.baked_layers: Optional[BakedLayers] = None
+
+    def show(self, level: Level) -> None:
+        """Prepares the layers of a level for drawing, the ones of the previous level are dropped"""
+        # Set the background color
+        background_color = level.background_color or arcade.color.FRESH_AIR
+        arcade.set_background_color(background_color)
+
+        drawn_layers = self.bake_static_layers(level, background_color)
+        self.chunked = CHUNKED_DRAWING and level.map_width >= CHUNKED_DRAWING_MIN_SCREENS * SCREEN_WIDTH
+        if self.chunked:
+            layers = [level.get_chunked_layer(name) for name in drawn_layers]
+        else:
+            layers = [level.sprite_lists.get(name) for name in drawn_layers]
+        self.level_layers = [layer for layer in layers if layer is not None]
+
+    def bake_static_layers(self, level: Level, background_color: arcade.Color) -> Tuple[str, ...]:
+        """Draws the static layers of the level in textures
+
+        Returns:
+            The layers still drawn as sprites
+        """
+        self.delete_baked_layers()
+        if not BAKE_STATIC_LAYERS:
+            return DRAWN_LAYERS
+
+        static_layers = [level.sprite_lists[name] for name in STATIC_LAYERS if name in level.sprite_lists]
+        self.baked_layers = BakedLayers.create(static_layers, CHUNK_WIDTH, background_color,
+                                               BAKED_LAYERS_MEMORY_BUDGET)
+        if self.baked_layers is None:
+            return DRAWN_LAYERS
+        logger.info(f"Static layers baked in {len(self.baked_layers.columns)} textures, "
+                    f"{self.baked_layers.texture_bytes / 2 ** 20:.1f} MB")
+        return DRAWN_LAYERS[len(STATIC_LAYERS):]
+
+    def delete_baked_layers(self) -> None:
+        if self.baked_layers is not None:
+            self.baked_layers.delete()
+            self.baked_layers = None
+
+    def draw(self, left: float, right: float) -> None:
+        """Draws the layers of the level, only their columns between left and right when they are split
+
+        Arguments:
+            left, right -- What the camera shows, in pixels
+        """
+        if self.baked_layers is not None:
+            self.count_drawn(self.baked_layers.draw(left, right))
+
+        if not self.chunked:
+            for sprite_list in self.level_layers:
+                sprite_list.draw()
+            return
+
+        for layer in self.level_layers:
+            self.count_drawn(layer.draw(left, right))
+
+    def count_drawn(self, stats: CullingStats) -> None:
+        """Adds what a layer drew to the counters of the frame profiler"""
+        if self.profiler is not None:
+            self.profiler.count("chunks_drawn", stats.chunks_drawn)
+            self.profiler.count("sprites_drawn", stats.sprites_drawn)
+            self.profiler.count("sprites_culled", stats.sprites_total - stats.sprites_drawn)
@@ -1,29 +1,73 @@
-import logging
-from time import sleep
-from timeit import default_timer
+from datetime import datetime
+from typing import Optional
 import arcade
 
-from arcade_game.arcade_platformer.config.config import SCREEN_WIDTH, SCREEN_HEIGHT, TOTAL_LIFE_COUNT, ASSETS_PATH, \
-    MAP_SCALING, PLAYER_START_X, PLAYER_START_Y, GRAVITY, LEFT_VIEWPORT_MARGIN, RIGHT_VIEWPORT_MARGIN, \
-    TOP_VIEWPORT_MARGIN, BOTTOM_VIEWPORT_MARGIN
+from arcade_game.arcade_platformer.config.config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_PATH, TICK_RATE, \
+    MAX_TICKS_PER_UPDATE, INTERPOLATE_RENDERING, RECORD_REPLAYS, PROFILE_FRAMES, PROFILER_CAPACITY, FRAME_BUDGET, \
+    TRACES_PATH, COUNTDOWN_DURATION, DEATH_DURATION, LEVEL_CLEAR_DURATION, SFX_MAX_VOICES
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
+from arcade_game.arcade_platformer.asset.character_atlas import character_atlas
+from arcade_game.arcade_platformer.asset.music import open_music
+from arcade_game.arcade_platformer.engine.game_engine import Command, GameEngine, GameEvent
+from arcade_game.arcade_platformer.engine.replay import Replay
 from arcade_game.arcade_platformer.player.player import Player
-from arcade_game.arcade_platformer.enemy.enemy import Enemy
+from arcade_game.arcade_platformer.sound.audio_warmup import audio_warmup
+from arcade_game.arcade_platformer.sound.sound_dispatcher import SoundDispatcher, SoundPolicy
 from . import game_over_view, winner_view
+from .hud import Hud
+from .camera import WorldCamera
+from .level_renderer import LevelRenderer
+from .profiler_overlay import ProfilerOverlay
+from arcade_game.arcade_platformer.helpers.fixed_timestep import FixedTimestep
+from arcade_game.arcade_platformer.helpers.frame_profiler import FrameProfiler
+from arcade_game.arcade_platformer.helpers.phase_timer import NoPhaseTimer
 from arcade_game.arcade_platformer.helpers.speech_recognition import SpeechRecognition
+from arcade_game.arcade_platformer.helpers.transition import Transition, TransitionState
+from log.config_log import logger
 
 
 class PlatformerView(arcade.View):
     """
     Displays the platform game view, where you can interact with the player
+
+    The game logic runs in a GameEngine, the view turns the keys and voice commands into engine commands,
+    draws the engine state and plays the sounds of the engine events.
     """
-    def __init__(self, player: Player, speech_recognition: SpeechRecognition) -> None:
-        """The init method runs only once when the game starts"""
+    # Whether the games start with the frame profiler on, main.py --profile sets it
+    profile_frames = PROFILE_FRAMES
+
+    def __init__(self, player: Player, speech_recognition: Optional[SpeechRecognition],
+                 replay: Optional[Replay] = None) -> None:
+        """The init method runs only once when the game starts
+
+        Arguments:
+            player -- The player
+            speech_recognition -- The voice commands, None when playing back a replay
+            replay -- A recorded run to play back instead of the keyboard and voice commands
+        """
         super().__init__()
 
         self.player = player
 
         self.speech_recognition = speech_recognition
-        # logging.info(self.speech_recognition)
+
+        # Runs the game logic
+        self.replay = replay
+        # The player and the enemies draw from the atlas of the characters, with all their frames in it
+        self.engine = GameEngine(self.player, level=replay.start_level if replay else 1,
+                                 atlas=character_atlas.get_atlas())
+        # Commands received since the last tick
+        self.pending_commands = []
+        # Record the game, unless it is a replay already
+        if RECORD_REPLAYS and replay is None:
+            self.engine.replay = Replay(start_level=self.engine.level)
+
+        # Times the phases of each frame, the engine phases included, once start_profiling() is called
+        self.profiler: Optional[FrameProfiler] = None
+        self.timer = NoPhaseTimer()
+        # F3 shows the profiler overlay
+        self.show_profiler = False
+        self.profiler_overlay: Optional[ProfilerOverlay] = None
 
         # These lists will hold different sets of sprites
         self.coins = None
@@ -32,224 +76,154 @@ class PlatformerView(arcade.View):
         self.ladders = None
         self.goals = None
         self.traps = None
+        self.enemies = self.engine.enemies
+        # Draws the layers of the current level
+        self.level_renderer = LevelRenderer()
+        if self.profile_frames:
+            self.start_profiling()
 
         self.font_size = 16
+        # Score, lives, level and time, at the top of the screen
+        self.hud = Hud(self.font_size)
         # Avoids leaving the mouse pointer in the middle
         self.window.set_mouse_visible(False)
 
         # One sprite for the player, no more is needed
         self.player_sprite = self.player.sprite
-
-        # We need a physics engine as well
-        self.physics_engine = None
-
-        # Someplace to keep score for level and game
-        self.level_score = 0
-
-        # Life count init
-        self.life_count = TOTAL_LIFE_COUNT
-
-        # Start the timer
-        self.time_start = default_timer()  # integer, expressing the time in seconds
-
-        # Which level are we on?
-        self.level = 1
-
-        # Instantiate some variables that we will initialise in the setup function
-        self.map_width = 0
-        self.view_left = 0
-        self.view_bottom = 0
-
-        # Load up our sound effects here
-        self.ready_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "ready.wav")
-        )
-        self.go_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "go.wav")
-        )
-        self.coin_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "coin.wav")
-        )
-        self.jump_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "jump.wav")
-        )
-        self.level_victory_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "level_victory.wav")
-        )
-        self.death_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "death.wav")
-        )
-        self.background_music = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "background.wav")
-        )
+        self.player_list = arcade.SpriteList(atlas=character_atlas.get_atlas())
+        self.player_list.append(self.player_sprite)
+
+        # The level scrolls with the world camera
+        self.camera = WorldCamera()
+
+        # The game logic runs at a fixed rate, the display draws the moving sprites between two ticks
+        self.timestep = FixedTimestep(TICK_RATE, MAX_TICKS_PER_UPDATE)
+        # Player position before the last tick
+        self.previous_player_position = self.player_sprite.position
+        # Pauses the game logic for a while, the countdown, a death or the end of a level
+        self.transition = Transition()
+
+        # Load up our sound effects here, the warm-up of the welcome screen has decoded them already
+        audio_warmup.wait()
+        self.ready_sound = asset_manager.load_sound(ASSETS_PATH / "sounds" / "ready.wav")
+        self.go_sound = asset_manager.load_sound(ASSETS_PATH / "sounds" / "go.wav")
+        self.coin_sound = asset_manager.load_sound(ASSETS_PATH / "sounds" / "coin.wav")
+        self.jump_sound = asset_manager.load_sound(ASSETS_PATH / "sounds" / "jump.wav")
+        self.level_victory_sound = asset_manager.load_sound(ASSETS_PATH / "sounds" / "level_victory.wav")
+        self.death_sound = asset_manager.load_sound(ASSETS_PATH / "sounds" / "death.wav")
+        self.background_music = open_music(ASSETS_PATH / "sounds" / "background.wav")
         self.background_music_player = arcade.play_sound(self.background_music, 0.3, 0, True)
 
+        # The sound effects are started once per frame, within limits, however many events ask for them
+        self.sounds = SoundDispatcher(SFX_MAX_VOICES)
+        self.sounds.register(self.ready_sound, SoundPolicy(priority=2))
+        self.sounds.register(self.go_sound, SoundPolicy(priority=2))
+        self.sounds.register(self.level_victory_sound, SoundPolicy(priority=2))
+        self.sounds.register(self.death_sound, SoundPolicy(priority=2))
+        # Repeated "jump" voice commands must not stack the sound
+        self.sounds.register(self.jump_sound, SoundPolicy(polyphony=1, min_interval=0.15, priority=1))
+        # A row of coins picked up quickly rings a few times, not once per coin
+        self.sounds.register(self.coin_sound, SoundPolicy(polyphony=3, min_interval=0.05))
 
         # Play the game start sound animation
-        # There is a lag with the 1st sound played so to avoid having a lag during the game
-        # when we take the 1st coin we play a sound for the start of the game
-        arcade.play_sound(self.ready_sound)
-        sleep(1)
-        arcade.play_sound(self.go_sound)
+        self.sounds.play(self.ready_sound)
         self.setup()
+        # The level shows during the countdown, the game starts with the go sound
+        self.transition.start(TransitionState.COUNTDOWN, COUNTDOWN_DURATION,
+                              lambda: self.sounds.play(self.go_sound))
+
+    @property
+    def level(self) -> int:
+        """Which level are we on?"""
+        return self.engine.level
+
+    @property
+    def life_count(self) -> int:
+        return self.engine.life_count
+
+    @property
+    def level_score(self) -> int:
+        return self.engine.level_score
 
     def setup(self):
         """Sets up the game for the current level. This runs every time we load a new level"""
+        self.engine.setup()
+        self.show_level()
 
-        # Reset the level score
-        self.level_score = 0
+    def show_level(self):
+        """Displays the level the engine has just set up"""
+        current_level = self.engine.current_level
 
-        # Get the current map based on the level
-        map_name = f"platform_level_{self.level:02}.tmx"
-        map_path = ASSETS_PATH / map_name
+        # Load the layers
+        self.background = current_level.background
+        self.goals = current_level.goals
+        self.walls = current_level.walls
+        self.coins = current_level.coins
 
-        # use_spatial_hash : If set to True, this will make moving a sprite in the SpriteList slower,
-        # but it will speed up collision detection with items in the SpriteList.
-        # Great for doing collision detection with static walls/platforms.
-        layer_options = {
-            "background": {"use_spatial_hash": False},
-            "coins": {"use_spatial_hash": True},
-        }
+        # Not all maps have ladders or traps
+        self.ladders = current_level.ladders
+        self.traps = current_level.traps
 
-        # Load the current map
-        game_map = arcade.load_tilemap(
-            map_path, layer_options=layer_options, scaling=MAP_SCALING
-        )
+        # The background color, and the layers as they are drawn
+        self.level_renderer.show(current_level)
 
-        # Load the layers
-        self.background = game_map.sprite_lists["background"]
-        self.goals = game_map.sprite_lists["goal"]
-        self.walls = game_map.sprite_lists["ground"]
-        self.coins = game_map.sprite_lists["coins"]
+        # Find the edge of the map to control viewport scrolling
+        self.camera.map_width = current_level.map_width
 
-        # Only load ladders in maps with some ladders
-        if "ladders" in game_map.sprite_lists:
-            self.ladders = game_map.sprite_lists["ladders"]
+        # Sends the frames of the new kinds of enemies to the atlas now, rather than when they first show
+        character_atlas.get_atlas()
 
-        # Only load traps in maps with some traps
-        if "traps" in game_map.sprite_lists:
-            self.traps = game_map.sprite_lists["traps"]
+        self.reset_viewport()
 
-        # Set the background color
-        background_color = arcade.color.FRESH_AIR
-        if game_map.background_color:
-            background_color = game_map.background_color
-        arcade.set_background_color(background_color)
+    def reset_viewport(self):
+        """Scrolls back to the beginning of the level, where the player starts"""
+        # Don't draw the player and the camera between where they were and the start
+        self.camera.reset()
+        self.record_previous_positions()
 
-        # Find the edge of the map to control viewport scrolling
-        # game_map.width : width expressed in number of tiles
-        # game_map.tile_width : width of a given tile in pixels
-        # Subtracting 1 from game_map.width corrects for the tile indexing used by Tiled.
-        self.map_width = (game_map.width - 1) * game_map.tile_width
-
-        # Create the player sprite if they're not already set up
-        if not self.player_sprite:
-            self.player_sprite = Player().create_player_sprite()
-
-        # Move the player sprite back to the beginning
-        self.player_sprite.center_x = PLAYER_START_X
-        self.player_sprite.center_y = PLAYER_START_Y
-        self.player_sprite.change_x = 0
-        self.player_sprite.change_y = 0
-
-        # Set up our enemies
-        self.enemies = self.create_enemy_sprites()
-
-        # Reset the viewport (horizontal scroll)
-        self.view_left = 0
-        self.view_bottom = 0
-
-        # Load the physics engine for this map
-        self.physics_engine = arcade.PhysicsEnginePlatformer(
-            player_sprite=self.player_sprite,
-            platforms=self.walls,
-            gravity_constant=GRAVITY,
-            ladders=self.ladders,
-        )
-        self.player.set_physics_engine(self.physics_engine)
+    def record_previous_positions(self) -> None:
+        """Keeps the player position and the camera position before a tick, to draw them between two ticks"""
+        self.previous_player_position = self.player_sprite.position
+        self.camera.record_previous_position()
 
     def get_game_time(self) -> int:
         """Returns the number of seconds since the game was initialised"""
-        return int(default_timer() - self.time_start)
+        return self.engine.get_game_time()
 
     def scroll_viewport(self) -> None:
         """
-        Scrolls the viewport, horizontally and vertically, when the player gets close to the edges
-        This also catches the player falling from a platform, which counts as a death
+        Scrolls the world camera, horizontally and vertically, when the player gets close to the edges
         """
-        # Scroll left
-        # Find the current left boundary
-        left_boundary = self.view_left + LEFT_VIEWPORT_MARGIN
-
-        # Are we to the left of this boundary? Then we should scroll left.
-        if self.player_sprite.left < left_boundary:
-            self.view_left -= left_boundary - self.player_sprite.left
-            # But don't scroll past the left edge of the map
-            if self.view_left < 0:
-                self.view_left = 0
-
-        # Scroll right
-        # Find the current right boundary
-        right_boundary = self.view_left + SCREEN_WIDTH - RIGHT_VIEWPORT_MARGIN
-
-        # Are we to the right of this boundary? Then we should scroll right.
-        if self.player_sprite.right > right_boundary:
-            self.view_left += self.player_sprite.right - right_boundary
-            # Don't scroll past the right edge of the map
-            if self.view_left > self.map_width - SCREEN_WIDTH:
-                self.view_left = self.map_width - SCREEN_WIDTH
-
-        # Scroll up
-        top_boundary = self.view_bottom + SCREEN_HEIGHT - TOP_VIEWPORT_MARGIN
-        if self.player_sprite.top > top_boundary:
-            self.view_bottom += self.player_sprite.top - top_boundary
-
-        # Scroll down
-        bottom_boundary = self.view_bottom + BOTTOM_VIEWPORT_MARGIN
-        if self.player_sprite.bottom < bottom_boundary:
-            self.view_bottom -= bottom_boundary - self.player_sprite.bottom
-
-        # Catch a fall of the platform
-        # -300 rather than 0 is to let the player fall a bit longer, it looks better
-        if self.player_sprite.bottom < -300:
-            self.handle_player_death()
-            return
-
-        # Only scroll to integers, otherwise we end up with pixels that don't line up on the screen.
-        self.view_bottom = int(self.view_bottom)
-        self.view_left = int(self.view_left)
-
-        # Do the actual scrolling
-        arcade.set_viewport(
-            left=self.view_left,
-            right=SCREEN_WIDTH + self.view_left,
-            bottom=self.view_bottom,
-            top=SCREEN_HEIGHT + self.view_bottom,
-        )
+        # The projection is only changed when drawing, and when the camera moved
+        self.camera.follow(self.player_sprite)
 
     def handle_player_death(self):
         """
             The player has fallen off the platform or walked into a trap:
             - Play a death sound
-            - Decrease life counter
-            - Send it back to the beginning of the level
-            - Face the player forward
+            - Send the view back to the beginning of the level, or show the game over screen
         """
 
         # Play the death sound
-        arcade.play_sound(self.death_sound)
-        # Add 1 second of waiting time to let the user understand they fell
-        sleep(1)
-        # Decrease life count
-        self.life_count -= 1
-        # Check if the player has any life left, if not trigger the game over animation
-        if self.life_count == 0:
-            self.handle_game_over()
-        else:
-            # Back to the level's beginning
-            self.setup()
-            # Set the player to face right, otherwise it looks odd as the player still looks like falling
-            self.player_sprite.state = arcade.FACE_RIGHT
+        self.sounds.play(self.death_sound)
+        # Wait a bit to let the user understand they fell.
+        # The engine has already sent the player back to the level's beginning, or ended the game.
+        self.transition.start(TransitionState.DYING, DEATH_DURATION,
+                              self.handle_game_over if self.engine.finished else self.reset_viewport)
+
+    def on_hide_view(self):
+        """The game is over, the sounds may be dropped from memory when another game needs the room"""
+        asset_manager.release(self.ready_sound, self.go_sound, self.coin_sound, self.jump_sound,
+                              self.level_victory_sound, self.death_sound, self.background_music)
+        logger.info(f"Assets: {asset_manager.get_stats()}")
+        # The player sprite is kept for the next game, not this list
+        self.player_list.remove(self.player_sprite)
+        self.level_renderer.delete_baked_layers()
+        logger.info(f"Sound effects: {self.sounds.get_stats()}")
+
+    def start_next_level(self):
+        """Displays the level the engine has just loaded, from its beginning"""
+        self.show_level()
 
     def on_key_press(self, key: int, modifiers: int):
         """Processes key presses
@@ -261,21 +235,39 @@ class PlatformerView(arcade.View):
 
         # Check for player left or right movement
         if key in [arcade.key.LEFT, arcade.key.A]:  # Either left key or A key to go left
-            self.player.move_left()
+            self.pending_commands.append(Command.LEFT)
 
         elif key in [arcade.key.RIGHT, arcade.key.D]:  # Either right key or D key to go right
-            self.player.move_right()
+            self.pending_commands.append(Command.RIGHT)
 
         # Check if player can climb up or down
         elif key in [arcade.key.UP, arcade.key.W]:  # Either up key or W key to go up
-            self.player.move_up()
+            self.pending_commands.append(Command.UP)
 
-        elif key in [arcade.key.DOWN, arcade.key.D]:  # Either down key or D key to down
-            self.player.move_down()
+        elif key in [arcade.key.DOWN, arcade.key.S]:  # Either down key or S key to go down
+            self.pending_commands.append(Command.DOWN)
 
         # Check if player can jump
         elif key == arcade.key.SPACE:
-            self.player.jump()
+            self.pending_commands.append(Command.JUMP)
+
+        # Profiler overlay, the profiling starts with it the first time, and export of the last frames
+        elif key == arcade.key.F3:
+            if self.profiler is None:
+                self.start_profiling()
+            self.show_profiler = not self.show_profiler
+
+        elif key == arcade.key.F4 and self.profiler is not None:
+            self.profiler.export_chrome_trace(TRACES_PATH / f"frames_{datetime.now():%Y%m%d_%H%M%S}.json")
+
+    def start_profiling(self) -> None:
+        """Times the phases of every frame from now on, the engine phases included"""
+        self.profiler = FrameProfiler(PROFILER_CAPACITY, FRAME_BUDGET)
+        self.timer = self.profiler
+        self.engine.timer = self.profiler
+        self.level_renderer.profiler = self.profiler
+        self.profiler_overlay = ProfilerOverlay(self.profiler, 10, SCREEN_HEIGHT - 60)
+        logger.info("Frame profiling started")
 
     def on_key_release(self, key: int, modifiers: int):
         """Processes key releases
@@ -291,7 +283,7 @@ class PlatformerView(arcade.View):
             arcade.key.RIGHT,
             arcade.key.D,
         ]:
-            self.player.reset_change_x()
+            self.pending_commands.append(Command.STOP_WALKING)
 
         # Check if player can climb up or down
         elif key in [
@@ -300,101 +292,96 @@ class PlatformerView(arcade.View):
             arcade.key.DOWN,
             arcade.key.S,
         ]:
-            if self.physics_engine.is_on_ladder():
-                self.player.reset_change_y()
-    
+            self.pending_commands.append(Command.STOP_CLIMBING)
+
     def on_update(self, delta_time: float):
-        """Updates the position of all game objects
+        """Runs as many fixed ticks of game logic as the time since the last frame needs
 
         Arguments:
             delta_time {float} -- How much time since the last call
         """
-        self.handle_voice_command()
-
-        # Update the player animation
-        self.player_sprite.update_animation(delta_time)
+        if self.profiler is not None:
+            self.profiler.begin_frame()
 
-        # Update player movement based on the physics engine
-        self.physics_engine.update()
+        with self.timer.measure("voice"):
+            self.handle_voice_command()
 
-        # Restrict user movement so they can't walk off-screen
-        if self.player_sprite.left < 0:
-            self.player_sprite.left = 0
+        self.run_game_logic(delta_time)
 
-        # Check if we've picked up a coin
-        coins_hit = arcade.check_for_collision_with_list(
-            sprite=self.player_sprite, sprite_list=self.coins
-        )
+        # The sounds asked for by the ticks of this frame
+        with self.timer.measure("sounds"):
+            self.sounds.flush()
 
-        for coin in coins_hit:
-            # Add the coin score to our score
-            self.level_score += int(coin.properties["point_value"])
+    def run_game_logic(self, delta_time: float):
+        """Advances the transition running, or the game by the fixed ticks of the frame
 
-            # Play the coin sound
-            arcade.play_sound(self.coin_sound)
+        Arguments:
+            delta_time {float} -- How much time since the last call
+        """
+        # The game logic waits for the end of a transition, the commands received meanwhile are kept
+        if self.transition.active:
+            self.transition.update(delta_time)
+            if not self.transition.active:
+                # Don't catch up on the time of the transition
+                self.timestep.reset()
+            return
 
-            # Remove the coin
-            coin.remove_from_sprite_lists()
+        for _ in range(self.timestep.advance(delta_time)):
+            # The recorded run stopped there, without reaching the end of the game
+            if self.replay is not None and self.engine.tick >= self.replay.tick_count:
+                self.end_replay()
+                return
 
-        # Check for trap collision, only in maps with traps
-        if self.traps is not None:
-            trap_hit = arcade.check_for_collision_with_list(
-                sprite=self.player_sprite, sprite_list=self.traps
-            )
+            self.record_previous_positions()
+            with self.timer.measure("tick"):
+                self.on_tick()
 
-            if trap_hit:
-                self.handle_player_death()
+            # The game ended during this tick, another view is displayed now, or a transition started
+            if self.window.current_view is not self or self.transition.active:
                 return
 
-        if self.enemies is not None:
-            enemies_hit = arcade.check_for_collision_with_list(
-                sprite=self.player_sprite, sprite_list=self.enemies
-            )
-
-            if enemies_hit:
+    def on_tick(self):
+        """Advances the game by one fixed tick, and reacts to what happened during it"""
+        if self.replay is not None:
+            # Play back the recorded commands, the keys are ignored
+            state = self.engine.step(self.replay.script.get(self.engine.tick + 1, ()))
+        else:
+            state = self.engine.step(self.pending_commands)
+        self.pending_commands = []
+
+        for event in state.events:
+            if event == GameEvent.JUMP:
+                self.sounds.play(self.jump_sound)
+            elif event == GameEvent.COIN:
+                self.sounds.play(self.coin_sound)
+            elif event == GameEvent.DEATH:
+                # After the last life, the engine has also sent GAME_OVER, the death transition handles it
                 self.handle_player_death()
                 return
-
-        # Now check if we are at the ending goal
-        goals_hit = arcade.check_for_collision_with_list(
-            sprite=self.player_sprite, sprite_list=self.goals
-        )
-
-        if goals_hit:
-            self.calculate_score()
-            if self.level == 5:  # Game is finished : Victory !
+            elif event == GameEvent.VICTORY:
                 self.handle_victory()
-            else:
+                return
+            elif event == GameEvent.LEVEL_COMPLETE:
                 # Play the level victory sound
-                self.level_victory_sound.play()
-                # Add a small waiting time to avoid jumping too quickly into the next level
-                sleep(1)
+                self.sounds.play(self.level_victory_sound)
+                # Add a small waiting time to avoid jumping too quickly into the next level.
+                # The engine has already loaded the next level, it shows at the end of the transition.
+                self.transition.start(TransitionState.LEVEL_CLEAR, LEVEL_CLEAR_DURATION, self.start_next_level)
+                return
 
-                # Set up the next level and call setup again to load the new map
-                self.level += 1
-                self.setup()
-        else:
-            # Set the viewport, scrolling if necessary
+        # Set the viewport, scrolling if necessary
+        with self.timer.measure("scroll"):
             self.scroll_viewport()
 
-        # Are there enemies? Update them as well
-        self.enemies.update_animation(delta_time)
-        for enemy in self.enemies:
-            enemy.center_x += enemy.change_x
-            walls_hit = arcade.check_for_collision_with_list(
-                sprite=enemy, sprite_list=self.walls
-            )
-            if walls_hit:
-                enemy.change_x *= -1
-
     def handle_game_over(self):
         """
         Game Over !
         """
         arcade.stop_sound(self.background_music_player)
+        if self.end_replay():
+            return
 
         # Show the Game Over Screen
-        self.calculate_score()
         _game_over_view = game_over_view.GameOverView(self.player, self.speech_recognition)
         self.window.show_view(_game_over_view)
 
@@ -403,222 +390,100 @@ class PlatformerView(arcade.View):
         Victory !
         """
         arcade.stop_sound(self.background_music_player)
+        if self.end_replay():
+            return
 
         # Show the winner Screen
         _winner_view = winner_view.WinnerView(self.player, self.speech_recognition)
         # Calculate final score
         self.window.show_view(_winner_view)
 
-    def calculate_score(self) -> int:
-        """
-        The final score is the score (gained by collecting coins)
-        plus a time bonus
-        """
-        self.level_score = 0
-        self.player.score += (self.level_score + round((1000 * self.level) / self.get_game_time()) * (self.life_count + 1))
-        return self.player.score
-
     def on_draw(self):
         """
-        This is the display feature. The real logic is in on_update
+        This is the display feature. The real logic is in on_tick
         """
+        # Draw the moving sprites between their last two ticks, then put back their real positions
+        alpha = self.timestep.alpha if INTERPOLATE_RENDERING else 1.0
+        player_position = self.player_sprite.position
+        self.interpolate(alpha)
+
         arcade.start_render()
+        left, right, bottom, _ = self.camera.use_between(alpha)
 
         # Draw all the sprites
-        self.background.draw()
-        self.walls.draw()
-        self.coins.draw()
-        self.goals.draw()
-        self.enemies.draw()
-
-        # Not all maps have ladders
-        if self.ladders is not None:
-            self.ladders.draw()
-
-        # Not all maps have traps
-        if self.traps is not None:
-            self.traps.draw()
-
-        # Draw the dynamic elements : play, score, life count
-        self.player_sprite.draw()
-        arcade.draw_rectangle_filled((SCREEN_WIDTH / 2) + self.view_left, 625 + self.view_bottom, SCREEN_WIDTH, 50, arcade.color.BLACK)
-        self.draw_score()
-        self.draw_life_count()
-        self.draw_timer()
-
-    def draw_score(self):
-        """
-        Draw the score in the top left
-        """
-        # First set a black background for a shadow effect
-        arcade.draw_text(
-            "Score:",
-            start_x=600 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.RED,
-            font_size=self.font_size 
-        )
-        # Now in white, slightly shifted
-        arcade.draw_text(
-            "Score:",
-            start_x=602 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.WHITE,
-            font_size=self.font_size 
-        )
-
-        arcade.draw_text(
-            str(self.level_score),
-            start_x=700 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.RED,
-            font_size=self.font_size 
-        )
-        # Now in white, slightly shifted
-        arcade.draw_text(
-            str(self.level_score),
-            start_x=702 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.WHITE,
-            font_size=self.font_size 
-        )
-
-        # First set a black background for a shadow effect
-        arcade.draw_text(
-            "Total:",
-            start_x=750 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.RED,
-            font_size=self.font_size 
-        )
-        # Now in white, slightly shifted
-        arcade.draw_text(
-            "Total:",
-            start_x=752 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.WHITE,
-            font_size=self.font_size 
-        )
-
-        arcade.draw_text(
-            str(self.player.score),
-            start_x=850 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.RED,
-            font_size=self.font_size 
-        )
-        # Now in white, slightly shifted
-        arcade.draw_text(
-            str(self.player.score),
-            start_x=852 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.WHITE,
-            font_size=self.font_size 
-        )
-
-    def draw_life_count(self):
+        with self.timer.measure("draw_sprites"):
+            self.level_renderer.draw(left, right)
+
+            # The player and the enemies have already moved to the next life or level during these transitions
+            if self.transition.state not in (TransitionState.DYING, TransitionState.LEVEL_CLEAR):
+                self.enemies.draw()
+                self.player_list.draw()
+
+        # Draw the dynamic elements : score, life count
+        with self.timer.measure("hud"):
+            self.draw_transition()
+            self.hud.update(self.player.name, self.level, self.get_game_time(), self.level_score, self.player.score,
+                            self.life_count)
+            # The HUD follows the world camera on its own, the projection only changes when the camera moves
+            self.hud.draw(left, bottom)
+
+        if self.show_profiler:
+            with self.timer.measure("overlay"):
+                self.profiler_overlay.update()
+                self.profiler_overlay.draw(left, bottom)
+
+        # Back to the real positions, the next tick starts from them
+        self.player_sprite.position = player_position
+        self.engine.enemy_manager.interpolate_sprites(1.0)
+
+        if self.profiler is not None:
+            self.profiler.end_frame()
+
+    def draw_transition(self):
         """
-        Display the life count on the bottom left after the score
+        Fades the level out after a death or at the end of the level, shows a message during the countdown
         """
-        arcade.draw_text(
-            "Lives:",
-            start_x=905 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.RED,
-            font_size=self.font_size 
-        )
-        # Now in white, slightly shifted
-        arcade.draw_text(
-            "Lives:",
-            start_x=907 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.WHITE,
-            font_size=self.font_size
-        )
-
-        arcade.draw_text(
-            str(self.life_count),
-            start_x=980 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.RED,
-            font_size=self.font_size 
-        )
-        # Now in white, slightly shifted
-        arcade.draw_text(
-            str(self.life_count),
-            start_x=982 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.WHITE,
-            font_size=self.font_size 
-        )
-
-
-    def draw_timer(self):
-        """
-        Display the game timer on the bottom left after the life count
+        if self.transition.state == TransitionState.COUNTDOWN:
+            self.hud.update_transition("Ready?", fade=0.0)
+        elif self.transition.active:
+            self.hud.update_transition("", fade=self.transition.progress)
+        else:
+            self.hud.update_transition("", fade=0.0)
+
+    def interpolate(self, alpha: float) -> None:
+        """Places the player and the enemies between the previous tick and the last one
+
+        Arguments:
+            alpha -- 0 for the previous tick, 1 for the last one
         """
-        # First set a black background for a shadow effect
-        arcade.draw_text(
-            self.player.name + " - Level: " + str(self.level) + " - Time:",
-            start_x=30 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.RED,
-            font_size=self.font_size 
-        )
-        # Now in white, slightly shifted
-        arcade.draw_text(
-            self.player.name + " - Level: " + str(self.level) + " - Time:",
-            start_x=32 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.WHITE,
-            font_size=self.font_size 
-        )
-
-        # Draw the timer in the lower left, after the score
-        timer_text = str(self.get_game_time())
-
-        arcade.draw_text(
-            str(timer_text),
-            start_x=270 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.RED,
-            font_size=self.font_size 
-        )
-        # Now in white, slightly shifted
-        arcade.draw_text(
-            str(timer_text),
-            start_x=272 + self.view_left,
-            start_y=615 + self.view_bottom,
-            color=arcade.csscolor.WHITE,
-            font_size=self.font_size 
-        )
+        def between(previous: float, current: float) -> float:
+            return previous + (current - previous) * alpha
 
-    def handle_voice_command(self):
-        if not self.speech_recognition.message_queue.empty():
-            message = self.speech_recognition.message_queue.get()
-            if(message=="jump"):
-                self.player.jump()
-            elif(message=="right"):
-                self.player.move_right()
-            elif(message=="left"):
-                self.player.move_left()
-            elif(message=="up"):
-                self.player.move_up()
-            elif(message=="down"):
-                self.player.move_down()
-            elif(message=="stop"):
-                self.player.reset_change_x()
-                if self.physics_engine.is_on_ladder():
-                    self.player.reset_change_y()
-    
-    def create_enemy_sprites(self) -> arcade.SpriteList:
-        """Creates enemy sprites appropriate for the current level
+        (previous_x, previous_y), (current_x, current_y) = self.previous_player_position, self.player_sprite.position
+        self.player_sprite.position = (between(previous_x, current_x), between(previous_y, current_y))
+        self.engine.enemy_manager.interpolate_sprites(alpha)
+
+    def end_replay(self) -> bool:
+        """Saves the recording of the game when it ends, and closes the window at the end of a replay
 
         Returns:
-            A Sprite List of enemies"""
-        enemies = arcade.SpriteList()
+            Whether a replay was played back, and the window closed
+        """
+        if self.engine.replay is not None:
+            logger.info(f"Game recorded in {self.engine.replay.save()}")
 
-        if self.level == 2:
-            enemies.append(Enemy(PLAYER_START_X + 900, PLAYER_START_Y + 64, "asteroid"))
+        if self.replay is not None:
+            logger.info(f"Replay finished after {self.engine.tick} ticks, score {self.player.score}")
+            self.window.close()
+            return True
+        return False
 
-        return enemies
\ No newline at end of file
+    def handle_voice_command(self):
+        # No voice commands while playing back a replay
+        if self.speech_recognition is None:
+            return
+        if not self.speech_recognition.message_queue.empty():
+            message = self.speech_recognition.message_queue.get()
+            # The voice commands are named like the engine commands
+            if message in [command.value for command in Command]:
+                self.pending_commands.append(Command(message))
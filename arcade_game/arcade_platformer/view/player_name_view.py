@@ -1,11 +1,11 @@
 import arcade
 
 from arcade_game.arcade_platformer.config.config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_PATH
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
 from . import platform_view
 from arcade_game.arcade_platformer.player.player import Player
 from arcade_game.arcade_platformer.helpers.speech_recognition import SpeechRecognition
 import arcade.gui as gui
-from arcade import load_texture
 
 class PlayerNameView(arcade.View):
     """
@@ -26,7 +26,7 @@ class PlayerNameView(arcade.View):
         title_image_path = ASSETS_PATH / "images" / "welcome.png"  # TODO change
 
         # Load our title image
-        self.title_image = arcade.load_texture(title_image_path)
+        self.title_image = asset_manager.load_texture(title_image_path)
 
         # Set our display timer
         self.display_timer = 2.0
@@ -34,6 +34,9 @@ class PlayerNameView(arcade.View):
         self.manager = None
         self.draw_enter_player_name()
 
+    def on_hide_view(self) -> None:
+        asset_manager.release(self.title_image, self.bg_tex)
+
     def on_update(self, delta_time: float) -> None:
         """
         Arguments:
@@ -65,7 +68,7 @@ class PlayerNameView(arcade.View):
             font_size=16,
             font_name="Kenney Future")
 
-        bg_tex = load_texture(":resources:gui_basic_assets/window/grey_panel.png")
+        self.bg_tex = asset_manager.load_texture(":resources:gui_basic_assets/window/grey_panel.png")
         # Create an text input field
         self.player_name_input_field = arcade.gui.UIInputText(
           text_color=arcade.color.BLACK,
@@ -84,7 +87,7 @@ class PlayerNameView(arcade.View):
         
         tp = gui.UITexturePane(
                 self.player_name_input_field,
-                tex=bg_tex,
+                tex=self.bg_tex,
                 padding=(2, 2, 2, 2)
             )
         
@@ -134,4 +137,4 @@ class PlayerNameView(arcade.View):
             if("set name" in message):
                 self.player.name = message.replace('set name: ', '').replace('.', '').lstrip().capitalize()
                 if self.player.name:
-                    self.launch_game()
\ No newline at end of file
+                    self.launch_game()
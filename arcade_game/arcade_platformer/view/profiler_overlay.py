@@ -0,0 +1,90 @@
+from typing import List
+
+import arcade
+import pyglet
+from pyglet.math import Mat4, Vec3
+
+from arcade_game.arcade_platformer.helpers.frame_profiler import FrameProfiler
+
+# Height of a line, in pixels
+LINE_HEIGHT = 16
+TEXT_COLOR = arcade.csscolor.WHITE + (255,)
+BACKGROUND_COLOR = (0, 0, 0)
+BACKGROUND_OPACITY = 160
+# The averages are computed again twice a second at 60 frames per second, the text can be read in between
+REFRESH_FRAMES = 30
+
+
+class ProfilerOverlay:
+    """
+    The average duration of each phase over the last frames, and the average of each counter,
+    one per line in the corner of the screen
+
+    Like the HUD, each line is a label kept from one frame to the next, laid out again only when its text
+    changes, and all of them are drawn at once from the same batch, moved to where the world camera is.
+    """
+    def __init__(self, profiler: FrameProfiler, left: float, top: float, frame_count: int = 60) -> None:
+        """
+        Arguments:
+            profiler -- The frames to show
+            left -- The left of the text, in screen coordinates
+            top -- The top of the first line, in screen coordinates
+            frame_count -- Number of frames to average
+        """
+        self.profiler = profiler
+        self.left = left
+        self.top = top
+        self.frame_count = frame_count
+        # The profiler frame the averages were computed at, None before the first time
+        self.refreshed_at = None
+
+        self.batch = pyglet.graphics.Batch()
+        self.background_group = pyglet.graphics.Group(order=0)
+        self.text_group = pyglet.graphics.Group(order=1)
+        self.background = pyglet.shapes.Rectangle(left, top, 240, 0, color=BACKGROUND_COLOR,
+                                                  batch=self.batch, group=self.background_group)
+        self.background.opacity = BACKGROUND_OPACITY
+        # One per line, added when a new phase or counter shows up
+        self.labels: List[pyglet.text.Label] = []
+
+    def update(self) -> None:
+        """Shows the averages of the last frames, only computed again every REFRESH_FRAMES frames"""
+        profiler = self.profiler
+        if not profiler.frames:
+            return
+        if self.refreshed_at is not None and profiler.frame_count - self.refreshed_at < REFRESH_FRAMES:
+            return
+        self.refreshed_at = profiler.frame_count
+
+        lines = [f"{name:<16}{duration * 1000:>7.2f} ms"
+                 for name, duration in profiler.get_phase_averages(self.frame_count).items()]
+        lines.extend(f"{name:<16}{value:>10.0f}"
+                     for name, value in profiler.get_counter_averages(self.frame_count).items())
+
+        while len(self.labels) < len(lines):
+            self.labels.append(pyglet.text.Label(
+                "", font_name="Courier New", font_size=10, color=TEXT_COLOR, x=self.left + 8,
+                y=self.top - LINE_HEIGHT * (len(self.labels) + 1), batch=self.batch, group=self.text_group,
+            ))
+        for index, label in enumerate(self.labels):
+            text = lines[index] if index < len(lines) else ""
+            if label.text != text:
+                label.text = text
+
+        height = LINE_HEIGHT * len(lines) + 8
+        if self.background.height != height:
+            self.background.y = self.top - height
+            self.background.height = height
+
+    def draw(self, left: float, bottom: float) -> None:
+        """Draws the lines in the corner of the screen
+
+        Arguments:
+            left, bottom -- The bottom left corner of what the world camera shows, in pixels
+        """
+        window = arcade.get_window()
+        with window.ctx.pyglet_rendering():
+            # The projection is the one of the world camera, move the screen to where it is
+            window.view = Mat4.from_translation(Vec3(left, bottom, 0))
+            self.batch.draw()
+            window.view = Mat4()
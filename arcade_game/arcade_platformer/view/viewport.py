@@ -0,0 +1,56 @@
+from typing import Tuple
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import BOTTOM_VIEWPORT_MARGIN, LEFT_VIEWPORT_MARGIN, \
+    RIGHT_VIEWPORT_MARGIN, SCREEN_HEIGHT, SCREEN_WIDTH, TOP_VIEWPORT_MARGIN
+
+
+def follow_player(view_left: float, view_bottom: float, player_sprite: arcade.Sprite,
+                  map_width: float) -> Tuple[int, int]:
+    """
+    Moves the viewport, horizontally and vertically, when the player gets close to the edges
+
+    Arguments:
+        view_left -- The left of the viewport
+        view_bottom -- The bottom of the viewport
+        player_sprite -- The player to keep on screen
+        map_width -- The width of the map, the viewport doesn't scroll past its edges
+
+    Returns:
+        The new left and bottom of the viewport
+    """
+    # Scroll left
+    # Find the current left boundary
+    left_boundary = view_left + LEFT_VIEWPORT_MARGIN
+
+    # Are we to the left of this boundary? Then we should scroll left.
+    if player_sprite.left < left_boundary:
+        view_left -= left_boundary - player_sprite.left
+        # But don't scroll past the left edge of the map
+        if view_left < 0:
+            view_left = 0
+
+    # Scroll right
+    # Find the current right boundary
+    right_boundary = view_left + SCREEN_WIDTH - RIGHT_VIEWPORT_MARGIN
+
+    # Are we to the right of this boundary? Then we should scroll right.
+    if player_sprite.right > right_boundary:
+        view_left += player_sprite.right - right_boundary
+        # Don't scroll past the right edge of the map
+        if view_left > map_width - SCREEN_WIDTH:
+            view_left = map_width - SCREEN_WIDTH
+
+    # Scroll up
+    top_boundary = view_bottom + SCREEN_HEIGHT - TOP_VIEWPORT_MARGIN
+    if player_sprite.top > top_boundary:
+        view_bottom += player_sprite.top - top_boundary
+
+    # Scroll down
+    bottom_boundary = view_bottom + BOTTOM_VIEWPORT_MARGIN
+    if player_sprite.bottom < bottom_boundary:
+        view_bottom -= bottom_boundary - player_sprite.bottom
+
+    # Only scroll to integers, otherwise we end up with pixels that don't line up on the screen.
+    return int(view_left), int(view_bottom)
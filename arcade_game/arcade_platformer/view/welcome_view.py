@@ -2,9 +2,13 @@ import arcade
 from threading import Thread
 
 from arcade_game.arcade_platformer.config.config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_PATH
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
+from arcade_game.arcade_platformer.asset.music import open_music
 from . import winning_leaderboard_view, player_name_view
 from arcade_game.arcade_platformer.player.player import Player
+from arcade_game.arcade_platformer.helpers.idle_throttle import IdleThrottle
 from arcade_game.arcade_platformer.helpers.speech_recognition import SpeechRecognition
+from arcade_game.arcade_platformer.sound.audio_warmup import audio_warmup
 from log.config_log import logger
 
 
@@ -25,17 +29,18 @@ class WelcomeView(arcade.View):
 
         self.game_view = None
 
-        # Load & play intro music
-        self.intro_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "intro.wav")
-        )
-        self.sound_player = self.intro_sound.play(volume=0.3, loop=True)
+        # Open the audio device and decode the sound effects of the game while the screen shows
+        audio_warmup.start()
+
+        # Load the intro music, it plays once the audio device is open
+        self.intro_sound = open_music(ASSETS_PATH / "sounds" / "intro.wav")
+        self.sound_player = None
 
         # Find the title image in the images folder
         title_image_path = ASSETS_PATH / "images" / "welcome.png"
 
         # Load our title image
-        self.title_image = arcade.load_texture(title_image_path)
+        self.title_image = asset_manager.load_texture(title_image_path)
 
         # Set our display timer
         self.display_timer = 2.0
@@ -43,10 +48,21 @@ class WelcomeView(arcade.View):
         # Are we showing the instructions?
         self.show_instructions = False
 
+        # The screen only changes when the instructions blink, it is drawn at a low rate otherwise
+        self.idle_throttle = IdleThrottle()
+
+    def on_show_view(self) -> None:
+        self.idle_throttle.start(self.window)
+
+    def on_hide_view(self) -> None:
+        asset_manager.release(self.intro_sound, self.title_image)
+        self.idle_throttle.stop()
+
     def check_message_queue(self):
         if not self.speech_recognition.message_queue.empty():
             message = self.speech_recognition.message_queue.get()
             logger.info(f"welcome view message {message}")
+            self.idle_throttle.request_redraw()
             if(message=="start"):
                 self.start_game()
             if(message=="leaderboard"):
@@ -60,6 +76,9 @@ class WelcomeView(arcade.View):
         """
         self.check_message_queue()
 
+        if self.sound_player is None and audio_warmup.driver_ready.is_set():
+            self.sound_player = self.intro_sound.play(volume=0.3, loop=True)
+
         # First, count down the time
         self.display_timer -= delta_time
 
@@ -70,6 +89,7 @@ class WelcomeView(arcade.View):
 
             # And reset the timer so the instructions flash slowly
             self.display_timer = 1.0
+            self.idle_throttle.request_redraw()
 
     def on_draw(self) -> None:
         # Start the rendering loop
@@ -95,19 +115,24 @@ class WelcomeView(arcade.View):
             )
 
     def on_key_press(self, key: int, modifiers: int) -> None:
+        self.idle_throttle.request_redraw()
         if key == arcade.key.RETURN:
             self.start_game()
         if key == arcade.key.L:
             self.show_leaderboard()
     
+    def stop_intro_music(self) -> None:
+        if self.sound_player is not None:
+            self.intro_sound.stop(self.sound_player)
+
     def start_game(self) -> None:
         # Stop intro music
-            self.intro_sound.stop(self.sound_player)
+            self.stop_intro_music()
             # Launch Enter Player Name view
             _player_name_view = player_name_view.PlayerNameView(self.player, self.speech_recognition)
             self.window.show_view(_player_name_view)
 
     def show_leaderboard(self) -> None:
-            self.intro_sound.stop(self.sound_player)
+            self.stop_intro_music()
             _leaderboard_view = winning_leaderboard_view.WinningLeaderboardView(self.player, self.speech_recognition)
-            self.window.show_view(_leaderboard_view)
\ No newline at end of file
+            self.window.show_view(_leaderboard_view)
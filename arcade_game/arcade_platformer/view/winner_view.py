@@ -1,8 +1,11 @@
 import arcade
 
 from arcade_game.arcade_platformer.config.config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_PATH
+from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
+from arcade_game.arcade_platformer.asset.music import open_music
 from . import winning_leaderboard_view
 from arcade_game.arcade_platformer.player.player import Player
+from arcade_game.arcade_platformer.helpers.idle_throttle import IdleThrottle
 from arcade_game.arcade_platformer.helpers.speech_recognition import SpeechRecognition
 
 
@@ -21,16 +24,14 @@ class WinnerView(arcade.View):
         self.speech_recognition = speech_recognition
 
         # Load and play victory music
-        self.victory_sound = arcade.load_sound(
-            str(ASSETS_PATH / "sounds" / "victory.wav")
-        )
+        self.victory_sound = open_music(ASSETS_PATH / "sounds" / "victory.wav")
         self.sound_player = self.victory_sound.play(volume=0.3, loop=True)
 
         # Find the game over image in the images folder
         winner_image_path = ASSETS_PATH / "images" / "you_win.png"
 
         # Load our game over image
-        self.winner_image = arcade.load_texture(winner_image_path)
+        self.winner_image = asset_manager.load_texture(winner_image_path)
 
         # Set our display timer
         self.display_timer = 2.0
@@ -38,6 +39,9 @@ class WinnerView(arcade.View):
         # Are we showing the instructions?
         self.show_instructions = False
 
+        # The screen only changes when the instructions blink, it is drawn at a low rate otherwise
+        self.idle_throttle = IdleThrottle()
+
         # Record the calculated final score
         self.score = self.player.score
 
@@ -45,6 +49,13 @@ class WinnerView(arcade.View):
         # to reset the viewport back to the start, so we can see what we draw.
         arcade.set_viewport(0, SCREEN_WIDTH - 1, 0, SCREEN_HEIGHT - 1)
 
+    def on_show_view(self) -> None:
+        self.idle_throttle.start(self.window)
+
+    def on_hide_view(self) -> None:
+        asset_manager.release(self.victory_sound, self.winner_image)
+        self.idle_throttle.stop()
+
     def on_update(self, delta_time: float) -> None:
         """Manages the timer to toggle the instructions
 
@@ -62,6 +73,7 @@ class WinnerView(arcade.View):
 
             # And reset the timer so the instructions flash slowly
             self.display_timer = 1.0
+            self.idle_throttle.request_redraw()
 
     def on_draw(self) -> None:
         self.clear()
@@ -108,6 +120,7 @@ class WinnerView(arcade.View):
             key -- Which key was pressed
             modifiers -- What modifiers were active
         """
+        self.idle_throttle.request_redraw()
         if key == arcade.key.RETURN:
             # Stop Victory music
             self.victory_sound.stop(self.sound_player)
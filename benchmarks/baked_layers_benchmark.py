@@ -0,0 +1,68 @@
+"""
+Measures the drawing of the static layers on one screen, as sprites split in columns and baked in textures
+
+The layers are synthetic: a screen high wall of tiles along a wide map, with smaller and smaller tiles,
+so more and more sprites on the screen. The time includes waiting for the GPU to finish drawing.
+Run from the root of the repository, it needs OpenGL but no display:
+    $ python -m benchmarks.baked_layers_benchmark
+"""
+from timeit import default_timer
+
+import pyglet
+
+pyglet.options["headless"] = True
+
+import arcade  # noqa: E402
+
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH, CHUNK_WIDTH, SCREEN_HEIGHT, \
+    SCREEN_WIDTH  # noqa: E402
+from arcade_game.arcade_platformer.level.baked_layers import BakedLayers  # noqa: E402
+from arcade_game.arcade_platformer.level.chunked_layer import ChunkedLayer  # noqa: E402
+
+# Width of the map, in screens
+MAP_SCREENS = 10
+# Size of the tiles for each run, in pixels
+TILE_SIZES = [64, 32, 16]
+# Number of frames drawn for each run
+FRAMES = 200
+
+
+def create_layer(tile_size: int) -> arcade.SpriteList:
+    texture = arcade.load_texture(ASSETS_PATH / "images" / "ground" / "Grass" / "grassCenter.png")
+    layer = arcade.SpriteList()
+    for x in range(0, MAP_SCREENS * SCREEN_WIDTH, tile_size):
+        for y in range(0, SCREEN_HEIGHT, tile_size):
+            tile = arcade.Sprite(texture=texture, scale=tile_size / texture.width)
+            tile.left = x
+            tile.bottom = y
+            layer.append(tile)
+    return layer
+
+
+def time_per_frame(draw, window: arcade.Window) -> float:
+    """Draws the screen between the first and the second column, and returns the average time of one frame"""
+    left = CHUNK_WIDTH / 2
+    draw(left, left + SCREEN_WIDTH)
+    window.ctx.finish()
+    start = default_timer()
+    for _ in range(FRAMES):
+        draw(left, left + SCREEN_WIDTH)
+        window.ctx.finish()
+    return (default_timer() - start) / FRAMES
+
+
+if __name__ == "__main__":
+    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, visible=False)
+
+    print(f"{'tiles':>7} {'on screen':>10} {'sprites':>10} {'baked':>10} {'textures':>10}")
+    for tile_size in TILE_SIZES:
+        layer = create_layer(tile_size)
+        chunked_layer = ChunkedLayer(layer, CHUNK_WIDTH)
+        baked_layers = BakedLayers.create([layer], CHUNK_WIDTH, arcade.color.FRESH_AIR, memory_budget=2 ** 30)
+        on_screen = chunked_layer.draw(CHUNK_WIDTH / 2, CHUNK_WIDTH / 2 + SCREEN_WIDTH).sprites_drawn
+
+        sprites_time = time_per_frame(chunked_layer.draw, window)
+        baked_time = time_per_frame(baked_layers.draw, window)
+        print(f"{len(layer):>7} {on_screen:>10} {sprites_time * 1000:>7.2f} ms {baked_time * 1000:>7.2f} ms "
+              f"{baked_layers.texture_bytes / 2 ** 20:>7.1f} MB")
+        baked_layers.delete()
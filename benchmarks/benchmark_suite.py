@@ -0,0 +1,299 @@
+"""
+End-to-end benchmark: plays the canned runs of benchmarks/replays and measures every phase of the game
+
+Reports the distribution (p50, p95, p99, max) of the time taken by a tick and its phases: physics, collisions,
+enemy step and viewport scroll, along with the level load, respawn, leaderboard read and write, and startup
+times. Runs without a window; with --draw, the drawing of each tick is timed separately when a display
+is available, through the same cameras, layers and HUD as the game view.
+
+Every canned run must finish the level it starts on: the suite fails on a run that doesn't, the timings
+of a run cut short wouldn't be comparable with the baseline. The respawn is measured on its own, apart
+from the canned runs, since their player rarely dies.
+
+The results are written as JSON, and compared with a baseline when one is given: the run fails when a phase
+got slower than the baseline by more than the threshold. Run from the root of the repository:
+    $ python -m benchmarks.benchmark_suite --output benchmarks/results/baseline.json
+    $ python -m benchmarks.benchmark_suite --baseline benchmarks/results/baseline.json --threshold 0.2
+
+Any replay recorded by the game (see the replays folder) that finishes a level can be added to benchmarks/replays.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from timeit import default_timer
+from typing import Dict, List, NamedTuple, Optional
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import LEVEL_COUNT, SCREEN_HEIGHT, SCREEN_WIDTH
+from arcade_game.arcade_platformer.engine.game_engine import LAYER_OPTIONS, GameEngine, GameEvent
+from arcade_game.arcade_platformer.engine.headless import create_engine
+from arcade_game.arcade_platformer.engine.replay import Replay
+from arcade_game.arcade_platformer.helpers.phase_timer import PhaseTimer
+from arcade_game.arcade_platformer.level.level import load_level
+from arcade_game.arcade_platformer.utils.leaderboard import Leaderboard
+from arcade_game.arcade_platformer.view.camera import WorldCamera
+from arcade_game.arcade_platformer.view.hud import Hud
+from arcade_game.arcade_platformer.view.level_renderer import LevelRenderer
+
+CANNED_RUNS_PATH = Path(__file__).parent / "replays"
+RESULTS_PATH = Path(__file__).parent / "results"
+
+# Number of times each measure is repeated, outside the canned runs
+LEVEL_LOAD_RUNS = 3
+# For each level
+RESPAWN_RUNS = 100
+LEADERBOARD_RUNS = 200
+STARTUP_RUNS = 5
+
+# What a new game does before showing the first level, in a new Python process
+STARTUP_CODE = "from arcade_game.arcade_platformer.engine.headless import create_engine; create_engine(1)"
+
+# The statistics compared with the baseline, the highest percentiles are too noisy to fail a run
+COMPARED_STATISTICS = ("p50", "p95")
+# A slowdown smaller than this is noise, even when it's a large part of a very short phase
+MIN_REGRESSION_MS = 0.02
+
+# The events of a canned run reaching the end of its level
+FINISHING_EVENTS = (GameEvent.LEVEL_COMPLETE, GameEvent.VICTORY)
+
+
+class Screen(NamedTuple):
+    """What the game view draws on top of the engine, for a canned run"""
+    level_renderer: LevelRenderer
+    hud: Hud
+    player_list: arcade.SpriteList
+
+
+def create_screen(engine: GameEngine) -> Screen:
+    player_list = arcade.SpriteList()
+    player_list.append(engine.player_sprite)
+    return Screen(LevelRenderer(), Hud(font_size=16), player_list)
+
+
+def show_level(engine: GameEngine, camera: WorldCamera, screen: Optional[Screen]) -> None:
+    """Starts showing the level the engine has just set up, from its beginning, like PlatformerView.show_level()"""
+    camera.map_width = engine.current_level.map_width
+    camera.reset()
+    if screen is not None:
+        screen.level_renderer.show(engine.current_level)
+
+
+def draw_engine(engine: GameEngine, camera: WorldCamera, screen: Screen) -> None:
+    """Draws a frame like PlatformerView.on_draw(), on the last tick, with no transition running"""
+    arcade.start_render()
+    left, right, bottom, _ = camera.use_between(1.0)
+    screen.level_renderer.draw(left, right)
+    engine.enemies.draw()
+    screen.player_list.draw()
+    screen.hud.update(engine.player.name, engine.level, engine.get_game_time(), engine.level_score,
+                      engine.player.score, engine.life_count)
+    screen.hud.draw(left, bottom)
+
+
+def play_canned_run(path: Path, timer: PhaseTimer, window: Optional[arcade.Window]) -> Dict:
+    """Plays a recorded run, timing every tick and its phases
+
+    Arguments:
+        path -- The replay file
+        timer -- Receives the durations
+        window -- Where to draw each tick, None to skip the drawing
+
+    Returns:
+        Where the run ended
+
+    Raises:
+        ValueError -- The run doesn't finish the level it starts on
+    """
+    replay = Replay.load(path)
+    engine = create_engine(replay.start_level)
+    engine.timer = timer
+    # The camera follows the player without a window too, the scrolling is timed with the game logic
+    camera = WorldCamera()
+    screen = create_screen(engine) if window is not None else None
+    show_level(engine, camera, screen)
+    finished_levels = 0
+
+    state = engine.get_state()
+    for _ in range(replay.tick_count):
+        commands = replay.script.get(engine.tick + 1, ())
+        camera.record_previous_position()
+        with timer.measure("update"):
+            state = engine.step(commands)
+
+        if any(event in FINISHING_EVENTS for event in state.events):
+            finished_levels += 1
+        if GameEvent.LEVEL_COMPLETE in state.events:
+            # The engine has set up the next level already
+            show_level(engine, camera, screen)
+        elif GameEvent.DEATH in state.events and not state.finished:
+            # The player is back at the beginning of the level
+            camera.reset()
+
+        with timer.measure("viewport_scroll"):
+            camera.follow(engine.player_sprite)
+
+        if screen is not None:
+            with timer.measure("draw"):
+                draw_engine(engine, camera, screen)
+                # Wait for the GPU, otherwise only the submission of the commands is measured
+                window.ctx.finish()
+
+        if state.finished:
+            break
+
+    if screen is not None:
+        screen.level_renderer.delete_baked_layers()
+    if not finished_levels:
+        raise ValueError(f"{path.name} doesn't finish level {replay.start_level} in its {replay.tick_count} ticks, "
+                         f"record it again")
+
+    return {
+        "replay": path.name,
+        "start_level": replay.start_level,
+        "ticks": state.tick,
+        "level": state.level,
+        "finished_levels": finished_levels,
+        "lives": state.life_count,
+        "score": state.score,
+        "finished": state.finished,
+    }
+
+
+def measure_respawn(timer: PhaseTimer) -> None:
+    """Sends the player back to the beginning of every level, as after a death"""
+    for level_number in range(1, LEVEL_COUNT + 1):
+        engine = create_engine(level_number)
+        for _ in range(RESPAWN_RUNS):
+            with timer.measure("respawn_micro"):
+                engine.respawn()
+
+
+def measure_level_loads(timer: PhaseTimer) -> None:
+    """Loads every level from the disk, with no texture in memory"""
+    for _ in range(LEVEL_LOAD_RUNS):
+        for level_number in range(1, LEVEL_COUNT + 1):
+            arcade.load_texture.texture_cache.clear()
+            with timer.measure("level_load"):
+                load_level(level_number, LAYER_OPTIONS)
+
+
+def measure_leaderboard(timer: PhaseTimer) -> None:
+    """Writes and reads a full leaderboard, in a temporary file so the real leaderboard isn't touched"""
+    leaderboard = Leaderboard()
+    with tempfile.TemporaryDirectory() as directory:
+        leaderboard.leaderfile = str(Path(directory) / "leaderboard.dat")
+        leaderboard.leaderboard = []
+        for index in range(10):
+            leaderboard.add_score(f"player {index}", 100 * index)
+
+        for index in range(LEADERBOARD_RUNS):
+            with timer.measure("leaderboard_write"):
+                leaderboard.add_score("benchmark", index)
+                leaderboard.save()
+            with timer.measure("leaderboard_read"):
+                leaderboard.read_scores()
+
+
+def measure_startup(timer: PhaseTimer) -> None:
+    """Starts a new Python process that imports the game and sets up the first level"""
+    for _ in range(STARTUP_RUNS):
+        start = default_timer()
+        subprocess.run([sys.executable, "-c", STARTUP_CODE], check=True, stdout=subprocess.DEVNULL)
+        timer.add("startup", default_timer() - start)
+
+
+def create_window() -> Optional[arcade.Window]:
+    """A hidden window to time the drawing, None when there is no display"""
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY"):
+        print("No display, the drawing isn't timed")
+        return None
+    return arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, "Benchmark", visible=False)
+
+
+def compare(statistics: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """Finds the phases slower than in the baseline
+
+    Arguments:
+        statistics -- The phases of this run
+        baseline -- The phases of the baseline run
+        threshold -- The slowdown allowed, as a fraction of the baseline duration
+
+    Returns:
+        A description of each regression
+    """
+    regressions = []
+    for phase, phase_statistics in statistics.items():
+        if phase not in baseline:
+            continue
+        for name in COMPARED_STATISTICS:
+            current, reference = phase_statistics[name], baseline[phase][name]
+            if current - reference > max(reference * threshold, MIN_REGRESSION_MS):
+                regressions.append(f"{phase} {name}: {current:.3f} ms, baseline {reference:.3f} ms "
+                                   f"(+{(current / reference - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_statistics(statistics: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'phase':<18} {'count':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}  (ms)")
+    for phase, phase_statistics in statistics.items():
+        print(f"{phase:<18} {phase_statistics['count']:>7} " +
+              " ".join(f"{phase_statistics[name]:>9.3f}" for name in ("p50", "p95", "p99", "max")))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plays the canned runs and reports the timing of each phase")
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH / "latest.json",
+                        help="Where to write the results, as JSON")
+    parser.add_argument("--baseline", type=Path, help="Results of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Slowdown allowed before failing, as a fraction of the baseline duration")
+    parser.add_argument("--draw", action="store_true", help="Also time the drawing, when a display is available")
+    parser.add_argument("--skip-startup", action="store_true", help="Don't measure the startup time")
+    arguments = parser.parse_args()
+
+    timer = PhaseTimer()
+    window = create_window() if arguments.draw else None
+
+    runs = []
+    for path in sorted(CANNED_RUNS_PATH.glob("*.rpl")):
+        run = play_canned_run(path, timer, window)
+        runs.append(run)
+        print(f"{run['replay']}: {run['ticks']} ticks, level {run['start_level']} to {run['level']}, "
+              f"{run['finished_levels']} level(s) finished, game finished: {run['finished']}")
+
+    measure_respawn(timer)
+    measure_level_loads(timer)
+    measure_leaderboard(timer)
+    if not arguments.skip_startup:
+        measure_startup(timer)
+
+    statistics = timer.get_statistics()
+    print_statistics(statistics)
+
+    results = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "phases": statistics,
+    }
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    arguments.output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {arguments.output}")
+
+    if arguments.baseline is not None:
+        baseline = json.loads(arguments.baseline.read_text())
+        regressions = compare(statistics, baseline["phases"], arguments.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No phase slower than the baseline by more than {arguments.threshold:.0%}")
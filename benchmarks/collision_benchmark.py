@@ -0,0 +1,66 @@
+"""
+Measures the per-frame collision cost of the player against the walls, as the map grows
+
+The maps are synthetic: rows of ground tiles with some platforms, like the real levels but wider.
+Run from the root of the repository:
+    $ python -m benchmarks.collision_benchmark
+"""
+import random
+from timeit import default_timer
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH
+from arcade_game.arcade_platformer.level.tile_grid import TileGrid
+from arcade_game.arcade_platformer.player.player import Player
+
+TILE_SIZE = 128
+MAP_HEIGHT = 25
+# Number of map columns for each run
+MAP_WIDTHS = [50, 200, 800, 3200]
+# Number of simulated frames for each run
+FRAMES = 500
+
+
+def create_walls(map_width: int) -> arcade.SpriteList:
+    """Three rows of ground along the whole map, and random platforms above"""
+    texture = arcade.load_texture(ASSETS_PATH / "images" / "ground" / "Grass" / "grassCenter.png")
+    walls = arcade.SpriteList()
+    random_generator = random.Random(map_width)
+    for column in range(map_width):
+        rows = [0, 1, 2] + [row for row in range(4, MAP_HEIGHT) if random_generator.random() < 0.1]
+        for row in rows:
+            wall = arcade.Sprite(texture=texture)
+            wall.center_x = column * TILE_SIZE + TILE_SIZE / 2
+            wall.center_y = row * TILE_SIZE + TILE_SIZE / 2
+            walls.append(wall)
+    return walls
+
+
+def time_per_frame(check, player: arcade.Sprite, map_width: int) -> float:
+    """Moves the player over the map, and returns the average time of one collision check"""
+    random_generator = random.Random(0)
+    positions = [
+        (random_generator.uniform(0, map_width * TILE_SIZE), random_generator.uniform(0, MAP_HEIGHT * TILE_SIZE))
+        for _ in range(FRAMES)
+    ]
+    start = default_timer()
+    for player.center_x, player.center_y in positions:
+        check(player)
+    return (default_timer() - start) / FRAMES
+
+
+if __name__ == "__main__":
+    player = Player.create_player_sprite()
+
+    print(f"{'walls':>7} {'list scan':>14} {'tile grid':>12}")
+    for map_width in MAP_WIDTHS:
+        walls = create_walls(map_width)
+        wall_grid = TileGrid(walls, TILE_SIZE, TILE_SIZE)
+
+        # What check_for_collision_with_list does on the CPU: test every sprite of the list.
+        # (Above 1500 sprites arcade moves that scan to the GPU, which needs a window.)
+        list_time = time_per_frame(lambda sprite: [wall for wall in walls if arcade.check_for_collision(sprite, wall)],
+                                   player, map_width)
+        grid_time = time_per_frame(wall_grid.check_for_collision, player, map_width)
+        print(f"{len(walls):>7} {list_time * 1e6:>11.1f} us {grid_time * 1e6:>9.1f} us")
@@ -0,0 +1,72 @@
+"""
+Measures the per-frame cost of moving the enemies, as their number grows
+
+The enemies walk on a real level, spread along the ground, and the screen only shows a few of them.
+Run from the root of the repository:
+    $ python -m benchmarks.enemy_benchmark
+"""
+from timeit import default_timer
+from typing import List
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import ENEMY_SPEED, PLAYER_START_Y, SCREEN_WIDTH
+from arcade_game.arcade_platformer.enemy.enemy_manager import EnemyManager
+from arcade_game.arcade_platformer.enemy.enemy_patrol import compute_patrol_bounds
+from arcade_game.arcade_platformer.enemy.enemy_pool import EnemyPool
+from arcade_game.arcade_platformer.enemy.enemy_spawn import EnemySpawn
+from arcade_game.arcade_platformer.level.level import load_level
+
+LEVEL_NUMBER = 2
+# Number of enemies for each run
+ENEMY_COUNTS = [1, 10, 100, 500]
+# Number of simulated frames for each run
+FRAMES = 200
+
+
+def create_spawns(count: int, map_width: float) -> List[EnemySpawn]:
+    """Enemies spaced evenly along the map, in the air above the ground so they never get stuck"""
+    return [
+        EnemySpawn("asteroid", (index + 0.5) * map_width / count, PLAYER_START_Y + 1000, ENEMY_SPEED, 0)
+        for index in range(count)
+    ]
+
+
+def create_enemies(spawns: List[EnemySpawn]) -> arcade.SpriteList:
+    enemies = arcade.SpriteList()
+    EnemyPool().spawn_enemies(spawns, enemies)
+    return enemies
+
+
+def time_per_frame(update) -> float:
+    start = default_timer()
+    for _ in range(FRAMES):
+        update()
+    return (default_timer() - start) / FRAMES
+
+
+if __name__ == "__main__":
+    level = load_level(LEVEL_NUMBER, {"ground": {"use_spatial_hash": True}})
+    wall_grid = level.get_tile_grid("ground")
+
+    print(f"{'enemies':>7} {'per sprite':>13} {'enemy manager':>15}")
+    for enemy_count in ENEMY_COUNTS:
+        spawns = create_spawns(enemy_count, level.map_width)
+
+        # What the view did before the enemy manager: animate, move and check every enemy sprite
+        enemies = create_enemies(spawns)
+
+        def update_sprites():
+            enemies.update_animation()
+            for enemy in enemies:
+                enemy.center_x += enemy.change_x
+                if wall_grid.check_for_collision(enemy):
+                    enemy.change_x *= -1
+
+        sprite_time = time_per_frame(update_sprites)
+
+        patrol_bounds = compute_patrol_bounds(spawns, wall_grid, level.width, level.height)
+        enemy_manager = EnemyManager(create_enemies(spawns), patrol_bounds)
+        manager_time = time_per_frame(lambda: enemy_manager.update(0, SCREEN_WIDTH))
+
+        print(f"{enemy_count:>7} {sprite_time * 1e6:>10.1f} us {manager_time * 1e6:>12.1f} us")
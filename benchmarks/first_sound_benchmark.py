@@ -0,0 +1,64 @@
+"""
+Measures how long the first sound effect of the game takes to start, with and without the audio warm-up
+
+Each run is a new Python process, the audio driver is only opened once per process:
+- cold: the coin sound is decoded and played, what the first coin of the game used to cost
+- warm: the warm-up of the welcome screen runs first, then the coin sound is played
+Run from the root of the repository, with a display or PYGLET_HEADLESS=1:
+    $ python -m benchmarks.first_sound_benchmark
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from timeit import default_timer
+
+# Number of processes started for each mode
+RUNS = 5
+MODES = ("cold", "warm")
+SOUND_NAME = "coin.wav"
+
+
+def measure_first_sound(mode: str) -> float:
+    """Plays the first sound of the process
+
+    Returns:
+        Seconds from asking for the sound to the player started
+    """
+    from arcade_game.arcade_platformer.asset.asset_manager import asset_manager
+    from arcade_game.arcade_platformer.config.config import ASSETS_PATH
+    from arcade_game.arcade_platformer.sound.audio_warmup import audio_warmup
+
+    if mode == "warm":
+        # The welcome screen shows long enough for the warm-up to finish
+        audio_warmup.start()
+        audio_warmup.wait()
+
+    start = default_timer()
+    sound = asset_manager.load_sound(ASSETS_PATH / "sounds" / SOUND_NAME)
+    player = sound.play()
+    duration = default_timer() - start
+    sound.stop(player)
+    return duration
+
+
+def run(mode: str) -> float:
+    """Measures the first sound in a new process"""
+    output = subprocess.run([sys.executable, "-m", "benchmarks.first_sound_benchmark", "--child", mode],
+                            check=True, capture_output=True, text=True).stdout
+    return float(output.split()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.child:
+        print(measure_first_sound(arguments.child))
+        raise SystemExit
+
+    print(f"{'mode':<6} {'median':>10} {'max':>10}")
+    for mode in MODES:
+        latencies = [run(mode) for _ in range(RUNS)]
+        print(f"{mode:<6} {statistics.median(latencies) * 1000:>7.2f} ms {max(latencies) * 1000:>7.2f} ms")
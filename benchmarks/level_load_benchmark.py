@@ -0,0 +1,51 @@
+"""
+Compares the load time of every level from its .tmx and from its compiled file
+
+Compile the levels first, then run from the root of the repository:
+    $ python -m arcade_game.arcade_platformer.level.level_compiler
+    $ python -m benchmarks.level_load_benchmark
+"""
+from timeit import default_timer
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import LEVEL_COUNT
+from arcade_game.arcade_platformer.level.compiled_level import read_compiled_level
+from arcade_game.arcade_platformer.level.level import build_level, get_compiled_map_path, parse_level_map
+
+LAYER_OPTIONS = {
+    "background": {"use_spatial_hash": False},
+    "coins": {"use_spatial_hash": True},
+}
+
+# Each measure is repeated, and the best one is kept
+REPEAT = 5
+
+
+def time_load(read_map, level_number: int):
+    """Returns the best read time and the best total (read + build) time"""
+    best_read = best_total = float("inf")
+    for _ in range(REPEAT):
+        # Forget the textures loaded by arcade, so each measure starts from the disk
+        arcade.load_texture.texture_cache.clear()
+
+        start = default_timer()
+        level_map = read_map(level_number)
+        read_done = default_timer()
+        build_level(level_number, level_map, LAYER_OPTIONS)
+        end = default_timer()
+
+        best_read = min(best_read, read_done - start)
+        best_total = min(best_total, end - start)
+    return best_read, best_total
+
+
+if __name__ == "__main__":
+    print(f"{'level':>5} {'.tmx read':>11} {'.tmx total':>12} {'compiled read':>15} {'compiled total':>16}")
+    for level_number in range(1, LEVEL_COUNT + 1):
+        tmx_read, tmx_total = time_load(parse_level_map, level_number)
+        compiled_read, compiled_total = time_load(
+            lambda number: read_compiled_level(get_compiled_map_path(number)), level_number
+        )
+        print(f"{level_number:>5} {tmx_read * 1000:>8.2f} ms {tmx_total * 1000:>9.1f} ms "
+              f"{compiled_read * 1000:>12.2f} ms {compiled_total * 1000:>13.1f} ms")
@@ -0,0 +1,52 @@
+"""
+Measures how long switching to a level takes on the main thread, with and without the prefetch
+
+Run from the root of the repository:
+    $ python -m benchmarks.level_transition_benchmark
+"""
+from concurrent.futures import ThreadPoolExecutor
+from timeit import default_timer
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import LEVEL_COUNT
+from arcade_game.arcade_platformer.level.level import build_level, load_level
+from arcade_game.arcade_platformer.level.level_prefetcher import LevelPrefetcher
+
+LAYER_OPTIONS = {
+    "background": {"use_spatial_hash": False},
+    "coins": {"use_spatial_hash": True},
+}
+
+
+def clear_texture_cache():
+    """Forget the textures loaded by arcade, so each measure starts from the disk"""
+    arcade.load_texture.texture_cache.clear()
+
+
+def time_without_prefetch(level_number: int) -> float:
+    clear_texture_cache()
+    start = default_timer()
+    load_level(level_number, LAYER_OPTIONS)
+    return default_timer() - start
+
+
+def time_with_prefetch(level_number: int, executor: ThreadPoolExecutor) -> float:
+    clear_texture_cache()
+    # The worker runs while the previous level is played, only the build is left on the main thread
+    tiled_map = executor.submit(LevelPrefetcher.prepare_level, level_number).result()
+    start = default_timer()
+    build_level(level_number, tiled_map, LAYER_OPTIONS)
+    return default_timer() - start
+
+
+if __name__ == "__main__":
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    print(f"{'level':>5} {'without prefetch':>18} {'with prefetch':>15}")
+    for level_number in range(2, LEVEL_COUNT + 1):
+        without_prefetch = time_without_prefetch(level_number)
+        with_prefetch = time_with_prefetch(level_number, executor)
+        print(f"{level_number:>5} {without_prefetch * 1000:>15.1f} ms {with_prefetch * 1000:>12.1f} ms")
+
+    executor.shutdown()
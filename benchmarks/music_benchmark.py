@@ -0,0 +1,50 @@
+"""
+Measures the memory and load time of the music, decoded in memory or streamed from the disk
+
+Loading the music is most of the sound work when a view is built: the welcome view opens intro.wav,
+the game view background.wav. Run from the root of the repository:
+    $ python -m benchmarks.music_benchmark
+"""
+import tracemalloc
+from timeit import default_timer
+from typing import Tuple
+
+import arcade
+
+from arcade_game.arcade_platformer.asset.music import find_music_file
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH
+
+MUSIC_FILES = ["intro.wav", "background.wav", "victory.wav"]
+# Number of loads for each measure
+RUNS = 5
+
+
+def measure_load(path, streaming: bool) -> Tuple[float, int]:
+    """Loads a sound
+
+    Returns:
+        The load time in seconds, and the bytes still allocated for the sound once loaded
+    """
+    tracemalloc.start()
+    start = default_timer()
+    sound = arcade.load_sound(path, streaming)
+    duration = default_timer() - start
+    resident, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sound
+    return duration, resident
+
+
+if __name__ == "__main__":
+    print(f"{'music':<16} {'mode':<9} {'load time':>10} {'resident':>10}")
+    for name in MUSIC_FILES:
+        path = find_music_file(ASSETS_PATH / "sounds" / name)
+        if not path.is_file():
+            print(f"{name:<16} missing")
+            continue
+        for streaming in (False, True):
+            results = [measure_load(path, streaming) for _ in range(RUNS)]
+            load_time = min(duration for duration, _ in results)
+            resident = max(resident for _, resident in results)
+            print(f"{path.name:<16} {'streamed' if streaming else 'decoded':<9} {load_time * 1000:>7.1f} ms "
+                  f"{resident / 1024:>7.0f} kB")
@@ -1,7 +1,9 @@
 """
 Blueface November 2023 - Hackathon Arcade Game
 """
+import argparse
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 import arcade  # This is the main library our arcade game is built with
@@ -9,11 +11,31 @@ import arcade  # This is the main library our arcade game is built with
 from arcade_game.arcade_platformer.config.config import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
 from arcade_game.arcade_platformer.player.player import Player
 from arcade_game.arcade_platformer.view import welcome_view
+from arcade_game.arcade_platformer.view import platform_view
+from arcade_game.arcade_platformer.engine.replay import Replay
 from arcade_game.arcade_platformer.helpers.speech_recognition import SpeechRecognition
 from log.config_log import logger
 
 if __name__ == "__main__":
 
+    parser = argparse.ArgumentParser(description="Hackathon Arcade Game")
+    parser.add_argument("--replay", type=Path, help="Plays back a recorded game, without voice commands")
+    parser.add_argument("--profile", action="store_true",
+                        help="Times the phases of every frame from the start of each game, F3 shows them")
+    arguments = parser.parse_args()
+    if arguments.profile:
+        platform_view.PlatformerView.profile_frames = True
+
+    if arguments.replay:
+        # No speech recognition needed, the commands come from the replay
+        window = arcade.Window(
+            width=SCREEN_WIDTH, height=SCREEN_HEIGHT, title=SCREEN_TITLE
+        )
+        replay_view = platform_view.PlatformerView(Player(), None, Replay.load(arguments.replay))
+        window.show_view(replay_view)
+        arcade.run()
+        raise SystemExit
+
     logger.info("Game started")
 
     # Load environment variables
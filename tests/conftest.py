@@ -0,0 +1,4 @@
+import pyglet
+
+# The tests need no display: arcade must be imported after this
+pyglet.options["headless"] = True
@@ -0,0 +1,69 @@
+import logging
+
+from arcade_game.arcade_platformer.asset.asset_manager import AssetManager
+from arcade_game.arcade_platformer.config.config import ASSETS_PATH
+from log.config_log import logger
+
+IMAGE = ASSETS_PATH / "images" / "items" / "gemYellow.png"
+
+
+def test_loading_again_shares_the_texture():
+    manager = AssetManager()
+
+    first = manager.load_texture(IMAGE)
+    second = manager.load_texture(IMAGE)
+    mirrored = manager.load_texture(IMAGE, flipped_horizontally=True)
+
+    assert second is first
+    assert mirrored is not first
+    stats = manager.get_stats()
+    assert (stats["hits"], stats["misses"], stats["resident_assets"]) == (1, 2, 2)
+
+
+def test_assets_in_use_are_never_dropped():
+    manager = AssetManager(memory_budget=0)
+
+    texture = manager.load_texture(IMAGE)
+    manager.load_texture(IMAGE)
+    assert manager.get_stats()["resident_assets"] == 1
+
+    # One reference left
+    manager.release(texture)
+    assert manager.get_stats()["resident_assets"] == 1
+    assert manager.evictions == 0
+
+    manager.release(texture)
+    assert manager.get_stats()["resident_assets"] == 0
+    assert manager.evictions == 1
+    assert manager.resident_bytes == 0
+
+
+def test_least_recently_used_assets_are_dropped_over_the_budget():
+    manager = AssetManager()
+    # The same image with other options takes the same room
+    plain = manager.load_texture(IMAGE)
+    mirrored = manager.load_texture(IMAGE, flipped_horizontally=True)
+    manager.memory_budget = 2 * plain.width * plain.height * 4
+    manager.release(plain, mirrored)
+    # Used again, the mirrored texture is now the least recently used
+    manager.release(manager.load_texture(IMAGE))
+
+    no_hit_box = manager.load_texture(IMAGE, hit_box_algorithm="None")
+
+    assert manager.evictions == 1
+    assert manager.load_texture(IMAGE) is plain
+    assert manager.load_texture(IMAGE, flipped_horizontally=True) is not mirrored
+    assert manager.resident_bytes == 3 * no_hit_box.width * no_hit_box.height * 4
+
+
+def test_releasing_an_unknown_asset_is_ignored(caplog):
+    manager = AssetManager(memory_budget=0)
+    texture = manager.load_texture(IMAGE)
+    other = AssetManager().load_texture(IMAGE, flipped_horizontally=True)
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        manager.release(other)
+
+    assert manager.get_stats()["referenced_assets"] == 1
+    assert manager.load_texture(IMAGE) is texture
+    assert "wasn't loaded by the asset manager" in caplog.text
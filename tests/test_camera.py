@@ -0,0 +1,65 @@
+import arcade
+import pytest
+
+from arcade_game.arcade_platformer.view.camera import Camera, WorldCamera
+
+
+@pytest.fixture(scope="module")
+def window():
+    window = arcade.Window(1024, 640, visible=False)
+    yield window
+    window.close()
+
+
+@pytest.fixture
+def projections(window, monkeypatch):
+    """The projections sent to OpenGL"""
+    sent = []
+    context_class = type(window.ctx)
+    projection_2d = context_class.projection_2d
+
+    def set_projection(ctx, value):
+        sent.append(value)
+        projection_2d.fset(ctx, value)
+
+    monkeypatch.setattr(context_class, "projection_2d", property(projection_2d.fget, set_projection))
+    # Start from a projection no camera uses
+    window.ctx.projection_2d = (-1, 1, -1, 1)
+    sent.clear()
+    return sent
+
+
+def test_projection_is_sent_only_when_it_changes(projections):
+    camera = Camera(1024, 640)
+
+    camera.use()
+    camera.use()
+    assert projections == [(0, 1024, 0, 640)]
+
+    camera.left = 100
+    camera.use()
+    camera.use()
+    assert projections == [(0, 1024, 0, 640), (100, 1124, 0, 640)]
+
+
+def test_cameras_at_the_same_place_share_the_projection(projections):
+    world_camera = WorldCamera(1024, 640)
+    gui_camera = Camera(1024, 640)
+
+    world_camera.use()
+    gui_camera.use()
+
+    assert projections == [(0, 1024, 0, 640)]
+
+
+def test_drawing_between_ticks_sends_whole_pixels_once(projections):
+    camera = WorldCamera(1024, 640)
+    camera.previous_position = (0, 0)
+    camera.left = 10
+
+    # Both frames are at the same pixel
+    assert camera.use_between(0.33) == (3, 1027, 0, 640)
+    assert camera.use_between(0.34) == (3, 1027, 0, 640)
+    assert camera.use_between(1.0) == (10, 1034, 0, 640)
+
+    assert projections == [(3, 1027, 0, 640), (10, 1034, 0, 640)]
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+import pytest
+
+from arcade_game.arcade_platformer.config.config import LEVEL_COUNT
+from arcade_game.arcade_platformer.engine.replay import Replay
+from arcade_game.arcade_platformer.helpers.phase_timer import PhaseTimer
+from benchmarks.benchmark_suite import CANNED_RUNS_PATH, play_canned_run
+
+CANNED_RUNS = sorted(CANNED_RUNS_PATH.glob("*.rpl"))
+
+
+@pytest.mark.parametrize("path", CANNED_RUNS, ids=[path.name for path in CANNED_RUNS])
+def test_canned_run_finishes_its_level(path: Path):
+    # Raises a ValueError when the run doesn't get to the end of the level it starts on
+    run = play_canned_run(path, PhaseTimer(), window=None)
+
+    assert run["finished_levels"] >= 1
+
+
+def test_every_level_has_a_canned_run():
+    assert {Replay.load(path).start_level for path in CANNED_RUNS} == set(range(1, LEVEL_COUNT + 1))
@@ -0,0 +1,96 @@
+import arcade
+import pytest
+import pytiled_parser
+
+from arcade_game.arcade_platformer.config.config import LEVEL_COUNT
+from arcade_game.arcade_platformer.engine.game_engine import LAYER_OPTIONS
+from arcade_game.arcade_platformer.level.compiled_level import ENEMY_SPAWN, read_compiled_level, \
+    write_compiled_level
+from arcade_game.arcade_platformer.level import level as level_module
+from arcade_game.arcade_platformer.level.level import Level, build_level, get_compiled_map_path, parse_level_map, \
+    read_level
+from arcade_game.arcade_platformer.level.level_compiler import compile_level
+
+LEVELS = range(1, LEVEL_COUNT + 1)
+
+
+def describe_sprite(sprite: arcade.Sprite) -> tuple:
+    """What the game uses of a sprite: where it is, its image, its hit box and its points"""
+    return (
+        round(sprite.center_x, 3), round(sprite.center_y, 3), round(sprite.width, 3), round(sprite.height, 3),
+        sprite.angle, sprite.texture.image.tobytes(),
+        tuple((round(x, 3), round(y, 3)) for x, y in sprite.get_adjusted_hit_box()),
+        sprite.properties.get("point_value") and int(sprite.properties["point_value"]),
+    )
+
+
+def assert_same_level(compiled: Level, parsed: Level) -> None:
+    assert (compiled.width, compiled.height, compiled.tile_width, compiled.tile_height) == \
+           (parsed.width, parsed.height, parsed.tile_width, parsed.tile_height)
+    assert compiled.background_color == parsed.background_color
+    assert compiled.enemy_spawns == parsed.enemy_spawns
+    assert compiled.sprite_lists.keys() == parsed.sprite_lists.keys()
+    for name, parsed_list in parsed.sprite_lists.items():
+        compiled_list = compiled.sprite_lists[name]
+        assert compiled_list.visible == parsed_list.visible, name
+        assert [describe_sprite(sprite) for sprite in compiled_list] == \
+               [describe_sprite(sprite) for sprite in parsed_list], name
+
+
+@pytest.mark.parametrize("level_number", LEVELS)
+def test_compiled_file_round_trip(level_number, tmp_path):
+    path = tmp_path / "level.lvl"
+    write_compiled_level(path, compile_level(level_number))
+
+    compiled = build_level(level_number, read_compiled_level(path), LAYER_OPTIONS)
+    parsed = build_level(level_number, parse_level_map(level_number), LAYER_OPTIONS)
+
+    assert_same_level(compiled, parsed)
+
+
+@pytest.mark.parametrize("level_number", LEVELS)
+def test_shipped_compiled_level_matches_its_map(level_number):
+    compiled_path = get_compiled_map_path(level_number)
+    if not compiled_path.exists():
+        # The compiled levels are build output, a fresh clone doesn't have them
+        pytest.skip(f"{compiled_path.name} is not compiled, run level_compiler.py")
+    compiled_level = read_compiled_level(compiled_path)
+    assert compiled_level.is_up_to_date(compiled_path), "compile the levels again with level_compiler.py"
+
+    compiled = build_level(level_number, compiled_level, LAYER_OPTIONS)
+    parsed = build_level(level_number, parse_level_map(level_number), LAYER_OPTIONS)
+
+    assert_same_level(compiled, parsed)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "level.lvl"
+    path.write_bytes(b"not a level" * 10)
+
+    with pytest.raises(ValueError):
+        read_compiled_level(path)
+
+
+@pytest.mark.parametrize("kept", [0.05, 0.5, 0.95])
+def test_rejects_truncated_files(kept, tmp_path):
+    path = tmp_path / "level.lvl"
+    write_compiled_level(path, compile_level(2))
+    data = path.read_bytes()
+    path.write_bytes(data[:int(len(data) * kept)])
+
+    with pytest.raises(ValueError):
+        read_compiled_level(path)
+
+    # Cut right before the last enemy spawn: every slice still decodes, only shorter
+    path.write_bytes(data[:-ENEMY_SPAWN.size])
+    with pytest.raises(ValueError):
+        read_compiled_level(path)
+
+
+def test_truncated_file_falls_back_to_the_map(tmp_path, monkeypatch):
+    path = tmp_path / "level.lvl"
+    write_compiled_level(path, compile_level(1))
+    path.write_bytes(path.read_bytes()[:-100])
+    monkeypatch.setattr(level_module, "get_compiled_map_path", lambda level_number: path)
+
+    assert isinstance(read_level(1), pytiled_parser.TiledMap)
@@ -0,0 +1,58 @@
+import random
+from typing import List
+
+import arcade
+
+from arcade_game.arcade_platformer.engine.game_engine import LAYER_OPTIONS
+from arcade_game.arcade_platformer.enemy.enemy_manager import EnemyManager
+from arcade_game.arcade_platformer.enemy.enemy_patrol import compute_patrol_bounds
+from arcade_game.arcade_platformer.enemy.enemy_pool import enemy_pool
+from arcade_game.arcade_platformer.enemy.enemy_spawn import EnemySpawn
+from arcade_game.arcade_platformer.level.level import Level, load_level
+from arcade_game.arcade_platformer.player.player import Player
+
+# Enemies added to the level, the shipped maps have few
+ENEMY_COUNT = 40
+UPDATE_COUNT = 120
+# Places tried for the player after each update
+PROBE_COUNT = 40
+
+
+def create_spawns(level: Level, count: int) -> List[EnemySpawn]:
+    """The enemies of the level, and more walking on its ground at different speeds"""
+    spawns = list(level.enemy_spawns)
+    sprite_name = spawns[0].sprite_name
+    for tile in random.sample(list(level.walls), count):
+        spawns.append(EnemySpawn(sprite_name, tile.center_x, tile.top + 64, random.choice((1.0, 3.0, 5.0)),
+                                 random.choice((0.0, 200.0))))
+    return spawns
+
+
+def test_same_collisions_as_arcade():
+    random.seed(0)
+    level = load_level(2, LAYER_OPTIONS)
+    spawns = create_spawns(level, ENEMY_COUNT)
+    enemies = arcade.SpriteList()
+    enemy_pool.spawn_enemies(spawns, enemies)
+    patrol_bounds = compute_patrol_bounds(spawns, level.get_tile_grid("ground"), level.width, level.height)
+    enemy_manager = EnemyManager(enemies, patrol_bounds)
+    player_sprite = Player().sprite
+
+    collisions = 0
+    for _ in range(UPDATE_COUNT):
+        # Every enemy is on the screen, so every sprite is up to date
+        enemy_manager.update(-10 ** 6, 10 ** 6)
+        for enemy in random.sample(list(enemies), PROBE_COUNT // 2):
+            # Next to an enemy, and anywhere in the level
+            for position in ((enemy.center_x + random.uniform(-150, 150), enemy.center_y + random.uniform(-150, 150)),
+                             (random.uniform(0, level.map_width), random.uniform(0, 1000))):
+                player_sprite.position = position
+                expected = arcade.check_for_collision_with_list(player_sprite, enemies)
+                found = enemy_manager.check_for_collision(player_sprite)
+                assert {id(enemy) for enemy in found} == {id(enemy) for enemy in expected}, position
+                collisions += len(found)
+
+    # Back to the pool, for the next tests
+    enemy_pool.spawn_enemies([], enemies)
+    # The player did run into enemies
+    assert collisions > 0
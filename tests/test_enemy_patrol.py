@@ -0,0 +1,71 @@
+import arcade
+import pytest
+
+from arcade_game.arcade_platformer.engine.game_engine import LAYER_OPTIONS
+from arcade_game.arcade_platformer.enemy.enemy import load_enemy_textures
+from arcade_game.arcade_platformer.enemy.enemy_patrol import compute_patrol_bounds
+from arcade_game.arcade_platformer.enemy.enemy_spawn import EnemySpawn
+from arcade_game.arcade_platformer.level.level import load_level
+from arcade_game.arcade_platformer.level.tile_grid import TileGrid
+
+TILE_SIZE = 128
+COLUMNS = 10
+ROWS = 4
+
+
+def create_wall_grid(cells) -> TileGrid:
+    walls = arcade.SpriteList()
+    for column, row in cells:
+        wall = arcade.SpriteSolidColor(TILE_SIZE, TILE_SIZE, arcade.color.BROWN)
+        wall.left = column * TILE_SIZE
+        wall.bottom = row * TILE_SIZE
+        walls.append(wall)
+    return TileGrid(walls, TILE_SIZE, TILE_SIZE)
+
+
+def get_hit_box_extent():
+    """The left, right and bottom of the asteroid hit box, relative to its center"""
+    hit_box = load_enemy_textures("asteroid").stand_left[0].hit_box_points
+    return min(x for x, _ in hit_box), max(x for x, _ in hit_box), min(y for _, y in hit_box)
+
+
+def test_level_2_asteroid_walks_its_platform():
+    level = load_level(2, LAYER_OPTIONS)
+
+    bounds = compute_patrol_bounds(level.enemy_spawns, level.get_tile_grid("ground"), level.width, level.height)
+
+    assert level.enemy_spawns == [EnemySpawn("asteroid", 965.0, 320.0, 3.0, 0.0)]
+    assert bounds.tolist() == [[832.0, 1216.0]]
+
+
+def test_walker_turns_at_walls_and_ledges():
+    left, right, bottom = get_hit_box_extent()
+    # A floor with a hole in column 2 and a wall on it in column 8
+    wall_grid = create_wall_grid([(column, 0) for column in range(COLUMNS) if column != 2] + [(8, 1)])
+    spawn = EnemySpawn("asteroid", 5.5 * TILE_SIZE, TILE_SIZE - bottom, 3.0, 0.0)
+
+    bounds = compute_patrol_bounds([spawn], wall_grid, COLUMNS, ROWS)
+
+    assert bounds.tolist() == [[3 * TILE_SIZE - left, 8 * TILE_SIZE - right]]
+
+
+def test_flyer_ignores_ledges_and_stops_at_the_sides_of_the_map():
+    left, right, bottom = get_hit_box_extent()
+    wall_grid = create_wall_grid([(5, 0)])
+    # In the air above the row of the only wall
+    spawn = EnemySpawn("asteroid", 5.5 * TILE_SIZE, 2 * TILE_SIZE - bottom, 3.0, 0.0)
+
+    bounds = compute_patrol_bounds([spawn], wall_grid, COLUMNS, ROWS)
+
+    assert bounds.tolist() == [[-left, COLUMNS * TILE_SIZE - right]]
+
+
+@pytest.mark.parametrize("patrol_distance", [100.0, 200.0])
+def test_patrol_distance_limits_the_walk(patrol_distance):
+    _, _, bottom = get_hit_box_extent()
+    wall_grid = create_wall_grid([(column, 0) for column in range(COLUMNS)])
+    spawn = EnemySpawn("asteroid", 5.5 * TILE_SIZE, TILE_SIZE - bottom, 3.0, patrol_distance)
+
+    bounds = compute_patrol_bounds([spawn], wall_grid, COLUMNS, ROWS)
+
+    assert bounds.tolist() == [[spawn.center_x - patrol_distance, spawn.center_x + patrol_distance]]
@@ -0,0 +1,46 @@
+import pytest
+
+from arcade_game.arcade_platformer.helpers.fixed_timestep import FixedTimestep
+
+
+def test_frames_at_the_tick_rate_run_one_tick_each():
+    timestep = FixedTimestep(tick_rate=60, max_ticks_per_update=5)
+
+    assert [timestep.advance(1 / 60) for _ in range(600)] == [1] * 600
+    assert timestep.tick_count == 600
+
+
+def test_time_left_over_is_kept_for_the_next_frames():
+    timestep = FixedTimestep(tick_rate=60, max_ticks_per_update=5)
+
+    # Frames at 144 Hz: most run no tick, and 144 frames make one second
+    ticks = [timestep.advance(1 / 144) for _ in range(144)]
+
+    assert set(ticks) == {0, 1}
+    assert sum(ticks) == 60
+    assert timestep.alpha == pytest.approx(0.0, abs=1e-6)
+
+
+def test_alpha_is_how_far_between_two_ticks():
+    timestep = FixedTimestep(tick_rate=60, max_ticks_per_update=5)
+
+    assert timestep.advance(1.5 / 60) == 1
+    assert timestep.alpha == pytest.approx(0.5)
+
+
+def test_long_hitch_is_dropped_beyond_the_most_ticks():
+    timestep = FixedTimestep(tick_rate=60, max_ticks_per_update=5)
+
+    assert timestep.advance(1.0) == 5
+    assert timestep.alpha == 0.0
+    assert timestep.advance(1 / 60) == 1
+
+
+def test_reset_forgets_the_time_left_over():
+    timestep = FixedTimestep(tick_rate=60, max_ticks_per_update=5)
+    timestep.advance(0.9 / 60)
+
+    timestep.reset()
+
+    assert timestep.alpha == 0.0
+    assert timestep.advance(0.5 / 60) == 0
@@ -0,0 +1,100 @@
+import pyglet
+import pytest
+
+from arcade_game.arcade_platformer.config.config import FRAME_RATE
+from arcade_game.arcade_platformer.helpers import idle_throttle as idle_throttle_module
+from arcade_game.arcade_platformer.helpers.idle_throttle import IdleThrottle, redraw_windows_now, set_draw_rate
+
+
+class FakeWindow:
+    def __init__(self) -> None:
+        self.update_rates = []
+
+    def set_update_rate(self, rate: float) -> None:
+        self.update_rates.append(rate)
+
+
+def redraw_windows(delta_time: float) -> None:
+    """Stands for the function pyglet.app.run() schedules"""
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """What is scheduled on the pyglet clock, without running it"""
+    calls = []
+    monkeypatch.setattr(pyglet.clock, "schedule_once", lambda function, delay: calls.append(("once", function)))
+    monkeypatch.setattr(pyglet.clock, "schedule_interval",
+                        lambda function, interval: calls.append(("interval", function, interval)))
+    monkeypatch.setattr(pyglet.clock, "unschedule", lambda function: calls.append(("unschedule", function)))
+    return calls
+
+
+@pytest.fixture
+def redraw_hook(monkeypatch):
+    monkeypatch.setattr(idle_throttle_module, "get_redraw_windows", lambda: redraw_windows)
+
+
+@pytest.fixture
+def no_redraw_hook(monkeypatch):
+    monkeypatch.setattr(idle_throttle_module, "get_redraw_windows", lambda: None)
+
+
+def test_pyglet_has_the_redraw_hook():
+    # The draw rate can only slow down with it, check it is still there after upgrading pyglet
+    assert idle_throttle_module.get_redraw_windows() is not None
+
+
+def test_draw_rate_reschedules_the_redraw(clock, redraw_hook):
+    assert set_draw_rate(0.5)
+    assert clock == [("unschedule", redraw_windows), ("interval", redraw_windows, 0.5)]
+
+
+def test_draw_rate_is_left_alone_without_the_hook(clock, no_redraw_hook):
+    assert not set_draw_rate(0.5)
+    assert clock == []
+
+
+def test_idle_rates_apply_until_stopped(clock, redraw_hook):
+    window = FakeWindow()
+    throttle = IdleThrottle(idle_update_rate=0.2, idle_draw_rate=0.5)
+
+    throttle.start(window)
+    # Slowed down on the first tick of the clock
+    assert clock == [("once", throttle.slow_down)]
+    throttle.slow_down(0)
+    assert throttle.draw_rate_slowed
+    assert ("interval", redraw_windows, 0.5) in clock
+
+    throttle.stop()
+    assert window.update_rates == [0.2, FRAME_RATE]
+    assert clock[-1] == ("interval", redraw_windows, FRAME_RATE)
+    assert not throttle.draw_rate_slowed
+
+
+def test_change_is_drawn_once_at_once(clock, redraw_hook):
+    throttle = IdleThrottle()
+    throttle.start(FakeWindow())
+    throttle.slow_down(0)
+    clock.clear()
+
+    throttle.request_redraw()
+    throttle.request_redraw()
+
+    # The second request replaces the first one
+    assert clock == [("unschedule", redraw_windows_now), ("once", redraw_windows_now)] * 2
+
+
+def test_change_waits_for_the_next_frame_at_the_usual_rate(clock, no_redraw_hook):
+    window = FakeWindow()
+    throttle = IdleThrottle(idle_update_rate=0.2)
+    throttle.start(window)
+    throttle.slow_down(0)
+    clock.clear()
+
+    throttle.request_redraw()
+    throttle.stop()
+
+    # Only the updates were slowed down
+    assert window.update_rates == [0.2, FRAME_RATE]
+    assert ("once", redraw_windows_now) not in clock
+    assert not any(call[0] == "interval" for call in clock)
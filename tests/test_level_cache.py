@@ -0,0 +1,55 @@
+import pytest
+
+from arcade_game.arcade_platformer.level import level_cache as level_cache_module
+from arcade_game.arcade_platformer.level.level_cache import LevelCache
+
+LAYER_OPTIONS = {"ground": {"use_spatial_hash": True}}
+
+
+@pytest.fixture
+def loaded_levels(monkeypatch):
+    """The levels read from the disk by the cache, without reading them"""
+    loaded = []
+
+    def load_level(level_number, layer_options):
+        loaded.append(level_number)
+        return f"level {level_number}"
+
+    monkeypatch.setattr(level_cache_module, "load_level", load_level)
+    return loaded
+
+
+def test_loads_a_level_once(loaded_levels):
+    cache = LevelCache(max_size=3)
+
+    assert cache.get(1, LAYER_OPTIONS) == "level 1"
+    assert cache.get(1, LAYER_OPTIONS) == "level 1"
+
+    assert loaded_levels == [1]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_drops_the_least_recently_used_level(loaded_levels):
+    cache = LevelCache(max_size=2)
+    cache.get(1, LAYER_OPTIONS)
+    cache.get(2, LAYER_OPTIONS)
+    # Level 1 was used last, level 2 goes when level 3 comes
+    cache.get(1, LAYER_OPTIONS)
+    cache.get(3, LAYER_OPTIONS)
+
+    assert len(cache) == 2
+    assert cache.contains(1, LAYER_OPTIONS)
+    assert not cache.contains(2, LAYER_OPTIONS)
+    assert cache.contains(3, LAYER_OPTIONS)
+
+    cache.get(2, LAYER_OPTIONS)
+    assert loaded_levels == [1, 2, 3, 2]
+
+
+def test_layer_options_are_part_of_the_key(loaded_levels):
+    cache = LevelCache(max_size=3)
+    cache.get(1, {"ground": {"use_spatial_hash": True}, "coins": {"use_spatial_hash": False}})
+
+    # The same options in another order
+    assert cache.contains(1, {"coins": {"use_spatial_hash": False}, "ground": {"use_spatial_hash": True}})
+    assert not cache.contains(1, {"ground": {"use_spatial_hash": False}})
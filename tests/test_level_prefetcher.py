@@ -0,0 +1,83 @@
+import pytest
+
+from arcade_game.arcade_platformer.config.config import LEVEL_COUNT
+from arcade_game.arcade_platformer.level import level_cache as level_cache_module
+from arcade_game.arcade_platformer.level import level_prefetcher as level_prefetcher_module
+from arcade_game.arcade_platformer.level.level_cache import LevelCache
+from arcade_game.arcade_platformer.level.level_prefetcher import LevelPrefetcher
+
+LAYER_OPTIONS = {"ground": {"use_spatial_hash": True}}
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """What the cache and the prefetcher would read and build, without touching the maps"""
+    calls = []
+
+    def load_level(level_number, layer_options):
+        calls.append(("load", level_number))
+        return f"loaded level {level_number}"
+
+    def read_level(level_number):
+        calls.append(("read", level_number))
+        return f"map {level_number}"
+
+    def build_level(level_number, level_map, layer_options):
+        calls.append(("build", level_number))
+        return f"built from {level_map}"
+
+    monkeypatch.setattr(level_cache_module, "load_level", load_level)
+    monkeypatch.setattr(level_prefetcher_module, "read_level", read_level)
+    monkeypatch.setattr(level_prefetcher_module, "preload_level_textures", lambda level_map: None)
+    monkeypatch.setattr(level_prefetcher_module, "build_level", build_level)
+    return calls
+
+
+def test_prefetched_level_is_built_from_the_map_read_in_the_background(calls):
+    cache = LevelCache()
+    prefetcher = LevelPrefetcher(cache)
+
+    prefetcher.prefetch(2, LAYER_OPTIONS)
+    assert prefetcher.is_prefetched(2)
+    level = prefetcher.get(2, LAYER_OPTIONS)
+
+    assert level == "built from map 2"
+    assert calls == [("read", 2), ("build", 2)]
+    assert not prefetcher.is_prefetched(2)
+    # Kept for the next time the level is played
+    assert prefetcher.get(2, LAYER_OPTIONS) == level
+    assert cache.hits == 1
+
+
+def test_level_not_prefetched_is_loaded_by_the_cache(calls):
+    prefetcher = LevelPrefetcher(LevelCache())
+
+    assert prefetcher.get(1, LAYER_OPTIONS) == "loaded level 1"
+    assert calls == [("load", 1)]
+
+
+def test_cached_and_missing_levels_are_not_prefetched(calls):
+    cache = LevelCache()
+    prefetcher = LevelPrefetcher(cache)
+    cache.get(1, LAYER_OPTIONS)
+
+    prefetcher.prefetch(1, LAYER_OPTIONS)
+    # After the last level
+    prefetcher.prefetch(LEVEL_COUNT + 1, LAYER_OPTIONS)
+
+    assert not prefetcher.is_prefetched(1)
+    assert not prefetcher.is_prefetched(LEVEL_COUNT + 1)
+    assert calls == [("load", 1)]
+
+
+def test_failed_prefetch_loads_the_level_again(calls, monkeypatch):
+    def read_level(level_number):
+        raise OSError("the map can't be read")
+
+    monkeypatch.setattr(level_prefetcher_module, "read_level", read_level)
+    prefetcher = LevelPrefetcher(LevelCache())
+
+    prefetcher.prefetch(3, LAYER_OPTIONS)
+
+    assert prefetcher.get(3, LAYER_OPTIONS) == "loaded level 3"
+    assert calls == [("load", 3)]
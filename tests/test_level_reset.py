@@ -0,0 +1,53 @@
+import math
+
+import arcade
+
+from arcade_game.arcade_platformer.config.config import CHUNK_WIDTH
+from arcade_game.arcade_platformer.engine.game_engine import LAYER_OPTIONS, GameEvent
+from arcade_game.arcade_platformer.engine.headless import create_engine
+from arcade_game.arcade_platformer.level.level import load_level
+
+
+def count_in_chunks(level, coin: arcade.Sprite) -> int:
+    """How many times the coin is in the columns of the chunked coins layer"""
+    chunked_coins = level.get_chunked_layer("coins")
+    return sum(list(chunk).count(coin) for chunk in chunked_coins.chunks.values())
+
+
+def test_reset_puts_a_coin_back_once_per_column():
+    level = load_level(1, LAYER_OPTIONS)
+    chunked_coins = level.get_chunked_layer("coins")
+    coin = level.coins[0]
+
+    coin.remove_from_sprite_lists()
+    assert coin not in level.coins
+    assert count_in_chunks(level, coin) == 0
+
+    level.reset()
+    # A second reset finds every coin in place, it adds none
+    level.reset()
+
+    assert list(level.coins).count(coin) == 1
+    assert list(chunked_coins.chunks[math.floor(coin.center_x / CHUNK_WIDTH)]).count(coin) == 1
+    assert count_in_chunks(level, coin) == 1
+    assert len(level.coins) == len(level.all_coins)
+
+
+def test_respawn_puts_back_the_coins_picked_up():
+    engine = create_engine(1)
+    level = engine.current_level
+    level.get_chunked_layer("coins")
+    coin = level.coins[0]
+
+    # Drop the player on the coin
+    engine.player_sprite.position = coin.position
+    state = engine.step()
+    assert GameEvent.COIN in state.events
+    assert count_in_chunks(level, coin) == 0
+
+    engine.respawn()
+    engine.respawn()
+
+    assert list(level.coins).count(coin) == 1
+    assert count_in_chunks(level, coin) == 1
+    assert all(count_in_chunks(level, other) == 1 for other in level.all_coins)
@@ -0,0 +1,88 @@
+import pytest
+
+from arcade_game.arcade_platformer.engine.game_engine import Command
+from arcade_game.arcade_platformer.engine.replay import COMMAND_INDEXES, HEADER, Replay, delete_old_replays
+
+
+def test_round_trip():
+    replay = Replay(start_level=3, tick_count=5000, script={
+        1: [Command.RIGHT],
+        2: [Command.JUMP, Command.UP],
+        17: [Command.STOP_CLIMBING],
+        4000: [Command.LEFT, Command.STOP, Command.STOP_WALKING, Command.DOWN],
+    })
+
+    loaded = Replay.from_bytes(replay.to_bytes())
+
+    assert loaded.start_level == 3
+    assert loaded.tick_count == 5000
+    assert loaded.script == replay.script
+
+
+def test_command_right_after_the_previous_one_takes_one_byte():
+    replay = Replay(tick_count=16, script={15: [Command.JUMP]})
+
+    data = replay.to_bytes()
+
+    assert data[HEADER.size:] == bytes([(15 << 3) | COMMAND_INDEXES[Command.JUMP]])
+
+
+@pytest.mark.parametrize("delta_tick, encoded", [
+    # 7 bits per byte, least significant first, the high bit tells another byte follows
+    (16, [0x80 | ((16 << 3) & 0x7F), (16 << 3) >> 7]),
+    (2 ** 11, [0x80, 0x80, 0x01]),
+])
+def test_varint_spans_several_bytes(delta_tick, encoded):
+    replay = Replay(tick_count=delta_tick, script={delta_tick: [Command.RIGHT]})
+    encoded[0] |= COMMAND_INDEXES[Command.RIGHT]
+
+    data = replay.to_bytes()
+
+    assert list(data[HEADER.size:]) == encoded
+    assert Replay.from_bytes(data).script == replay.script
+
+
+def test_commands_of_the_same_tick_keep_their_order():
+    replay = Replay(tick_count=1, script={1: [Command.STOP, Command.LEFT, Command.JUMP]})
+
+    assert Replay.from_bytes(replay.to_bytes()).script == {1: [Command.STOP, Command.LEFT, Command.JUMP]}
+
+
+def test_record_keeps_only_the_ticks_with_commands():
+    replay = Replay()
+    replay.record(1, [Command.RIGHT])
+    replay.record(2, [])
+    replay.record(3, [Command.JUMP])
+    replay.record(4, ())
+
+    assert replay.tick_count == 4
+    assert replay.script == {1: [Command.RIGHT], 3: [Command.JUMP]}
+
+
+def test_save_and_load(tmp_path):
+    replay = Replay(start_level=2, tick_count=10, script={5: [Command.DOWN]})
+
+    path = replay.save(tmp_path / "run.rpl")
+    loaded = Replay.load(path)
+
+    assert (loaded.start_level, loaded.tick_count, loaded.script) == (2, 10, {5: [Command.DOWN]})
+
+
+@pytest.mark.parametrize("data", [
+    b"XXXX" + Replay().to_bytes()[4:],
+    HEADER.pack(b"PRPL", 99, 1, 0),
+])
+def test_rejects_other_files(data):
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data)
+
+
+def test_only_the_last_recordings_are_kept(tmp_path):
+    names = [f"run_20240101_1200{second:02}.rpl" for second in range(5)]
+    for name in names:
+        (tmp_path / name).write_bytes(Replay().to_bytes())
+    (tmp_path / "canned.rpl").write_bytes(Replay().to_bytes())
+
+    delete_old_replays(tmp_path, 2)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["canned.rpl"] + names[-2:]
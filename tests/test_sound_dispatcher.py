@@ -0,0 +1,136 @@
+from arcade_game.arcade_platformer.sound.sound_dispatcher import SoundDispatcher, SoundPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSound:
+    """Stands for an arcade.Sound, records the players started and stopped"""
+    def __init__(self, name: str, length: float = 1.0) -> None:
+        self.name = name
+        self.length = length
+        self.started = []
+        self.stopped = []
+
+    def play(self, volume: float = 1.0) -> str:
+        player = f"{self.name}#{len(self.started)}"
+        self.started.append(player)
+        return player
+
+    def stop(self, player: str) -> None:
+        self.stopped.append(player)
+
+    def get_length(self) -> float:
+        return self.length
+
+
+def create_dispatcher(max_voices: int = 8):
+    clock = FakeClock()
+    return SoundDispatcher(max_voices, clock), clock
+
+
+def play_at(dispatcher: SoundDispatcher, clock: FakeClock, now: float, *sounds: FakeSound) -> None:
+    """Plays the sounds in a frame at a given time"""
+    clock.now = now
+    for sound in sounds:
+        dispatcher.play(sound)
+    dispatcher.flush()
+
+
+def test_same_sound_in_a_frame_plays_once():
+    dispatcher, clock = create_dispatcher()
+    coin = FakeSound("coin")
+
+    play_at(dispatcher, clock, 0.0, coin, coin, coin)
+
+    assert coin.started == ["coin#0"]
+    assert dispatcher.collapsed == 2
+
+
+def test_polyphony_limit_cuts_the_oldest_copy():
+    dispatcher, clock = create_dispatcher()
+    coin = FakeSound("coin", length=1.0)
+    dispatcher.register(coin, SoundPolicy(polyphony=2))
+
+    for now in (0.0, 0.1, 0.2):
+        play_at(dispatcher, clock, now, coin)
+
+    assert coin.started == ["coin#0", "coin#1", "coin#2"]
+    assert coin.stopped == ["coin#0"]
+    assert [voice.player for voice in dispatcher.voices] == ["coin#1", "coin#2"]
+
+
+def test_finished_copies_leave_room():
+    dispatcher, clock = create_dispatcher()
+    coin = FakeSound("coin", length=0.5)
+    dispatcher.register(coin, SoundPolicy(polyphony=1))
+
+    play_at(dispatcher, clock, 0.0, coin)
+    play_at(dispatcher, clock, 1.0, coin)
+
+    assert coin.stopped == []
+    assert dispatcher.stolen == 0
+
+
+def test_full_channels_steal_the_oldest_voice_of_the_lowest_priority():
+    dispatcher, clock = create_dispatcher(max_voices=3)
+    low_old, low_new, high = FakeSound("low_old", 10), FakeSound("low_new", 10), FakeSound("high", 10)
+    dispatcher.register(low_old, SoundPolicy(priority=0))
+    dispatcher.register(low_new, SoundPolicy(priority=0))
+    dispatcher.register(high, SoundPolicy(priority=2))
+    play_at(dispatcher, clock, 0.0, high)
+    play_at(dispatcher, clock, 0.1, low_old)
+    play_at(dispatcher, clock, 0.2, low_new)
+
+    new = FakeSound("new", 10)
+    dispatcher.register(new, SoundPolicy(priority=1))
+    play_at(dispatcher, clock, 0.3, new)
+
+    assert low_old.stopped == ["low_old#0"]
+    assert low_new.stopped == [] and high.stopped == []
+    assert [voice.sound.name for voice in dispatcher.voices] == ["high", "low_new", "new"]
+    assert dispatcher.stolen == 1
+
+
+def test_sound_of_a_lower_priority_is_dropped_when_the_channels_are_full():
+    dispatcher, clock = create_dispatcher(max_voices=1)
+    jingle, step = FakeSound("jingle", 10), FakeSound("step", 1)
+    dispatcher.register(jingle, SoundPolicy(priority=3))
+    dispatcher.register(step, SoundPolicy(priority=0))
+    play_at(dispatcher, clock, 0.0, jingle)
+
+    play_at(dispatcher, clock, 0.5, step)
+
+    assert step.started == []
+    assert jingle.stopped == []
+    assert dispatcher.dropped == 1
+
+
+def test_higher_priorities_get_the_free_channels_first():
+    dispatcher, clock = create_dispatcher(max_voices=1)
+    step, death = FakeSound("step"), FakeSound("death")
+    dispatcher.register(step, SoundPolicy(priority=0))
+    dispatcher.register(death, SoundPolicy(priority=5))
+
+    play_at(dispatcher, clock, 0.0, step, death)
+
+    assert death.started == ["death#0"]
+    assert step.started == []
+
+
+def test_requests_within_the_minimum_interval_are_dropped():
+    dispatcher, clock = create_dispatcher()
+    jump = FakeSound("jump", length=0.1)
+    dispatcher.register(jump, SoundPolicy(polyphony=4, min_interval=0.25))
+
+    for now in (0.0, 0.1, 0.2, 0.25, 0.3):
+        play_at(dispatcher, clock, now, jump)
+
+    # Started at 0.0 and 0.25, the interval counts from the last start
+    assert jump.started == ["jump#0", "jump#1"]
+    assert dispatcher.throttled == 3
@@ -0,0 +1,56 @@
+import random
+
+import arcade
+import pytest
+
+from arcade_game.arcade_platformer.config.config import LEVEL_COUNT, MAP_SCALING
+from arcade_game.arcade_platformer.engine.game_engine import LAYER_OPTIONS
+from arcade_game.arcade_platformer.level.level import load_level
+from arcade_game.arcade_platformer.level.tile_grid import TileGrid
+from arcade_game.arcade_platformer.player.player import Player
+
+# Places tried for the player in each level
+PROBE_COUNT = 1500
+
+
+@pytest.fixture(scope="module")
+def player_sprite() -> arcade.Sprite:
+    return Player().sprite
+
+
+@pytest.mark.parametrize("level_number", range(1, LEVEL_COUNT + 1))
+@pytest.mark.parametrize("layer_name", ["ground", "traps", "goal"])
+def test_same_collisions_as_arcade(level_number, layer_name, player_sprite):
+    level = load_level(level_number, LAYER_OPTIONS)
+    layer = level.sprite_lists.get(layer_name)
+    if layer is None:
+        pytest.skip(f"Level {level_number} has no {layer_name}")
+    tile_grid = level.get_tile_grid(layer_name)
+
+    # Everywhere in the map and a bit around it, and right on the tiles, edges included
+    random.seed(level_number)
+    positions = [(random.uniform(-200, level.map_width + 200), random.uniform(-200, level.height * level.tile_height * MAP_SCALING + 200))
+                 for _ in range(PROBE_COUNT)]
+    positions += [(tile.center_x + dx, tile.center_y + dy) for tile in layer
+                  for dx in (-tile.width, -tile.width / 2, 0, tile.width / 2) for dy in (-tile.height / 2, 0)]
+
+    for position in positions:
+        player_sprite.position = position
+        expected = arcade.check_for_collision_with_list(player_sprite, layer)
+        found = tile_grid.check_for_collision(player_sprite)
+        assert {id(tile) for tile in found} == {id(tile) for tile in expected}, position
+        assert len(found) == len(expected), position
+
+
+def test_sprites_in_box_have_no_duplicates():
+    texture = arcade.Texture.create_filled("tile", (64, 64), arcade.color.WHITE)
+    sprite_list = arcade.SpriteList()
+    # Larger than a cell, it covers four cells
+    large_tile = arcade.Sprite(texture=texture, scale=2.0, center_x=64, center_y=64)
+    small_tile = arcade.Sprite(texture=texture, center_x=160, center_y=32)
+    sprite_list.extend([large_tile, small_tile])
+
+    tile_grid = TileGrid(sprite_list, 64, 64)
+
+    assert tile_grid.get_sprites_in_box(0, 0, 191, 127) == [large_tile, small_tile]
+    assert tile_grid.get_sprites_in_box(300, 300, 400, 400) == []
@@ -0,0 +1,39 @@
+from arcade_game.arcade_platformer.helpers.transition import Transition, TransitionState
+
+
+def test_runs_for_its_duration_then_calls_its_end_action_once():
+    ended = []
+    transition = Transition()
+    transition.start(TransitionState.DYING, 1.0, lambda: ended.append(transition.state))
+
+    transition.update(0.4)
+    assert transition.active
+    assert transition.progress == 0.4
+    assert not ended
+
+    transition.update(0.6)
+    assert not transition.active
+    # The game is back to PLAYING when the end action runs
+    assert ended == [TransitionState.PLAYING]
+
+    transition.update(1.0)
+    assert ended == [TransitionState.PLAYING]
+
+
+def test_end_action_can_start_the_next_transition():
+    transition = Transition()
+    transition.start(TransitionState.LEVEL_CLEAR, 0.5,
+                     lambda: transition.start(TransitionState.COUNTDOWN, 2.0))
+
+    transition.update(0.5)
+
+    assert transition.state == TransitionState.COUNTDOWN
+    assert transition.progress == 0.0
+
+
+def test_not_active_while_playing():
+    transition = Transition()
+
+    assert transition.state == TransitionState.PLAYING
+    assert not transition.active
+    assert transition.progress == 1.0